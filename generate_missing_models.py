@@ -1,66 +1,134 @@
-﻿import re, pathlib
+"""Generate EF Core entity classes for tables that have no hand-written model.
+
+The schema is read from ``YASGMP.sql`` with the streaming tokenizer in
+``scripts/sql_dump.py``; only ``CREATE TABLE`` statements are parsed, so
+INSERT payloads in full production dumps never have to fit in memory.
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import pathlib
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+
+root = pathlib.Path(__file__).resolve().parent
+sys.path.insert(0, str(root / 'scripts'))
+
+from file_watch import make_watcher  # noqa: E402
+from profiling import Profiler, default_report_path, maybe_cprofile  # noqa: E402
+from sql_dump import TableSchema, load_schema, load_schema_cached, normalize_type, table_hash  # noqa: E402,F401
 
-root = pathlib.Path('.')
 sql_path = root / 'YASGMP.sql'
 tables_path = root / 'tables_without_models.txt'
 output_dir = root / 'Models' / 'Generated'
-output_dir.mkdir(parents=True, exist_ok=True)
-
-sql_text = sql_path.read_text(encoding='utf-8', errors='ignore')
-
-def normalize_type(sql_type: str):
-    t = sql_type.lower()
-    precision = None
-    max_length = None
-    clr_type = 'string'
-    if '(' in t:
-        base, rest = t.split('(', 1)
-        rest = rest.split(')', 1)[0]
-        if ',' in rest:
-            try:
-                precision = tuple(int(x.strip()) for x in rest.split(','))
-            except ValueError:
-                precision = None
-        else:
-            try:
-                max_length = int(rest.strip())
-            except ValueError:
-                max_length = None
-        t = base
-    if t.strip().startswith('unsigned'):
-        t = t.strip().split(' ', 1)[1]
-    if 'tinyint(1' in sql_type.lower():
-        clr_type = 'bool'
-    elif 'bigint' in t:
-        clr_type = 'long'
-    elif t.startswith('int'):
-        clr_type = 'int'
-    elif t.startswith('smallint'):
-        clr_type = 'short'
-    elif t.startswith(('decimal', 'numeric')):
-        clr_type = 'decimal'
-    elif t.startswith('double'):
-        clr_type = 'double'
-    elif t.startswith('float'):
-        clr_type = 'double'
-    elif t.startswith(('datetime', 'timestamp', 'date')):
-        clr_type = 'DateTime'
-    elif t.startswith('time'):
-        clr_type = 'TimeSpan'
-    elif 'blob' in t or 'binary' in t:
-        clr_type = 'byte[]'
-    else:
-        clr_type = 'string'
-    return clr_type, max_length, precision
 
-def is_nullable(definition: str):
-    return 'not null' not in definition.lower()
+MANIFEST_NAME = '.manifest.json'
+MANIFEST_VERSION = 2
+CONFIGURATIONS_DIR = 'Configurations'
+MATERIALIZERS_DIR = 'Materializers'
+REGISTRY_NAME = 'GeneratedModelConfiguration.cs'
 
-create_pattern = re.compile(r'CREATE TABLE `(.*?)` \((.*?)\)\s*ENGINE', re.S)
-column_pattern = re.compile(r'`(?P<name>\w+)`\s+(?P<type>[^,\n]+?)(?:,|$)', re.I)
-primary_pattern = re.compile(r'PRIMARY KEY \((.*?)\)')
+# Replaced by an enabled profiler under --profile.
+profiler = Profiler('generate_missing_models', enabled=False)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sql', type=pathlib.Path, default=sql_path, help='MySQL dump to read the schema from.')
+    parser.add_argument(
+        '--tables',
+        type=pathlib.Path,
+        default=tables_path,
+        help='Text file listing the tables to generate, one per line.',
+    )
+    parser.add_argument(
+        '--output-dir',
+        type=pathlib.Path,
+        default=output_dir,
+        help='Directory receiving the generated entity classes.',
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Re-render every table even when the manifest says it is up to date.',
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Parse the SQL dump directly instead of using the parsed-schema cache.',
+    )
+    parser.add_argument(
+        '--all-tables',
+        action='store_true',
+        help='Generate every table in the dump instead of those listed in --tables.',
+    )
+    parser.add_argument(
+        '--schema-diff',
+        type=pathlib.Path,
+        metavar='PATH',
+        help='Only re-render the tables a scripts/schema_diff.py report lists under "regenerate"; '
+             'every other table keeps its manifest entry.',
+    )
+    parser.add_argument(
+        '--column-stats',
+        type=pathlib.Path,
+        metavar='PATH',
+        help='Apply the suggestions of a scripts/column_stats.py report: [MaxLength] for unsized strings, '
+             'non-nullable columns that never hold NULL and index-candidate remarks.',
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Render tables in N worker processes (0 = one per CPU).',
+    )
+    parser.add_argument(
+        '--ef-config',
+        action='store_true',
+        help='Also emit IEntityTypeConfiguration<T> classes and a registry under Configurations/.',
+    )
+    parser.add_argument(
+        '--materializers',
+        action='store_true',
+        help='Also emit DbDataReader row materializers under Materializers/.',
+    )
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='Keep running and regenerate affected models whenever --sql or --tables changes.',
+    )
+    parser.add_argument('--poll', action='store_true', help='With --watch, poll file stats instead of using inotify.')
+    parser.add_argument(
+        '--debounce',
+        type=float,
+        default=0.1,
+        metavar='SECONDS',
+        help='With --watch, wait for writes to settle this long before regenerating (default: 0.1).',
+    )
+    parser.add_argument(
+        '--profile',
+        type=pathlib.Path,
+        nargs='?',
+        const=default_report_path('generate_missing_models'),
+        metavar='PATH',
+        help='Write per-phase wall/CPU time, peak memory and counts as JSON '
+             '(default: .cache/profile/generate_missing_models.json).',
+    )
+    parser.add_argument(
+        '--profile-memory',
+        action='store_true',
+        help='With --profile, also trace per-phase peak Python allocations (slows the run down).',
+    )
+    parser.add_argument('--cprofile', type=pathlib.Path, metavar='PATH', help='Also dump cProfile stats to PATH.')
+    return parser.parse_args()
 
-create_map = {table: body for table, body in create_pattern.findall(sql_text)}
 
 def pascal_case(name: str) -> str:
     parts = re.split(r'[^A-Za-z0-9]+', name)
@@ -72,27 +140,103 @@ def pascal_case(name: str) -> str:
         candidate = '_' + candidate
     return candidate
 
-missing_tables = [line.strip() for line in tables_path.read_text(encoding='utf-8').splitlines() if line.strip()]
 
-for table in missing_tables:
-    body = create_map.get(table)
-    if not body:
-        print(f"Warning: table {table} not found in SQL dump")
-        continue
+def read_table_list(path: pathlib.Path):
+    return [line.strip() for line in path.read_text(encoding='utf-8').splitlines() if line.strip()]
+
+
+def read_column_hints(path: pathlib.Path):
+    """``{table: suggestions}`` from a ``scripts/column_stats.py`` report."""
+    try:
+        tables = json.loads(path.read_text(encoding='utf-8'))['tables']
+        return {table: entry['suggestions'] for table, entry in tables.items() if entry.get('suggestions')}
+    except (KeyError, TypeError, AttributeError) as exc:
+        raise ValueError(f"{path} is not a column statistics report ({exc!r})") from None
+
+
+def apply_column_hints(table: TableSchema, hints) -> TableSchema:
+    """Tighten ``table`` with profiled max lengths and never-NULL columns.
+
+    Index suggestions are not applied here; they only add remarks to the
+    entity, since the database does not have those indexes.
+    """
+    max_length = hints.get('max_length', {})
+    required = set(hints.get('required', ()))
     columns = []
-    primary_cols = []
-    for raw_line in body.split('\n'):
-        line_strip = raw_line.strip()
-        pk_match = primary_pattern.search(line_strip)
-        if pk_match:
-            pk_cols = [col.strip('` ') for col in pk_match.group(1).split(',')]
-            primary_cols.extend(pk_cols)
-        col_match = column_pattern.match(line_strip)
-        if col_match:
-            columns.append((col_match.group('name'), col_match.group('type'), line_strip))
-
-    class_name = pascal_case(table)
-    file_path = output_dir / f"{class_name}.cs"
+    for column in table.columns:
+        if column.name in max_length and column.clr_type == 'string' and not column.max_length:
+            column = replace(column, max_length=max_length[column.name])
+        if column.name in required:
+            column = replace(column, nullable=False)
+        columns.append(column)
+    return replace(table, columns=tuple(columns))
+
+
+def read_schema_diff(path: pathlib.Path):
+    """Tables a ``scripts/schema_diff.py`` report marks for regeneration."""
+    try:
+        return set(json.loads(path.read_text(encoding='utf-8'))['regenerate'])
+    except (KeyError, TypeError) as exc:
+        raise ValueError(f"{path} is not a schema diff report ({exc!r})") from None
+
+
+def csharp_string(value: str) -> str:
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+DELETE_BEHAVIORS = {
+    'CASCADE': 'Cascade',
+    'SET NULL': 'SetNull',
+    'RESTRICT': 'Restrict',
+    'NO ACTION': 'NoAction',
+    'SET DEFAULT': 'NoAction',
+}
+
+
+def emitted_indexes(table: TableSchema):
+    """Indexes EF Core can express: plain and unique ones over known columns."""
+    known = {column.name for column in table.columns}
+    return [index for index in table.indexes
+            if index.kind in ('index', 'unique') and index.columns and set(index.columns) <= known]
+
+
+def navigation_links(table: TableSchema, principals):
+    """Return ``[(foreign key, navigation name, principal class)]`` for ``table``.
+
+    ``principals`` maps generated table names to their primary keys; only
+    foreign keys that target such a table's primary key get a navigation,
+    since anything else cannot be expressed against the generated classes.
+    """
+    known = {column.name for column in table.columns}
+    taken = {pascal_case(column.name) for column in table.columns} | {pascal_case(table.name)}
+    links = []
+    for fk in table.foreign_keys:
+        principal_key = principals.get(fk.ref_table)
+        if not principal_key or tuple(principal_key) != fk.ref_columns or not set(fk.columns) <= known:
+            continue
+        base = re.sub(r'_?id$', '', fk.columns[0], flags=re.I)
+        name = pascal_case(base) if base else pascal_case(fk.ref_table)
+        if name in taken:
+            name += 'Navigation'
+        taken.add(name)
+        links.append((fk, name, pascal_case(fk.ref_table)))
+    return links
+
+
+def render_entity(table: TableSchema, principals=None, index_candidates=()):
+    """Return ``(class_name, file_content)`` for the entity mapping ``table``.
+
+    ``principals`` (generated table name -> primary key) enables navigation
+    properties for foreign keys between generated tables.
+    ``index_candidates`` (from ``--column-stats``) maps columns that would
+    benefit from an index to their measured selectivity.
+    """
+    index_candidates = dict(index_candidates)
+    columns = table.columns
+    primary_cols = table.primary_key
+    class_name = pascal_case(table.name)
+    indexes = emitted_indexes(table)
+    links = navigation_links(table, principals or {})
 
     usings = {
         'System',
@@ -100,21 +244,32 @@ for table in missing_tables:
         'System.ComponentModel.DataAnnotations.Schema'
     }
 
-    if any(col[1].lower().startswith(('decimal', 'numeric')) for col in columns):
+    if any(col.sql_type.lower().startswith(('decimal', 'numeric')) for col in columns):
+        usings.add('Microsoft.EntityFrameworkCore')
+    if indexes or len(primary_cols) > 1:
         usings.add('Microsoft.EntityFrameworkCore')
 
     class_lines = []
     class_lines.append("    /// <summary>")
-    class_lines.append(f"    /// Hyper-robust entity mapping for the `{table}` table, engineered for extreme enterprise/GxP analytics.")
+    class_lines.append(f"    /// Hyper-robust entity mapping for the `{table.name}` table, engineered for extreme enterprise/GxP analytics.")
     class_lines.append(f"    /// <para>Generated {class_name} ensures every column is surfaced for audits, AI, and compliance reporting.</para>")
     class_lines.append("    /// </summary>")
-    class_lines.append(f"    [Table(\"{table}\")]")
+    class_lines.append(f"    [Table(\"{table.name}\")]")
+    if len(primary_cols) > 1:
+        class_lines.append(f"    [PrimaryKey({', '.join(f'nameof({pascal_case(col)})' for col in primary_cols)})]")
+    for index in indexes:
+        arguments = [f"nameof({pascal_case(col)})" for col in index.columns]
+        arguments.append(f"Name = {csharp_string(index.name)}")
+        if index.unique:
+            arguments.append('IsUnique = true')
+        class_lines.append(f"    [Index({', '.join(arguments)})]")
     class_lines.append(f"    public class {class_name}")
     class_lines.append("    {")
 
-    for col_name, type_def, raw_line in columns:
-        clr_type, max_len, precision = normalize_type(type_def)
-        nullable = is_nullable(raw_line)
+    for column in columns:
+        col_name = column.name
+        clr_type, max_len, precision = column.clr_type, column.max_length, column.precision
+        nullable = column.nullable
         is_pk = col_name in primary_cols and len(primary_cols) == 1
 
         attributes = [f"[Column(\"{col_name}\")]" ]
@@ -148,17 +303,627 @@ for table in missing_tables:
 
         friendly_name = ' '.join(word.capitalize() for word in col_name.split('_')) or 'Value'
         class_lines.append("        /// <summary>")
-        class_lines.append(f"        /// Column `{col_name}` ({type_def.strip()}) providing {friendly_name} fidelity.")
+        class_lines.append(f"        /// Column `{col_name}` ({column.definition}) providing {friendly_name} fidelity.")
         class_lines.append("        /// </summary>")
+        if col_name in index_candidates:
+            class_lines.append(
+                f"        /// <remarks>Index candidate: {index_candidates[col_name]:.1%} distinct values "
+                "in the profiled data and no key covers this column.</remarks>"
+            )
         for attr in attributes:
             class_lines.append(f"        {attr}")
         property_name = pascal_case(col_name)
         class_lines.append(f"        public {property_type} {property_name} {{ get; set; }}{default_suffix}")
         class_lines.append("")
 
+    for fk, navigation, principal in links:
+        key_properties = ', '.join(pascal_case(col) for col in fk.columns)
+        class_lines.append("        /// <summary>")
+        class_lines.append(
+            f"        /// Navigation to `{fk.ref_table}` through `{fk.name}` "
+            f"({', '.join(fk.columns)} -> {', '.join(fk.ref_columns)})."
+        )
+        class_lines.append("        /// </summary>")
+        class_lines.append(f"        [ForeignKey({csharp_string(key_properties)})]")
+        class_lines.append(f"        public virtual {principal}? {navigation} {{ get; set; }}")
+        class_lines.append("")
+
     class_lines.append("    }")
 
     file_content = '\n'.join(f"using {u};" for u in sorted(usings)) + '\n\nnamespace YasGMP.Models.Generated\n{\n' + '\n'.join(class_lines) + '\n}\n'
+    return class_name, file_content
+
+
+def lambda_members(properties) -> str:
+    if len(properties) == 1:
+        return f"e => e.{properties[0]}"
+    return f"e => new {{ {', '.join('e.' + p for p in properties)} }}"
+
+
+def render_configuration(table: TableSchema, principals=None):
+    """Return ``(class_name, file_content)`` for the fluent configuration of ``table``."""
+    entity_name = pascal_case(table.name)
+    class_name = f"{entity_name}Configuration"
+    key_properties = [pascal_case(col) for col in table.primary_key if table.column(col)]
+
+    body = []
+    body.append(f"            builder.ToTable({csharp_string(table.name)});")
+    if len(key_properties) == 1:
+        body.append(f"            builder.HasKey(e => e.{key_properties[0]});")
+    elif key_properties:
+        body.append(f"            builder.HasKey(e => new {{ {', '.join('e.' + p for p in key_properties)} }});")
+    else:
+        body.append("            builder.HasNoKey();")
+
+    for column in table.columns:
+        chain = [
+            f"            builder.Property(e => e.{pascal_case(column.name)})",
+            f"                .HasColumnName({csharp_string(column.name)})",
+            f"                .HasColumnType({csharp_string(column.sql_type)})",
+        ]
+        if column.clr_type == 'string' and column.max_length:
+            chain.append(f"                .HasMaxLength({column.max_length})")
+        if column.clr_type == 'decimal' and column.precision and len(column.precision) == 2:
+            chain.append(f"                .HasPrecision({column.precision[0]}, {column.precision[1]})")
+        if not column.nullable and column.clr_type in {'string', 'byte[]'}:
+            chain.append("                .IsRequired()")
+        if 'auto_increment' in column.definition.lower():
+            chain.append("                .ValueGeneratedOnAdd()")
+        chain[-1] += ';'
+        body.append('')
+        body.extend(chain)
+
+    for index in emitted_indexes(table):
+        properties = [pascal_case(col) for col in index.columns]
+        chain = f"            builder.HasIndex({lambda_members(properties)}, {csharp_string(index.name)})"
+        body.append('')
+        body.append(chain + ('\n                .IsUnique();' if index.unique else ';'))
+
+    for fk, navigation, _principal in navigation_links(table, principals or {}):
+        properties = [pascal_case(col) for col in fk.columns]
+        behavior = DELETE_BEHAVIORS.get(fk.on_delete or 'NO ACTION', 'NoAction')
+        body.append('')
+        body.append(f"            builder.HasOne(e => e.{navigation})")
+        body.append("                .WithMany()")
+        body.append(f"                .HasForeignKey({lambda_members(properties)})")
+        body.append(f"                .HasConstraintName({csharp_string(fk.name)})")
+        body.append(f"                .OnDelete(DeleteBehavior.{behavior});")
+
+    lines = [
+        "using Microsoft.EntityFrameworkCore;",
+        "using Microsoft.EntityFrameworkCore.Metadata.Builders;",
+        "",
+        "namespace YasGMP.Models.Generated.Configurations",
+        "{",
+        "    /// <summary>",
+        f"    /// Fluent EF Core mapping for <see cref=\"{entity_name}\"/> (`{table.name}`), generated from the SQL dump.",
+        "    /// </summary>",
+        f"    public sealed class {class_name} : IEntityTypeConfiguration<{entity_name}>",
+        "    {",
+        "        /// <inheritdoc />",
+        f"        public void Configure(EntityTypeBuilder<{entity_name}> builder)",
+        "        {",
+        *body,
+        "        }",
+        "    }",
+        "}",
+    ]
+    return class_name, '\n'.join(lines) + '\n'
+
+
+def render_configuration_registry(class_names) -> str:
+    """Render the extension that applies every generated configuration explicitly."""
+    calls = [f"            modelBuilder.ApplyConfiguration(new {name}());" for name in sorted(class_names)]
+    lines = [
+        "using Microsoft.EntityFrameworkCore;",
+        "",
+        "namespace YasGMP.Models.Generated.Configurations",
+        "{",
+        "    /// <summary>",
+        "    /// Registers the generated fluent configurations without reflection-based assembly scanning.",
+        "    /// </summary>",
+        "    public static class GeneratedModelConfiguration",
+        "    {",
+        "        /// <summary>",
+        "        /// Applies every generated configuration. Call from <c>OnModelCreating</c>; the resulting model is also",
+        "        /// the input for <c>dotnet ef dbcontext optimize</c> when building a compiled model.",
+        "        /// </summary>",
+        "        public static ModelBuilder ApplyGeneratedConfigurations(this ModelBuilder modelBuilder)",
+        "        {",
+        *calls,
+        "            return modelBuilder;",
+        "        }",
+        "    }",
+        "}",
+    ]
+    return '\n'.join(lines) + '\n'
+
+
+READER_GETTERS = {
+    'int': 'reader.GetInt32({ordinal})',
+    'long': 'reader.GetInt64({ordinal})',
+    'short': 'reader.GetInt16({ordinal})',
+    'double': 'reader.GetDouble({ordinal})',
+    'decimal': 'reader.GetDecimal({ordinal})',
+    'DateTime': 'reader.GetDateTime({ordinal})',
+    'TimeSpan': 'reader.GetFieldValue<TimeSpan>({ordinal})',
+    'bool': 'reader.GetBoolean({ordinal})',
+    'string': 'reader.GetString({ordinal})',
+    'byte[]': 'reader.GetFieldValue<byte[]>({ordinal})',
+}
+# Unsigned integers are mapped to the signed CLR type of the same width, but
+# MySqlConnector refuses GetInt32() & co. for values above the signed range;
+# read the unsigned value and let a checked cast report a real overflow.
+UNSIGNED_READER_GETTERS = {
+    'int': 'checked((int)reader.GetFieldValue<uint>({ordinal}))',
+    'long': 'checked((long)reader.GetFieldValue<ulong>({ordinal}))',
+    'short': 'checked((short)reader.GetFieldValue<ushort>({ordinal}))',
+}
+
+# normalize_type() also maps tinyint(n>1), mediumint, year, bit(n>1), ... to
+# string; the provider returns numbers for those, which GetString() rejects.
+TEXT_SQL_TYPES = ('char', 'varchar', 'tinytext', 'text', 'mediumtext', 'longtext', 'enum', 'set', 'json')
+CONVERTED_STRING_GETTER = 'Convert.ToString(reader.GetValue({ordinal}), CultureInfo.InvariantCulture) ?? string.Empty'
+
+
+def reader_getter(column):
+    sql_type = column.sql_type.lower()
+    if 'unsigned' in sql_type and column.clr_type in UNSIGNED_READER_GETTERS:
+        return UNSIGNED_READER_GETTERS[column.clr_type]
+    if column.clr_type == 'string' and sql_type.split('(', 1)[0].split(' ', 1)[0] not in TEXT_SQL_TYPES:
+        return CONVERTED_STRING_GETTER
+    return READER_GETTERS.get(column.clr_type, CONVERTED_STRING_GETTER)
+
+
+def render_materializer(table: TableSchema):
+    """Return ``(class_name, file_content)`` for the ``DbDataReader`` materializer of ``table``.
+
+    Ordinals are resolved once per result set; each row then costs only the
+    entity instance and its string/byte[] values.
+    """
+    entity_name = pascal_case(table.name)
+    class_name = f"{entity_name}Materializer"
+    fields = [(column, '_' + pascal_case(column.name)[0].lower() + pascal_case(column.name)[1:])
+              for column in table.columns]
+
+    lines = [
+        "using System;",
+        "using System.Collections.Generic;",
+        "using System.Data.Common;",
+        "using System.Globalization;",
+        "using System.Runtime.CompilerServices;",
+        "using System.Threading;",
+        "using System.Threading.Tasks;",
+        "",
+        "namespace YasGMP.Models.Generated.Materializers",
+        "{",
+        "    /// <summary>",
+        f"    /// Reads <see cref=\"{entity_name}\"/> rows (`{table.name}`) straight from a <see cref=\"DbDataReader\"/>,",
+        "    /// bypassing EF Core change tracking for bulk reporting and export reads.",
+        "    /// </summary>",
+        f"    public sealed class {class_name}",
+        "    {",
+    ]
+    for column, field in fields:
+        lines.append(f"        private readonly int {field};")
+    lines.extend([
+        "",
+        "        /// <summary>",
+        "        /// Resolves the column ordinals of <paramref name=\"reader\"/> once; columns missing from the",
+        "        /// result set are left at their default values.",
+        "        /// </summary>",
+        f"        public {class_name}(DbDataReader reader)",
+        "        {",
+    ])
+    for column, field in fields:
+        lines.append(f"            {field} = Ordinal(reader, {csharp_string(column.name)});")
+    lines.extend([
+        "        }",
+        "",
+        "        /// <summary>",
+        f"        /// Materializes the current row of <paramref name=\"reader\"/> into a new <see cref=\"{entity_name}\"/>.",
+        "        /// </summary>",
+        f"        public {entity_name} Read(DbDataReader reader)",
+        "        {",
+        f"            var entity = new {entity_name}();",
+    ])
+    for column, field in fields:
+        getter = reader_getter(column).format(ordinal=field)
+        target = f"entity.{pascal_case(column.name)}"
+        if column.nullable:
+            lines.append(f"            if ({field} >= 0 && !reader.IsDBNull({field})) {target} = {getter};")
+        else:
+            lines.append(f"            if ({field} >= 0) {target} = {getter};")
+    lines.extend([
+        "            return entity;",
+        "        }",
+        "",
+        "        /// <summary>",
+        "        /// Reads every remaining row of <paramref name=\"reader\"/>.",
+        "        /// </summary>",
+        f"        public static List<{entity_name}> ReadAll(DbDataReader reader)",
+        "        {",
+        f"            var materializer = new {class_name}(reader);",
+        f"            var rows = new List<{entity_name}>();",
+        "            while (reader.Read())",
+        "            {",
+        "                rows.Add(materializer.Read(reader));",
+        "            }",
+        "            return rows;",
+        "        }",
+        "",
+        "        /// <summary>",
+        "        /// Streams the remaining rows of <paramref name=\"reader\"/> without buffering them.",
+        "        /// </summary>",
+        f"        public static async IAsyncEnumerable<{entity_name}> StreamAsync(",
+        "            DbDataReader reader,",
+        "            [EnumeratorCancellation] CancellationToken cancellationToken = default)",
+        "        {",
+        f"            var materializer = new {class_name}(reader);",
+        "            while (await reader.ReadAsync(cancellationToken).ConfigureAwait(false))",
+        "            {",
+        "                yield return materializer.Read(reader);",
+        "            }",
+        "        }",
+        "",
+        "        private static int Ordinal(DbDataReader reader, string name)",
+        "        {",
+        "            for (var i = 0; i < reader.FieldCount; i++)",
+        "            {",
+        "                if (string.Equals(reader.GetName(i), name, StringComparison.OrdinalIgnoreCase))",
+        "                {",
+        "                    return i;",
+        "                }",
+        "            }",
+        "            return -1;",
+        "        }",
+        "    }",
+        "}",
+    ])
+    return class_name, '\n'.join(lines) + '\n'
+
+
+@dataclass(frozen=True)
+class RenderOptions:
+    """Optional output stages; part of the manifest fingerprint."""
+
+    ef_config: bool = False
+    materializers: bool = False
+
+
+def render_outputs(table: TableSchema, options: RenderOptions, principals=None, hints=None):
+    """Return ``[(kind, relative path, content)]`` for every file ``table`` produces."""
+    # Materializers keep the declared nullability, so their NULL guards survive
+    # a value the profiled data never showed.
+    tightened = apply_column_hints(table, hints) if hints else table
+    index_candidates = {entry['column']: entry['selectivity'] for entry in (hints or {}).get('indexes', ())}
+    class_name, content = render_entity(tightened, principals, index_candidates)
+    outputs = [('model', f"{class_name}.cs", content)]
+    if options.ef_config:
+        config_name, config = render_configuration(tightened, principals)
+        outputs.append(('configuration', f"{CONFIGURATIONS_DIR}/{config_name}.cs", config))
+    if options.materializers:
+        materializer_name, materializer = render_materializer(table)
+        outputs.append(('materializer', f"{MATERIALIZERS_DIR}/{materializer_name}.cs", materializer))
+    return outputs
+
+
+def sha256_text(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def generator_fingerprint(options: RenderOptions = RenderOptions()) -> str:
+    """Hash of the code and options that decide what a table renders to.
+
+    Any change to the templates, the ``normalize_type`` mapping or the enabled
+    output stages changes the fingerprint and invalidates every manifest entry.
+    """
+    digest = hashlib.sha256()
+    for source in (pathlib.Path(__file__).resolve(), root / 'scripts' / 'sql_dump.py'):
+        digest.update(source.read_bytes())
+    digest.update(repr(options).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def load_manifest(path: pathlib.Path, fingerprint: str):
+    """Return ``(table entries, shared files)`` from the manifest.
+
+    Missing or unreadable manifests yield empty maps.  A manifest written by
+    a different generator fingerprint keeps only the file hashes, so orphans
+    can still be cleaned up while every table is re-rendered.
+    """
+    try:
+        data = json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}, {}
+    if not isinstance(data, dict) or data.get('version') != MANIFEST_VERSION:
+        return {}, {}
+    tables = data.get('tables')
+    shared = data.get('shared')
+    if not isinstance(tables, dict) or not isinstance(shared, dict):
+        return {}, {}
+    if data.get('generator') != fingerprint:
+        tables = {table: {'files': entry.get('files', {})} for table, entry in tables.items() if isinstance(entry, dict)}
+    return tables, shared
+
+
+def write_manifest(path: pathlib.Path, fingerprint: str, tables, shared) -> None:
+    payload = {
+        'version': MANIFEST_VERSION,
+        'generator': fingerprint,
+        'tables': {table: tables[table] for table in sorted(tables)},
+        'shared': {name: shared[name] for name in sorted(shared)},
+    }
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_text(json.dumps(payload, indent=2) + '\n', encoding='utf-8')
+    os.replace(tmp_path, path)
+
+
+def is_up_to_date(entry, schema_hash: str, output: pathlib.Path) -> bool:
+    if not entry or entry.get('schema') != schema_hash or not entry.get('files'):
+        return False
+    for name, recorded in entry['files'].items():
+        try:
+            stat = (output / name).stat()
+        except OSError:
+            return False
+        if recorded.get('size') != stat.st_size or recorded.get('mtime_ns') != stat.st_mtime_ns:
+            return False
+    return True
+
+
+def write_if_changed(file_path: pathlib.Path, content: str) -> bool:
+    """Write ``content`` unless the file already holds it; return True when written."""
+    encoded = content.encode('utf-8')
+    try:
+        if file_path.read_bytes() == encoded:
+            return False
+    except OSError:
+        pass
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_bytes(encoded)
+    return True
+
+
+def remove_file_if_generated(file_path: pathlib.Path, content_hash) -> bool:
+    """Delete ``file_path`` if it still holds the generated content."""
+    try:
+        content = file_path.read_bytes()
+    except OSError:
+        return False
+    if hashlib.sha256(content).hexdigest() != content_hash:
+        print(f"Warning: keeping {file_path}; it was edited after generation")
+        return False
+    file_path.unlink()
+    return True
+
+
+def remove_orphans(output: pathlib.Path, previous, current) -> int:
+    """Delete generated files that no current table produces any more."""
+    live_files = {name for entry in current.values() for name in entry['files']}
+    removed = 0
+    for table in sorted(previous):
+        for name, recorded in sorted(previous[table].get('files', {}).items()):
+            if name in live_files:
+                continue
+            file_path = output / name
+            if remove_file_if_generated(file_path, recorded.get('content')):
+                removed += 1
+                print(f"Removed orphaned output for {table} -> {file_path}")
+    return removed
+
+
+def render_table(job):
+    """Render and write one table; runs in worker processes under ``--jobs``."""
+    schema, output, schema_hash, options, principals, hints = job
+    wall, cpu = time.perf_counter(), time.process_time()
+    outputs = render_outputs(schema, options, principals, hints)
+    timings = {'render_s': time.perf_counter() - wall, 'render_cpu_s': time.process_time() - cpu}
+    wall, cpu = time.perf_counter(), time.process_time()
+    files = {}
+    written = []
+    for kind, name, content in outputs:
+        file_path = output / name
+        if write_if_changed(file_path, content):
+            written.append((kind, file_path))
+        stat = file_path.stat()
+        files[name] = {'content': sha256_text(content), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+    timings['write_s'] = time.perf_counter() - wall
+    timings['write_cpu_s'] = time.process_time() - cpu
+    return schema.name, written, {'schema': schema_hash, 'files': files}, timings
+
+
+def sync_shared_files(output: pathlib.Path, schemas, options: RenderOptions, previous_shared):
+    """Write files derived from the whole table set and drop ones no longer produced."""
+    shared = {}
+    if options.ef_config:
+        name = f"{CONFIGURATIONS_DIR}/{REGISTRY_NAME}"
+        content = render_configuration_registry(f"{pascal_case(schema.name)}Configuration" for schema in schemas)
+        if write_if_changed(output / name, content):
+            print(f"Generated configuration registry -> {output / name}")
+        shared[name] = sha256_text(content)
+    for name, content_hash in sorted(previous_shared.items()):
+        if name not in shared and remove_file_if_generated(output / name, content_hash):
+            print(f"Removed orphaned output -> {output / name}")
+    return shared
+
+
+def remove_empty_stage_dirs(output: pathlib.Path) -> None:
+    """Drop the optional stages' directories once orphan cleanup has emptied them."""
+    for name in (CONFIGURATIONS_DIR, MATERIALIZERS_DIR):
+        directory = output / name
+        if directory.is_dir() and not any(directory.iterdir()):
+            directory.rmdir()
+            print(f"Removed empty directory {directory}")
+
+
+def select_tables(create_map, table_names):
+    """Return the schemas to generate, warning about names missing from the dump."""
+    if table_names is None:
+        return list(create_map.values())
+    selected = []
+    for table in table_names:
+        schema = create_map.get(table)
+        if not schema:
+            print(f"Warning: table {table} not found in SQL dump")
+            continue
+        selected.append(schema)
+    return selected
+
+
+def generate(schemas, output: pathlib.Path, previous, force: bool = False, jobs: int = 1,
+             options: RenderOptions = RenderOptions(), only=None, column_hints=None):
+    """Bring ``output`` up to date for ``schemas``.
+
+    Returns ``(manifest entries, generated count, unchanged count)``.  Tables
+    are rendered in a process pool when ``jobs`` > 1; results are consumed in
+    input order so the log and the written bytes match a serial run.  When
+    ``only`` is given, tables outside it that were generated before keep
+    their manifest entries without being checked.  ``column_hints`` maps
+    tables to ``--column-stats`` suggestions.
+    """
+    current = {}
+    pending = []
+    unchanged = 0
+    generated_keys = {schema.name: schema.primary_key for schema in schemas}
+    with profiler.phase('plan', count=len(schemas)):
+        for schema in schemas:
+            # Navigations depend on which referenced tables are generated too.
+            principals = {fk.ref_table: generated_keys[fk.ref_table]
+                          for fk in schema.foreign_keys if fk.ref_table in generated_keys}
+            entry = previous.get(schema.name)
+            if only is not None and schema.name not in only and entry:
+                current[schema.name] = entry
+                unchanged += 1
+                continue
+            hints = (column_hints or {}).get(schema.name)
+            # The parsed structure, as schema_diff.py compares it: a new AUTO_INCREMENT
+            # counter in the DDL is not a change.
+            schema_hash = sha256_text(table_hash(schema) + json.dumps(sorted(principals.items()))
+                                      + (json.dumps(hints, sort_keys=True) if hints else ''))
+            if not force and is_up_to_date(entry, schema_hash, output):
+                current[schema.name] = entry
+                unchanged += 1
+                continue
+            pending.append((schema, output, schema_hash, options, principals, hints))
+    profiler.count('tables_skipped_unchanged', unchanged)
+
+    if jobs > 1 and len(pending) > 1:
+        chunksize = max(1, len(pending) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(render_table, pending, chunksize=chunksize))
+    else:
+        results = map(render_table, pending)
+
+    generated = 0
+    for table, written, entry, timings in results:
+        if written:
+            generated += 1
+        else:
+            unchanged += 1
+        for kind, file_path in written:
+            print(f"Generated {kind} for {table} -> {file_path}")
+        current[table] = entry
+        profiler.add('render', timings['render_s'], timings['render_cpu_s'], count=1)
+        profiler.add('write', timings['write_s'], timings['write_cpu_s'], count=len(entry['files']))
+        profiler.count('files_written', len(written))
+        profiler.detail('tables', table, {key: round(value, 6) for key, value in timings.items()})
+    profiler.count('tables_rendered', len(pending))
+    return current, generated, unchanged
+
+
+def render_options(args: argparse.Namespace) -> RenderOptions:
+    return RenderOptions(ef_config=args.ef_config, materializers=args.materializers)
+
+
+def load_dump(args: argparse.Namespace):
+    with profiler.phase('load_schema'):
+        create_map = load_schema(args.sql) if args.no_cache else load_schema_cached(args.sql)
+    profiler.count('dump_bytes', args.sql.stat().st_size)
+    profiler.count('tables_in_dump', len(create_map))
+    return create_map
+
+
+def run(args: argparse.Namespace, create_map, fingerprint: str) -> None:
+    """Generate, clean up orphans and update the manifest for one pass."""
+    jobs = args.jobs or os.cpu_count() or 1
+    options = render_options(args)
+    manifest_path = args.output_dir / MANIFEST_NAME
+    with profiler.phase('read_manifest'):
+        previous, previous_shared = load_manifest(manifest_path, fingerprint)
+
+    table_names = None if args.all_tables else read_table_list(args.tables)
+    schemas = select_tables(create_map, table_names)
+
+    only = read_schema_diff(args.schema_diff) if args.schema_diff else None
+    column_hints = read_column_hints(args.column_stats) if args.column_stats else None
+
+    current, generated, unchanged = generate(schemas, args.output_dir, previous, args.force, jobs, options, only,
+                                             column_hints)
+
+    with profiler.phase('remove_orphans'):
+        removed = remove_orphans(args.output_dir, previous, current)
+    with profiler.phase('shared_files'):
+        shared = sync_shared_files(args.output_dir, schemas, options, previous_shared)
+    remove_empty_stage_dirs(args.output_dir)
+    if current != previous or shared != previous_shared or not manifest_path.exists():
+        with profiler.phase('write_manifest'):
+            write_manifest(manifest_path, fingerprint, current, shared)
+    print(f"{generated} generated, {unchanged} unchanged, {removed} removed")
+
+
+def watch(args: argparse.Namespace, create_map, fingerprint: str) -> None:
+    """Stay resident and regenerate whenever the dump or the table list changes.
+
+    The parsed schema is kept in memory and only re-read when the dump itself
+    changes; the manifest then limits rendering to the affected tables.
+    """
+    sql_file, tables_file = args.sql.resolve(), args.tables.resolve()
+    watcher = make_watcher([sql_file, tables_file], poll=args.poll)
+    print(f"Watching {sql_file} and {tables_file} ({type(watcher).__name__}); press Ctrl+C to stop.")
+    args.force = False
+    try:
+        while True:
+            changed = watcher.wait(args.debounce)
+            started = time.perf_counter()
+            if sql_file in changed:
+                try:
+                    create_map = load_dump(args)
+                except (OSError, ValueError) as exc:
+                    print(f"Warning: could not read {sql_file}: {exc}")
+                    continue
+            try:
+                run(args, create_map, fingerprint)
+            except (OSError, ValueError) as exc:
+                # Half-written dumps, malformed table lists or --column-stats reports;
+                # the next change gets another try.
+                print(f"Warning: regeneration failed: {exc}")
+                continue
+            print(f"Regenerated in {(time.perf_counter() - started) * 1000:.0f} ms")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+
+
+def main() -> None:
+    global profiler
+    args = parse_args()
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    if args.profile:
+        profiler = Profiler('generate_missing_models', trace_memory=args.profile_memory)
+
+    with maybe_cprofile(args.cprofile):
+        fingerprint = generator_fingerprint(render_options(args))
+        create_map = load_dump(args)
+        run(args, create_map, fingerprint)
+        if args.watch:
+            watch(args, create_map, fingerprint)
+
+    if args.profile:
+        profiler.write(args.profile)
+        print(f"Profile written to {args.profile}")
+
 
-    file_path.write_text(file_content, encoding='utf-8')
-    print(f"Generated model for {table} -> {file_path}")
+if __name__ == '__main__':
+    main()
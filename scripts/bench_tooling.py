@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+"""Benchmark the Python tooling against synthetic inputs.
+
+The harness writes a synthetic MySQL dump (tables x columns covering every
+``normalize_type`` branch, composite primary keys and multi-row INSERT
+payloads) and a synthetic ``docs/tasks.yaml`` (thousands of tasks and
+execution-log sessions) into a scratch directory, then times each phase of
+``generate_missing_models.py`` and ``scripts/update_status_docs.py``.
+
+Every in-process phase records the best wall time over ``--repeat`` runs
+and the peak Python heap (``tracemalloc``) from one extra run.  The
+``cli.*`` phases run the real command lines in a child process against a
+scratch copy of the repository layout and record the child's peak RSS
+(not available on Windows).
+
+Results are written as JSON and compared with the baseline committed in
+``scripts/bench/baseline.json``; any phase slower or hungrier than the
+baseline plus the tolerance makes the command exit with status 1, and so
+does a missing baseline unless ``--update-baseline`` is given.
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import platform
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import generate_missing_models as generator  # noqa: E402
+import sql_dump  # noqa: E402
+import update_status_docs as status_docs  # noqa: E402
+
+BASELINE_PATH = ROOT / "scripts" / "bench" / "baseline.json"
+RESULTS_PATH = ROOT / ".cache" / "bench" / "results.json"
+
+# One entry per normalize_type branch (plus the modifiers it strips).
+COLUMN_TYPES = [
+    "tinyint(1) NOT NULL DEFAULT '0'",
+    "bigint unsigned DEFAULT NULL",
+    "int NOT NULL",
+    "int(11) unsigned DEFAULT NULL",
+    "smallint NOT NULL",
+    "decimal(12,4) DEFAULT NULL",
+    "numeric(8,2) NOT NULL",
+    "double DEFAULT NULL",
+    "float NOT NULL",
+    "datetime DEFAULT CURRENT_TIMESTAMP",
+    "timestamp NULL DEFAULT NULL",
+    "date DEFAULT NULL",
+    "time NOT NULL",
+    "longblob",
+    "varbinary(16) DEFAULT NULL",
+    "varchar(255) NOT NULL",
+    "varchar(64) DEFAULT NULL COMMENT 'code, short'",
+    "text",
+    "enum('open','closed') DEFAULT 'open'",
+]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tables", type=int, default=300, help="Number of synthetic tables.")
+    parser.add_argument("--columns", type=int, default=30, help="Columns per synthetic table.")
+    parser.add_argument("--rows", type=int, default=200, help="INSERT rows per synthetic table.")
+    parser.add_argument("--tasks", type=int, default=3000, help="Number of synthetic tasks.")
+    parser.add_argument("--sessions", type=int, default=1000, help="Number of synthetic execution-log sessions.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per phase; the best one is kept.")
+    parser.add_argument("--seed", type=int, default=1729, help="Seed for the synthetic data.")
+    parser.add_argument("--output", type=Path, default=RESULTS_PATH, help="Where to write the results JSON.")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="Baseline results to compare against.")
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store these results as the new baseline instead of comparing.",
+    )
+    parser.add_argument(
+        "--time-tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed relative slowdown per phase before failing (default: 0.25).",
+    )
+    parser.add_argument(
+        "--memory-tolerance",
+        type=float,
+        default=0.10,
+        help="Allowed relative peak-memory growth per phase before failing (default: 0.10).",
+    )
+    parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=5.0,
+        help="Ignore slowdowns smaller than this many milliseconds (timer noise on tiny phases).",
+    )
+    return parser.parse_args()
+
+
+def _sql_value(column_type: str, rng: random.Random, row: int) -> str:
+    t = column_type.lower()
+    if "null" in t and "not null" not in t and rng.random() < 0.1:
+        return "NULL"
+    if t.startswith(("tinyint", "bigint", "int", "smallint")):
+        return str(rng.randint(0, 1) if t.startswith("tinyint") else row)
+    if t.startswith(("decimal", "numeric", "double", "float")):
+        return f"{rng.uniform(-1000, 1000):.2f}"
+    if t.startswith(("datetime", "timestamp")):
+        return f"'2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} 12:{rng.randint(0, 59):02d}:00'"
+    if t.startswith("date"):
+        return f"'2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}'"
+    if t.startswith("time"):
+        return f"'{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:00'"
+    if "blob" in t or "binary" in t:
+        return "_binary '" + "".join(rng.choice(["\\0", "a", "\\'", "\\\\", "z"]) for _ in range(16)) + "'"
+    if t.startswith("enum"):
+        return rng.choice(["'open'", "'closed'"])
+    text = " ".join(rng.choice(["alpha", "beta", "it\\'s", "semi;colon", "comma,", "(paren)"]) for _ in range(6))
+    return f"'{text}'"
+
+
+def synthesize_dump(path: Path, tables: int, columns: int, rows: int, seed: int) -> None:
+    rng = random.Random(seed)
+    with path.open("w", encoding="utf-8") as handle:
+        handle.write("-- MySQL dump (synthetic benchmark data)\n")
+        handle.write("/*!40101 SET @OLD_CHARACTER_SET_CLIENT=@@CHARACTER_SET_CLIENT */;\n")
+        for index in range(tables):
+            name = f"bench_table_{index:05d}"
+            types = [COLUMN_TYPES[(index + col) % len(COLUMN_TYPES)] for col in range(columns)]
+            composite = index % 7 == 0
+            lines = ["  `id` int NOT NULL AUTO_INCREMENT"]
+            if composite:
+                lines.append("  `tenant_id` int NOT NULL")
+            lines.extend(f"  `column_{col:03d}` {column_type}" for col, column_type in enumerate(types))
+            lines.append("  PRIMARY KEY (`id`,`tenant_id`)" if composite else "  PRIMARY KEY (`id`)")
+            lines.append(f"  KEY `idx_{name}_c0` (`column_000`)")
+            handle.write(f"DROP TABLE IF EXISTS `{name}`;\n")
+            handle.write(f"CREATE TABLE `{name}` (\n" + ",\n".join(lines) + "\n) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;\n")
+            if not rows:
+                continue
+            handle.write(f"LOCK TABLES `{name}` WRITE;\n")
+            for start in range(0, rows, 100):
+                tuples = []
+                for row in range(start, min(rows, start + 100)):
+                    values = [str(row + 1)]
+                    if composite:
+                        values.append(str(row % 5))
+                    values.extend(_sql_value(column_type, rng, row) for column_type in types)
+                    tuples.append("(" + ",".join(values) + ")")
+                handle.write(f"INSERT INTO `{name}` VALUES " + ",".join(tuples) + ";\n")
+            handle.write("UNLOCK TABLES;\n")
+
+
+def synthesize_tasks(path: Path, tasks: int, sessions: int, seed: int) -> None:
+    rng = random.Random(seed)
+    owners = ["RaslanAmir", "Luka Marin", "Milica Horvat", "Status Reporter", "QA Bot"]
+    categories = {"backlog": [], "in_progress": [], "completed": []}
+    for index in range(tasks):
+        category = rng.choice(list(categories))
+        task = {
+            "id": f"T-{index:05d}",
+            "title": f"Synthetic task {index} for {rng.choice(['calibration', 'CAPA', 'audit', 'WPF shell'])}",
+            "owner": rng.choice(owners),
+            "notes": "Generated for the tooling benchmark; " * rng.randint(1, 3),
+        }
+        day = f"20{rng.randint(20, 26)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+        if category == "completed":
+            task["completed_on"] = day
+        elif rng.random() < 0.7:
+            task["due"] = day
+        categories[category].append(task)
+    log = []
+    for index in range(sessions):
+        log.append(
+            {
+                "date": f"20{rng.randint(20, 26)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+                "author": rng.choice(owners),
+                "summary": f"Synthetic session {index}",
+                "entries": [
+                    {
+                        "timestamp": f"{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}",
+                        "change": f"Change {index}.{row} | piped",
+                        "notes": "Benchmark row",
+                    }
+                    for row in range(rng.randint(1, 6))
+                ],
+            }
+        )
+    data = {
+        "metadata": {
+            "project_overview": "Synthetic benchmark project.",
+            "current_focus": [],
+            "blockers": [],
+            "next_steps": [],
+        },
+        "tasks": categories,
+        "execution_log": log,
+    }
+    path.write_text(status_docs.yaml.safe_dump(data, sort_keys=False, allow_unicode=True), encoding="utf-8")
+
+
+def measure(phase: Callable[[], object], repeat: int) -> Tuple[float, int, object]:
+    """Return ``(best wall seconds, peak traced bytes, last result)`` for ``phase``."""
+    best = float("inf")
+    result = None
+    for _ in range(max(1, repeat)):
+        gc.collect()
+        start = time.perf_counter()
+        result = phase()
+        best = min(best, time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        phase()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak, result
+
+
+def run_cli(argv: List[str], cwd: Path, repeat: int, setup: Callable[[], None]) -> Tuple[float, Optional[int]]:
+    """Return ``(best wall seconds, peak child RSS bytes)`` for ``python argv`` run in ``cwd``."""
+    best = float("inf")
+    peak_rss = None
+    for _ in range(max(1, repeat)):
+        setup()
+        start = time.perf_counter()
+        process = subprocess.Popen([sys.executable, *argv], cwd=cwd, stdout=subprocess.DEVNULL)
+        if resource is None:
+            status = process.wait()
+        else:
+            # wait4 reports the rusage of exactly this child.
+            _, wait_status, usage = os.wait4(process.pid, 0)
+            process.returncode = status = os.waitstatus_to_exitcode(wait_status)
+            scale = 1 if sys.platform == "darwin" else 1024
+            peak_rss = max(peak_rss or 0, usage.ru_maxrss * scale)
+        best = min(best, time.perf_counter() - start)
+        if status != 0:
+            raise RuntimeError(f"{' '.join(argv)} exited with status {status}")
+    return best, peak_rss
+
+
+def cli_result(seconds: float, peak_rss: Optional[int], count: int) -> Dict:
+    result = {"seconds": seconds, "count": count}
+    if peak_rss is not None:
+        result["peak_rss_bytes"] = peak_rss
+    return result
+
+
+def bench_generator(workdir: Path, args: argparse.Namespace, results: Dict[str, Dict]) -> None:
+    dump = workdir / "bench.sql"
+    synthesize_dump(dump, args.tables, args.columns, args.rows, args.seed)
+    results["dump.bytes"] = {"count": dump.stat().st_size}
+
+    seconds, peak, schema = measure(lambda: sql_dump.load_schema(dump), args.repeat)
+    results["generator.parse"] = {"seconds": seconds, "peak_bytes": peak, "count": len(schema)}
+
+    cache = workdir / "schema-cache.json"
+    sql_dump.load_schema_cached(dump, cache)
+    seconds, peak, _ = measure(lambda: sql_dump.load_schema_cached(dump, cache), args.repeat)
+    results["generator.parse_cached"] = {"seconds": seconds, "peak_bytes": peak, "count": len(schema)}
+
+    schemas = list(schema.values())
+    seconds, peak, rendered = measure(lambda: [generator.render_entity(table) for table in schemas], args.repeat)
+    results["generator.render"] = {"seconds": seconds, "peak_bytes": peak, "count": len(rendered)}
+
+    output = workdir / "Generated"
+    output.mkdir()
+
+    def write_all() -> int:
+        for class_name, content in rendered:
+            (output / f"{class_name}.cs").write_text(content, encoding="utf-8")
+        return len(rendered)
+
+    seconds, peak, count = measure(write_all, args.repeat)
+    results["generator.write"] = {"seconds": seconds, "peak_bytes": peak, "count": count}
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        current, _, _ = generator.generate(schemas, output, {}, force=True)
+    seconds, peak, (_, _, unchanged) = measure(lambda: generator.generate(schemas, output, current), args.repeat)
+    results["generator.noop"] = {"seconds": seconds, "peak_bytes": peak, "count": unchanged}
+
+    cli_output = workdir / "cli-generated"
+    seconds, peak_rss = run_cli(
+        [str(ROOT / "generate_missing_models.py"), "--sql", str(dump), "--output-dir", str(cli_output),
+         "--all-tables", "--no-cache"],
+        workdir,
+        args.repeat,
+        lambda: shutil.rmtree(cli_output, ignore_errors=True),
+    )
+    results["cli.generator"] = cli_result(seconds, peak_rss, len(schemas))
+
+
+def bench_status_docs(workdir: Path, args: argparse.Namespace, results: Dict[str, Dict]) -> None:
+    tasks_path = workdir / "tasks.yaml"
+    synthesize_tasks(tasks_path, args.tasks, args.sessions, args.seed)
+    results["tasks.bytes"] = {"count": tasks_path.stat().st_size}
+    status_docs.TASKS_PATH = tasks_path
+
+    seconds, peak, raw = measure(status_docs.load_tasks, args.repeat)
+    results["status.load"] = {"seconds": seconds, "peak_bytes": peak, "count": args.tasks}
+
+    data = status_docs.ensure_structure(raw)
+    seconds, peak, tasks = measure(lambda: status_docs.sort_tasks(data["tasks"]), args.repeat)
+    results["status.sort_tasks"] = {"seconds": seconds, "peak_bytes": peak, "count": args.tasks}
+
+    seconds, peak, log = measure(lambda: status_docs.sort_execution_log(data["execution_log"]), args.repeat)
+    results["status.sort_execution_log"] = {"seconds": seconds, "peak_bytes": peak, "count": len(log)}
+
+    data["tasks"], data["execution_log"] = tasks, log
+    seconds, peak, _ = measure(lambda: status_docs.serialize_yaml(data), args.repeat)
+    results["status.serialize_yaml"] = {"seconds": seconds, "peak_bytes": peak, "count": args.tasks}
+
+    seconds, peak, _ = measure(
+        lambda: (
+            status_docs.render_status_md(data["metadata"], data["tasks"]),
+            status_docs.render_execution_log_md(data["execution_log"]),
+        ),
+        args.repeat,
+    )
+    results["status.render_markdown"] = {"seconds": seconds, "peak_bytes": peak, "count": len(log)}
+
+    documents = {
+        workdir / "tasks.out.yaml": status_docs.serialize_yaml(data),
+        workdir / "STATUS.md": status_docs.render_status_md(data["metadata"], data["tasks"]),
+        workdir / "EXECUTION_LOG.md": status_docs.render_execution_log_md(data["execution_log"]),
+    }
+
+    def write_documents() -> int:
+        for path, content in documents.items():
+            status_docs.write_atomic(path, content)
+        return len(documents)
+
+    seconds, peak, count = measure(write_documents, args.repeat)
+    results["status.write"] = {"seconds": seconds, "peak_bytes": peak, "count": count}
+
+    # The script resolves docs/ from its own location, so run a copy of it
+    # inside a scratch repository layout.
+    tree = workdir / "status-cli"
+    (tree / "scripts").mkdir(parents=True)
+    (tree / "docs").mkdir()
+    for name in ("update_status_docs.py", "profiling.py"):
+        shutil.copy2(ROOT / "scripts" / name, tree / "scripts" / name)
+
+    def reset_docs() -> None:
+        shutil.copy2(tasks_path, tree / "docs" / "tasks.yaml")
+        for name in ("STATUS.md", "EXECUTION_LOG.md", ".status-docs.stamp.json"):
+            (tree / "docs" / name).unlink(missing_ok=True)
+
+    seconds, peak_rss = run_cli([str(tree / "scripts" / "update_status_docs.py")], tree, args.repeat, reset_docs)
+    results["cli.status"] = cli_result(seconds, peak_rss, args.tasks)
+
+
+def compare(
+    results: Dict[str, Dict], baseline: Dict[str, Dict], time_tol: float, memory_tol: float, min_delta: float
+) -> List[str]:
+    regressions = []
+    for phase, current in sorted(results.items()):
+        previous = baseline.get(phase)
+        if not previous:
+            continue
+        if current.get("count") != previous.get("count"):
+            regressions.append(f"{phase}: workload changed ({previous.get('count')} -> {current.get('count')}); re-baseline")
+            continue
+        for key, tolerance, unit in (
+            ("seconds", time_tol, "s"),
+            ("peak_bytes", memory_tol, "B"),
+            ("peak_rss_bytes", memory_tol, "B"),
+        ):
+            if key not in current or key not in previous:
+                continue
+            limit = previous[key] * (1 + tolerance)
+            if key == "seconds":
+                limit = max(limit, previous[key] + min_delta)
+            if current[key] > limit:
+                regressions.append(
+                    f"{phase}: {key} {current[key]:.4g}{unit} exceeds baseline {previous[key]:.4g}{unit} "
+                    f"(+{tolerance:.0%} allowed)"
+                )
+    return regressions
+
+
+def main() -> None:
+    args = parse_args()
+    results: Dict[str, Dict] = {}
+    with tempfile.TemporaryDirectory(prefix="yasgmp-bench-") as tmp:
+        workdir = Path(tmp)
+        bench_generator(workdir, args, results)
+        bench_status_docs(workdir, args, results)
+
+    for phase, values in results.items():
+        if "seconds" in values:
+            peak = values.get("peak_bytes", values.get("peak_rss_bytes"))
+            memory = f"{peak / 1048576:10.2f} MiB" if peak is not None else ""
+            label = " RSS" if "peak_rss_bytes" in values else ""
+            print(f"{phase:<30} {values['seconds'] * 1000:10.1f} ms {memory}{label}")
+
+    payload = {
+        "python": platform.python_version(),
+        "workload": {key: getattr(args, key) for key in ("tables", "columns", "rows", "tasks", "sessions", "seed")},
+        "phases": results,
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+    if args.update_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+        print(f"Baseline written to {args.baseline}")
+        return
+    if not args.baseline.exists():
+        print(f"error: no baseline at {args.baseline}; run with --update-baseline to create one.", file=sys.stderr)
+        sys.exit(1)
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    regressions = compare(
+        results, baseline.get("phases", {}), args.time_tolerance, args.memory_tolerance, args.min_delta_ms / 1000
+    )
+    if regressions:
+        print("Performance regressions detected:", file=sys.stderr)
+        for line in regressions:
+            print(f"  {line}", file=sys.stderr)
+        sys.exit(1)
+    print("No regressions against baseline.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""Profile the row data in ``YASGMP.sql`` column by column.
+
+The dump's ``INSERT`` rows are streamed once through
+:func:`sql_dump.iter_dump` and every column keeps a fixed amount of state:
+row and NULL counts, minimum/maximum/average length of string and binary
+values, minimum and maximum values, and a distinct count.  Distinct values
+are counted exactly while a column has few of them and by a HyperLogLog
+sketch (2 KiB per column, about 2% error) once it outgrows that, so memory
+does not grow with the size of the dump.
+
+Besides the raw statistics the report carries per-table suggestions that
+``generate_missing_models.py --column-stats`` can apply:
+
+* ``max_length``: a bound for unsized ``text``/``varchar`` columns, the
+  observed maximum rounded up to the next power of two;
+* ``required``: columns declared ``NULL`` that never hold one;
+* ``indexes``: high-selectivity integer, date and short string columns
+  that no key covers yet.
+
+Tables with fewer than ``--min-rows`` rows get no suggestions.
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import math
+import sys
+from decimal import Decimal
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from sql_dump import RowBatch, TableSchema, iter_dump
+
+ROOT = Path(__file__).resolve().parents[1]
+SQL_PATH = ROOT / "YASGMP.sql"
+REPORT_PATH = ROOT / "reports" / "column-stats.json"
+REPORT_VERSION = 1
+
+HLL_PRECISION = 11
+EXACT_LIMIT = 512
+# Values longer than this go straight to the sketch instead of the exact set.
+EXACT_MAX_LENGTH = 128
+PREVIEW_LENGTH = 64
+
+INDEX_SELECTIVITY = 0.9
+# Lookup-key types; near-unique amounts and measurements (decimal/double) are not.
+INDEXABLE_TYPES = ("int", "long", "short", "DateTime", "string")
+INDEXABLE_MAX_LENGTH = 255
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sql", type=Path, default=SQL_PATH, help="MySQL dump to profile.")
+    parser.add_argument("--output", type=Path, default=REPORT_PATH, help="Where to write the JSON report.")
+    parser.add_argument("--tables", nargs="+", metavar="TABLE", help="Only profile these tables.")
+    parser.add_argument(
+        "--min-rows",
+        type=int,
+        default=100,
+        help="Only suggest annotations and indexes for tables with at least this many rows (default: 100).",
+    )
+    return parser.parse_args()
+
+
+class HyperLogLog:
+    """Distinct-count sketch over 64-bit hashes (Flajolet et al., 2007)."""
+
+    def __init__(self, precision: int = HLL_PRECISION) -> None:
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def update(self, values) -> None:
+        """Add ``values`` (hashed with 64-bit BLAKE2b); the loop is inlined for speed."""
+        shift = 64 - self.precision
+        mask = (1 << shift) - 1
+        registers = self.registers
+        blake2b, from_bytes = hashlib.blake2b, int.from_bytes
+        for value in values:
+            data = value if value.__class__ is bytes else str(value).encode("utf-8")
+            hashed = from_bytes(blake2b(data, digest_size=8).digest(), "big")
+            rank = shift - (hashed & mask).bit_length() + 1
+            index = hashed >> shift
+            if rank > registers[index]:
+                registers[index] = rank
+
+    def estimate(self) -> int:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / sum(2.0 ** -register for register in self.registers)
+        zeros = self.registers.count(0)
+        if raw <= 2.5 * m and zeros:
+            # Linear counting is more accurate while many registers are empty.
+            return round(m * math.log(m / zeros))
+        return round(raw)
+
+
+def _preview(value):
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, str) and len(value) > PREVIEW_LENGTH:
+        return value[:PREVIEW_LENGTH] + "…"
+    return value
+
+
+class ColumnStats:
+    """Bounded-memory statistics for the values of one column."""
+
+    def __init__(self) -> None:
+        self.values = 0
+        self.nulls = 0
+        self.lengths = 0
+        self.length_total = 0
+        self.min_length: Optional[int] = None
+        self.max_length: Optional[int] = None
+        self.minimum = self.maximum = None
+        self.comparable = True
+        self.exact: Optional[set] = set()
+        self.sketch: Optional[HyperLogLog] = None
+
+    def update(self, values: tuple) -> None:
+        """Fold one batch of a column's values into the statistics."""
+        self.values += len(values)
+        nulls = values.count(None)
+        if nulls:
+            self.nulls += nulls
+            values = [value for value in values if value is not None]
+            if not values:
+                return
+        sized = [value for value in values if isinstance(value, (str, bytes))]
+        if sized:
+            lengths = list(map(len, sized))
+            low, high = min(lengths), max(lengths)
+            self.lengths += len(lengths)
+            self.length_total += sum(lengths)
+            self.min_length = low if self.min_length is None else min(self.min_length, low)
+            self.max_length = high if self.max_length is None else max(self.max_length, high)
+        if not isinstance(values[0], bytes):
+            self._update_range(values)
+        self._update_distinct(values)
+
+    def _update_range(self, values) -> None:
+        if not self.comparable:
+            return
+        try:
+            low, high = min(values), max(values)
+            if self.minimum is not None:
+                low, high = min(low, self.minimum), max(high, self.maximum)
+        except TypeError:
+            # Mixed types (or blobs mixed with text) have no meaningful order.
+            self.comparable = False
+            self.minimum = self.maximum = None
+            return
+        self.minimum, self.maximum = low, high
+
+    def _update_distinct(self, values) -> None:
+        if self.exact is not None:
+            if self.max_length is None or self.max_length <= EXACT_MAX_LENGTH:
+                self.exact.update(values)
+                if len(self.exact) <= EXACT_LIMIT:
+                    return
+            values = self.exact.union(values)
+            self.exact = None
+            self.sketch = HyperLogLog()
+        self.sketch.update(values)
+
+    def distinct(self) -> int:
+        return len(self.exact) if self.exact is not None else self.sketch.estimate()
+
+    def report(self) -> Dict:
+        present = self.values - self.nulls
+        distinct = self.distinct()
+        minimum, maximum = self.minimum, self.maximum
+        if isinstance(minimum, bytes):
+            minimum = maximum = None
+        return {
+            "values": self.values,
+            "nulls": self.nulls,
+            "null_ratio": round(self.nulls / self.values, 6) if self.values else None,
+            "min_length": self.min_length,
+            "max_length": self.max_length,
+            "avg_length": round(self.length_total / self.lengths, 2) if self.lengths else None,
+            "distinct": distinct,
+            "distinct_exact": self.exact is not None,
+            "selectivity": round(min(distinct / present, 1.0), 6) if present else None,
+            "min": _preview(minimum),
+            "max": _preview(maximum),
+        }
+
+
+class TableStats:
+    def __init__(self, table: TableSchema) -> None:
+        self.table = table
+        self.names = [column.name for column in table.columns]
+        self.columns = {name: ColumnStats() for name in self.names}
+        self.rows = 0
+
+    def update(self, batch: RowBatch) -> None:
+        names = batch.columns or self.names
+        self.rows += len(batch.rows)
+        for name, values in zip(names, zip(*batch.rows)):
+            stats = self.columns.get(name)
+            if stats is not None:
+                stats.update(values)
+
+
+def _round_up_length(length: int) -> int:
+    bound = 16
+    while bound < length:
+        bound *= 2
+    return bound
+
+
+def suggestions(table: TableSchema, stats: Dict[str, Dict], rows: int) -> Dict:
+    """Annotation and index suggestions for ``table`` from its column statistics."""
+    covered = {index.columns[0] for index in table.indexes if index.columns}
+    if table.primary_key:
+        covered.add(table.primary_key[0])
+    covered.update(fk.columns[0] for fk in table.foreign_keys if fk.columns)
+    max_length: Dict[str, int] = {}
+    required: List[str] = []
+    indexes: List[Dict] = []
+    for column in table.columns:
+        column_stats = stats.get(column.name)
+        if not column_stats or not column_stats["values"]:
+            continue
+        if column.clr_type == "string" and not column.max_length and column_stats["max_length"]:
+            max_length[column.name] = _round_up_length(column_stats["max_length"])
+        # Columns left out of an INSERT column list took their default, which may be NULL.
+        if column.nullable and column_stats["nulls"] == 0 and column_stats["values"] == rows:
+            required.append(column.name)
+        if column.clr_type == "string":
+            indexable = bool(column.max_length) and column.max_length <= INDEXABLE_MAX_LENGTH
+        else:
+            indexable = column.clr_type in INDEXABLE_TYPES
+        selectivity = column_stats["selectivity"]
+        if indexable and column.name not in covered and selectivity is not None and selectivity >= INDEX_SELECTIVITY:
+            indexes.append({"column": column.name, "distinct": column_stats["distinct"], "selectivity": selectivity})
+    result = {"max_length": max_length, "required": required, "indexes": indexes}
+    return {key: value for key, value in result.items() if value}
+
+
+def profile(sql_path: Path, tables: Optional[List[str]] = None, min_rows: int = 100) -> Dict:
+    """Stream ``sql_path`` once and return the column statistics report."""
+    wanted = set(tables) if tables else None
+    collected: Dict[str, TableStats] = {}
+    for event in iter_dump(sql_path, tables=wanted):
+        if isinstance(event, RowBatch):
+            stats = collected.get(event.table)
+            if stats is None:
+                raise ValueError(f"INSERT for table {event.table!r} before its CREATE TABLE")
+            stats.update(event)
+        elif wanted is None or event.name in wanted:
+            collected[event.name] = TableStats(event)
+
+    report_tables = {}
+    for name in sorted(collected):
+        stats = collected[name]
+        columns = {column: stats.columns[column].report() for column in stats.names}
+        entry = {"rows": stats.rows, "columns": columns}
+        if stats.rows >= min_rows:
+            table_suggestions = suggestions(stats.table, columns, stats.rows)
+            if table_suggestions:
+                entry["suggestions"] = table_suggestions
+        report_tables[name] = entry
+    return {
+        "version": REPORT_VERSION,
+        "dump": {"path": str(sql_path), "size": sql_path.stat().st_size},
+        "settings": {
+            "hll_precision": HLL_PRECISION,
+            "exact_limit": EXACT_LIMIT,
+            "min_rows": min_rows,
+            "index_selectivity": INDEX_SELECTIVITY,
+        },
+        "tables": report_tables,
+    }
+
+
+def main() -> None:
+    args = parse_args()
+    try:
+        report = profile(args.sql, args.tables, args.min_rows)
+    except (OSError, ValueError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        sys.exit(1)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    tables = report["tables"]
+    rows = sum(entry["rows"] for entry in tables.values())
+    suggested = sum(1 for entry in tables.values() if "suggestions" in entry)
+    print(
+        f"Profiled {rows} rows in {len(tables)} tables ({suggested} with suggestions) -> {args.output}",
+        file=sys.stdout,
+    )
+
+
+if __name__ == "__main__":
+    main()
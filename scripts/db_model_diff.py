@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""Compare the database schema in ``YASGMP.sql`` with the C# entity models.
+
+Every ``Models/**/*.cs`` file is scanned once for ``[Table("...")]`` and
+``[Column("...")]`` attributes, the dump is parsed with the streaming reader
+in ``sql_dump.py`` and the two sides are joined as sets of lower-cased
+column names.  The result is written in the same shape as the PowerShell
+analyzer: ``model_db_diff.json`` (one entry per mapped table with
+``missing_in_model`` / ``extra_in_model``) and
+``reports/mismatch-matrix.csv`` (one row per mismatching column).
+Models whose ``[Table]`` is not in the dump (views, tables created
+elsewhere) are not diffed; they are listed as warnings instead.
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import re
+import sys
+from pathlib import Path, PureWindowsPath
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from sql_dump import load_schema, load_schema_cached
+
+ROOT = Path(__file__).resolve().parents[1]
+SQL_PATH = ROOT / "YASGMP.sql"
+MODELS_DIR = ROOT / "YasGMP.AppCore" / "Models"
+DIFF_PATH = ROOT / "model_db_diff.json"
+MISMATCH_PATH = ROOT / "reports" / "mismatch-matrix.csv"
+TABLE_LIST_PATH = ROOT / "tables_without_models.txt"
+
+_TOKEN = re.compile(
+    r"[\[,]\s*(?:System\.ComponentModel\.DataAnnotations\.Schema\.)?"
+    r"(?P<kind>Table|Column)(?:Attribute)?\s*\(\s*(?:Name\s*=\s*)?\"(?P<name>[^\"]+)\""
+    r"|\b(?:class|record)\s+(?P<class_name>\w+)"
+)
+_LINE_COMMENT = re.compile(r"//[^\n]*")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sql", type=Path, default=SQL_PATH, help="MySQL dump holding the reference schema.")
+    parser.add_argument("--models", type=Path, default=MODELS_DIR, help="Directory scanned recursively for *.cs models.")
+    parser.add_argument("--output", type=Path, default=DIFF_PATH, help="Where to write the JSON diff.")
+    parser.add_argument("--csv", type=Path, default=MISMATCH_PATH, help="Where to write the mismatch matrix.")
+    parser.add_argument(
+        "--table-list",
+        type=Path,
+        nargs="?",
+        const=TABLE_LIST_PATH,
+        help="Also write the dump tables that have no model (default path: tables_without_models.txt).",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Parse the dump without the parsed-schema cache.")
+    parser.add_argument(
+        "--fail-on-mismatch",
+        action="store_true",
+        help="Exit with 1 when any table has missing or extra columns.",
+    )
+    return parser.parse_args()
+
+
+def scan_models(
+    models_dir: Path,
+    paths: Optional[Iterable[Path]] = None,
+    read_text: Optional[Callable[[Path], str]] = None,
+) -> List[Tuple[str, Path, Set[str]]]:
+    """Return ``(table, file, columns)`` for every ``[Table]`` class under ``models_dir``.
+
+    Columns are keyed by the class that declares them, so ``partial``
+    classes whose ``[Column]`` properties live in a different file than the
+    ``[Table]`` attribute (``Foo.cs`` / ``Foo.Schema.cs``) are merged.
+    ``paths`` restricts the scan to those files (callers checking a few
+    files pass each file's partial siblings along with it), and
+    ``read_text`` supplies a file's content in place of the working tree
+    (the pre-commit check passes the staged version).
+    """
+    tables: List[Tuple[str, Path, str]] = []
+    class_columns: Dict[str, Set[str]] = {}
+    for path in sorted(models_dir.rglob("*.cs") if paths is None else paths):
+        raw = read_text(path) if read_text else path.read_text(encoding="utf-8-sig", errors="ignore")
+        text = _LINE_COMMENT.sub("", raw)
+        pending_table: Optional[str] = None
+        current: Optional[Set[str]] = None
+        for match in _TOKEN.finditer(text):
+            class_name = match.group("class_name")
+            kind, name = match.group("kind"), match.group("name")
+            if class_name:
+                current = class_columns.setdefault(class_name, set())
+                if pending_table is not None:
+                    tables.append((pending_table, path, class_name))
+                    pending_table = None
+            elif kind == "Table":
+                pending_table = name
+            elif current is not None:
+                current.add(name.lower())
+    return [(table, path, class_columns[class_name]) for table, path, class_name in tables]
+
+
+def display_path(path: Path, models_dir: Path) -> str:
+    """Render ``path`` the way the PowerShell analyzer does (``Models\\Foo.cs``)."""
+    relative = path.relative_to(models_dir.parent)
+    return str(PureWindowsPath(*relative.parts))
+
+
+def compute_diff(schema: Dict, mappings: List[Tuple[str, Path, Set[str]]], models_dir: Path) -> List[Dict]:
+    """Column differences of every mapped table that the dump defines."""
+    db_columns = {
+        name.lower(): {column.name.lower() for column in table.columns} for name, table in schema.items()
+    }
+    results = []
+    for table, path, model_columns in mappings:
+        columns = db_columns.get(table.lower())
+        if columns is None:
+            continue
+        results.append(
+            {
+                "table": table,
+                "file": display_path(path, models_dir),
+                "missing_in_model": sorted(columns - model_columns),
+                "extra_in_model": sorted(model_columns - columns),
+            }
+        )
+    results.sort(key=lambda entry: (entry["file"].lower(), entry["table"]))
+    return results
+
+
+def unmapped_tables(schema: Dict, mappings: List[Tuple[str, Path, Set[str]]]) -> List[str]:
+    mapped = {table.lower() for table, _, _ in mappings}
+    return sorted(name for name in schema if name.lower() not in mapped)
+
+
+def models_without_table(schema: Dict, mappings: List[Tuple[str, Path, Set[str]]], models_dir: Path) -> List[Dict]:
+    """``[Table]`` mappings naming a table the dump does not define."""
+    known = {name.lower() for name in schema}
+    unknown = [
+        {"table": table, "file": display_path(path, models_dir)}
+        for table, path, _ in mappings
+        if table.lower() not in known
+    ]
+    unknown.sort(key=lambda entry: (entry["file"].lower(), entry["table"]))
+    return unknown
+
+
+def write_mismatch_csv(path: Path, results: List[Dict]) -> int:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    rows = 0
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["table", "file", "column", "issue"])
+        for entry in results:
+            for issue in ("missing_in_model", "extra_in_model"):
+                for column in entry[issue]:
+                    writer.writerow([entry["table"], entry["file"], column, issue])
+                    rows += 1
+    return rows
+
+
+def main() -> None:
+    args = parse_args()
+    schema = load_schema(args.sql) if args.no_cache else load_schema_cached(args.sql)
+    mappings = scan_models(args.models)
+    results = compute_diff(schema, mappings, args.models)
+
+    args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    mismatches = write_mismatch_csv(args.csv, results)
+    if args.table_list:
+        missing = unmapped_tables(schema, mappings)
+        args.table_list.write_text("\n".join(missing), encoding="utf-8")
+    for entry in models_without_table(schema, mappings, args.models):
+        print(f"warning: {entry['file']}: table {entry['table']} is not in the dump", file=sys.stderr)
+
+    print(
+        f"Compared {len(mappings)} mapped tables against {len(schema)} dump tables: {mismatches} mismatching columns.",
+        file=sys.stdout,
+    )
+    if args.fail_on_mismatch and mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
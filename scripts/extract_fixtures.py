@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""Extract row data from ``YASGMP.sql`` into per-table fixture files.
+
+``INSERT INTO ... VALUES`` tuples are decoded by the streaming reader in
+``sql_dump.py`` (escaped strings, ``_binary``/hex blobs, ``NULL``), so the
+dump is never loaded into memory.  Values are typed from the table's
+``CREATE TABLE`` through :func:`sql_dump.normalize_type` and written as
+``<table>.csv``, ``<table>.jsonl`` or, when ``pyarrow`` is installed,
+``<table>.parquet``; every selected table gets its files, with just the
+header when no rows survive.  ``--limit`` and ``--sample`` cut quick
+slices out of large tables; once every requested table has hit its
+``--limit`` the rest of the dump is not read.
+
+``DECIMAL`` values stay exact: they are written as strings (``"0.10"``)
+to CSV and JSON lines and as ``decimal128``/``decimal256`` columns of the
+declared precision and scale to Parquet.
+"""
+from __future__ import annotations
+
+import argparse
+import base64
+import csv
+import json
+import random
+import sys
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sql_dump import Column, RowBatch, TableSchema, iter_dump
+
+ROOT = Path(__file__).resolve().parents[1]
+SQL_PATH = ROOT / "YASGMP.sql"
+OUTPUT_DIR = ROOT / "scripts" / "fixtures" / "dump"
+FORMATS = ("csv", "jsonl", "parquet")
+
+_TRUE = ("1", "true", "y", "yes")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sql", type=Path, default=SQL_PATH, help="MySQL dump to read.")
+    parser.add_argument("--output-dir", type=Path, default=OUTPUT_DIR, help="Directory for the fixture files.")
+    parser.add_argument("--tables", nargs="+", metavar="TABLE", help="Only extract these tables.")
+    parser.add_argument("--exclude", nargs="+", metavar="TABLE", default=[], help="Skip these tables.")
+    parser.add_argument(
+        "--format",
+        dest="formats",
+        action="append",
+        choices=FORMATS,
+        help="Output format; repeat for several (default: jsonl). parquet requires pyarrow.",
+    )
+    parser.add_argument("--limit", type=int, help="Keep at most this many rows per table.")
+    parser.add_argument("--sample", type=float, help="Keep each row with this probability (0-1).")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for --sample (default: 0).")
+    return parser.parse_args()
+
+
+def _as_int(value):
+    if value is None or isinstance(value, int):
+        return value
+    if isinstance(value, bytes):
+        value = value.decode("utf-8", errors="replace")
+    try:
+        return int(float(value)) if isinstance(value, float) else int(value)
+    except ValueError:
+        return value
+
+
+def _as_float(value):
+    if value is None or isinstance(value, float):
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return value
+
+
+def _as_decimal(value):
+    if value is None or isinstance(value, Decimal):
+        return value
+    if isinstance(value, bytes):
+        value = value.decode("utf-8", errors="replace")
+    try:
+        return Decimal(str(value))
+    except InvalidOperation:
+        return value
+
+
+def _as_bool(value):
+    if value is None or isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return value != 0
+    if isinstance(value, bytes):
+        # BIT(1) columns are dumped as b'\x00' / b'\x01'.
+        return any(value)
+    return str(value).strip().lower() in _TRUE
+
+
+def _as_bytes(value):
+    if value is None or isinstance(value, bytes):
+        return value
+    return str(value).encode("utf-8")
+
+
+def _as_text(value):
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="replace")
+    return str(value)
+
+
+CONVERTERS: Dict[str, Callable] = {
+    "bool": _as_bool,
+    "short": _as_int,
+    "int": _as_int,
+    "long": _as_int,
+    "double": _as_float,
+    "decimal": _as_decimal,
+    "byte[]": _as_bytes,
+}
+
+
+def converter(column: Column) -> Callable:
+    return CONVERTERS.get(column.clr_type, _as_text)
+
+
+def json_value(value):
+    if isinstance(value, bytes):
+        return base64.b64encode(value).decode("ascii")
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, bytes):
+        return base64.b64encode(value).decode("ascii")
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    return value
+
+
+class TableWriter:
+    """Typed, sampled row sink for one table and one or more formats."""
+
+    def __init__(self, table: TableSchema, output_dir: Path, formats: List[str]) -> None:
+        self.table = table
+        self.columns = [column.name for column in table.columns]
+        self.converters = [converter(column) for column in table.columns]
+        self.rows = 0
+        self._csv = self._jsonl = self._parquet = None
+        self._handles = []
+        if "csv" in formats:
+            handle = (output_dir / f"{table.name}.csv").open("w", encoding="utf-8", newline="")
+            self._handles.append(handle)
+            self._csv = csv.writer(handle)
+            self._csv.writerow(self.columns)
+        if "jsonl" in formats:
+            self._jsonl = (output_dir / f"{table.name}.jsonl").open("w", encoding="utf-8", newline="\n")
+            self._handles.append(self._jsonl)
+        if "parquet" in formats:
+            self._parquet = ParquetSink(table, output_dir / f"{table.name}.parquet")
+
+    def _positions(self, columns: Optional[Tuple[str, ...]]) -> Optional[List[int]]:
+        if columns is None:
+            return None
+        index = {name: position for position, name in enumerate(self.columns)}
+        try:
+            return [index[name] for name in columns]
+        except KeyError as exc:
+            raise ValueError(f"INSERT into {self.table.name!r} names unknown column {exc.args[0]!r}") from None
+
+    def write(self, batch: RowBatch, rows: List[tuple]) -> None:
+        positions = self._positions(batch.columns)
+        width = len(self.columns)
+        typed = []
+        for row in rows:
+            if positions is not None:
+                full = [None] * width
+                for position, value in zip(positions, row):
+                    full[position] = value
+                row = full
+            typed.append([convert(value) for convert, value in zip(self.converters, row)])
+        if self._csv is not None:
+            self._csv.writerows([csv_value(value) for value in row] for row in typed)
+        if self._jsonl is not None:
+            for row in typed:
+                record = {name: json_value(value) for name, value in zip(self.columns, row)}
+                self._jsonl.write(json.dumps(record, ensure_ascii=False) + "\n")
+        if self._parquet is not None:
+            self._parquet.write(typed)
+        self.rows += len(typed)
+
+    def close(self) -> None:
+        for handle in self._handles:
+            handle.close()
+        if self._parquet is not None:
+            self._parquet.close()
+
+
+class ParquetSink:
+    """Column-oriented output through the optional ``pyarrow`` package."""
+
+    TYPES = {
+        "bool": "bool_",
+        "short": "int16",
+        "int": "int32",
+        "long": "int64",
+        "double": "float64",
+        "byte[]": "binary",
+    }
+    # MySQL's DECIMAL defaults to DECIMAL(10, 0) and allows up to 65 digits.
+    DEFAULT_DECIMAL = (10, 0)
+
+    @staticmethod
+    def require():
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise RuntimeError("the parquet format requires pyarrow (python -m pip install pyarrow)") from None
+        return pyarrow
+
+    def __init__(self, table: TableSchema, path: Path) -> None:
+        pyarrow = self.require()
+        self._pa = pyarrow
+        self.schema = pyarrow.schema([(column.name, self.arrow_type(column)) for column in table.columns])
+        self._writer = pyarrow.parquet.ParquetWriter(str(path), self.schema)
+
+    def arrow_type(self, column: Column):
+        if column.clr_type == "decimal":
+            if column.precision:
+                precision, scale = column.precision
+            elif column.max_length:
+                precision, scale = column.max_length, 0
+            else:
+                precision, scale = self.DEFAULT_DECIMAL
+            factory = self._pa.decimal128 if precision <= 38 else self._pa.decimal256
+            return factory(precision, scale)
+        return getattr(self._pa, self.TYPES.get(column.clr_type, "string"))()
+
+    def write(self, rows: List[list]) -> None:
+        columns = list(zip(*rows)) if rows else [[] for _ in self.schema]
+        arrays = [self._pa.array(values, type=field.type) for values, field in zip(columns, self.schema)]
+        self._writer.write_table(self._pa.Table.from_arrays(arrays, schema=self.schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+def extract(
+    sql_path: Path,
+    output_dir: Path,
+    formats: List[str],
+    tables: Optional[List[str]] = None,
+    exclude: Optional[List[str]] = None,
+    limit: Optional[int] = None,
+    sample: Optional[float] = None,
+    seed: int = 0,
+) -> Dict[str, int]:
+    """Write fixture files for the selected tables; return ``{table: rows written}``."""
+    excluded = set(exclude or ())
+    wanted = set(tables) - excluded if tables else None
+    rng = random.Random(seed)
+    if "parquet" in formats:
+        ParquetSink.require()
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    writers: Dict[str, TableWriter] = {}
+    try:
+        for event in iter_dump(sql_path, tables=wanted, exclude=excluded):
+            if not isinstance(event, RowBatch):
+                # Open the files as soon as a selected table is declared so an
+                # empty or fully sampled-out table still gets a fixture.
+                if (wanted is None or event.name in wanted) and event.name not in excluded:
+                    writers[event.name] = TableWriter(event, output_dir, formats)
+                continue
+            writer = writers.get(event.table)
+            if writer is None:
+                raise ValueError(f"INSERT for table {event.table!r} before its CREATE TABLE")
+            rows = event.rows
+            if sample is not None:
+                rows = [row for row in rows if rng.random() < sample]
+            if limit is not None:
+                rows = rows[: max(limit - writer.rows, 0)]
+            if rows:
+                writer.write(event, rows)
+            if limit is not None and wanted is not None and len(writers) == len(wanted):
+                if all(writer.rows >= limit for writer in writers.values()):
+                    break
+    finally:
+        for writer in writers.values():
+            writer.close()
+    return {name: writer.rows for name, writer in writers.items()}
+
+
+def main() -> None:
+    args = parse_args()
+    if args.sample is not None and not 0 < args.sample <= 1:
+        print("error: --sample must be in (0, 1]", file=sys.stderr)
+        sys.exit(2)
+    formats = args.formats or ["jsonl"]
+    try:
+        counts = extract(
+            args.sql, args.output_dir, formats, args.tables, args.exclude, args.limit, args.sample, args.seed
+        )
+    except (RuntimeError, ValueError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        sys.exit(1)
+    for name in sorted(counts):
+        print(f"{name}: {counts[name]} rows", file=sys.stdout)
+    print(f"Extracted {sum(counts.values())} rows from {len(counts)} tables -> {args.output_dir}", file=sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""Minimal file watcher used by the tooling's ``--watch`` modes.
+
+On Linux the watcher uses inotify (through ``ctypes``, no third-party
+packages); everywhere else, or when inotify is unavailable, it falls back
+to polling ``stat`` results.  Both implementations watch the *directories*
+holding the files so editors that save through a rename are still seen,
+and both debounce bursts of writes into a single notification.
+"""
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class PollingWatcher:
+    """Detect changes by comparing ``(mtime_ns, size)`` snapshots."""
+
+    def __init__(self, paths: Iterable[Path], interval: float = 0.25) -> None:
+        self.paths = [Path(path).resolve() for path in paths]
+        self.interval = interval
+        self._snapshot = self._take_snapshot()
+
+    def _take_snapshot(self) -> Dict[Path, Optional[Tuple[int, int]]]:
+        snapshot: Dict[Path, Optional[Tuple[int, int]]] = {}
+        for path in self.paths:
+            try:
+                stat = path.stat()
+            except OSError:
+                snapshot[path] = None
+            else:
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def _changed(self) -> Set[Path]:
+        current = self._take_snapshot()
+        changed = {path for path in self.paths if current[path] != self._snapshot[path]}
+        self._snapshot = current
+        return changed
+
+    def wait(self, debounce: float = 0.1) -> Set[Path]:
+        """Block until at least one path changes and writes have settled."""
+        changed: Set[Path] = set()
+        while not changed:
+            time.sleep(self.interval)
+            changed = self._changed()
+        while True:
+            time.sleep(max(debounce, 0.01))
+            more = self._changed()
+            if not more:
+                return changed
+            changed |= more
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """Linux inotify watcher over the parent directories of ``paths``."""
+
+    MASK = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE | _IN_MODIFY
+
+    def __init__(self, paths: Iterable[Path]) -> None:
+        self.paths = [Path(path).resolve() for path in paths]
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: Dict[int, Path] = {}
+        for directory in sorted({path.parent for path in self.paths}):
+            wd = libc.inotify_add_watch(self._fd, os.fsencode(str(directory)), self.MASK)
+            if wd < 0:
+                os.close(self._fd)
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+            self._dirs[wd] = directory
+
+    def _read_events(self) -> Set[Path]:
+        """Consume every queued event and return the watched paths among them."""
+        changed: Set[Path] = set()
+        while True:
+            try:
+                data = os.read(self._fd, 65536)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(data):
+                wd, _mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0")
+                offset += length
+                directory = self._dirs.get(wd)
+                if directory is None or not name:
+                    continue
+                path = directory / os.fsdecode(name)
+                if path in self.paths:
+                    changed.add(path)
+
+    def _drain(self, timeout: Optional[float]) -> Set[Path]:
+        """Wait up to ``timeout`` seconds (forever when ``None``) for events on ``self.paths``.
+
+        Events for other files in the watched directories (editor swap files,
+        temporary files) do not end the wait; only a full ``timeout`` without
+        a relevant event returns an empty set.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+            readable, _, _ = select.select([self._fd], [], [], remaining)
+            if not readable:
+                return set()
+            changed = self._read_events()
+            if changed:
+                return changed
+
+    def wait(self, debounce: float = 0.1) -> Set[Path]:
+        changed: Set[Path] = set()
+        while not changed:
+            changed = self._drain(None)
+        while True:
+            more = self._drain(debounce)
+            if not more:
+                return changed
+            changed |= more
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+def make_watcher(paths: Iterable[Path], poll: bool = False):
+    """Return an inotify watcher when possible, otherwise a polling one."""
+    paths = list(paths)
+    if not poll and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(paths)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(paths)
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""Phase-level profiling shared by the Python tooling's ``--profile`` options.
+
+A :class:`Profiler` accumulates wall time, CPU time, memory and item
+counts per named phase and writes them as one JSON document, so CI can
+archive the numbers and trend them over time.  The OS only reports the
+process's RSS high-water mark, so a phase records how far it raised that
+mark (``max_rss_growth_bytes``; zero when an earlier phase peaked higher)
+next to the process-wide value at its end (``process_max_rss_bytes``).
+With ``trace_memory`` the phase's own peak of Python allocations is
+measured with :mod:`tracemalloc` as well, at a noticeable cost in speed.
+A disabled profiler (the default in every tool) reduces each phase to a
+no-op context manager.  ``--cprofile PATH`` support
+(:func:`maybe_cprofile`) wraps the whole run in :mod:`cProfile` and dumps
+a ``pstats`` file to ``PATH``, independently of where the ``--profile``
+JSON report goes.
+"""
+from __future__ import annotations
+
+import cProfile
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ROOT = Path(__file__).resolve().parents[1]
+PROFILE_DIR = ROOT / ".cache" / "profile"
+REPORT_VERSION = 2
+
+
+def max_rss_bytes() -> Optional[int]:
+    """Peak resident set size of this process so far (``None`` on Windows)."""
+    if resource is None:
+        return None
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    scale = 1 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+def default_report_path(tool: str) -> Path:
+    return PROFILE_DIR / f"{tool}.json"
+
+
+class Profiler:
+    """Collect per-phase metrics for one tool invocation.
+
+    Phases are flat: entering the same name again adds to its totals, and
+    phases should not be nested (the traced peak is reset when a phase
+    starts).  Work measured elsewhere, e.g. in worker processes, is folded
+    in with :meth:`add`; its wall time is summed, so it can exceed the
+    run's total.
+    """
+
+    def __init__(self, tool: str, enabled: bool = True, trace_memory: bool = False) -> None:
+        self.tool = tool
+        self.enabled = enabled
+        self.trace_memory = enabled and trace_memory
+        self.phases: Dict[str, Dict] = {}
+        self.counters: Dict[str, int] = {}
+        self.details: Dict[str, Dict] = {}
+        self._started_wall = time.perf_counter()
+        self._started_cpu = time.process_time()
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def _stats(self, name: str) -> Dict:
+        stats = self.phases.get(name)
+        if stats is None:
+            stats = self.phases[name] = {
+                "wall_s": 0.0,
+                "cpu_s": 0.0,
+                "process_max_rss_bytes": None,
+                "max_rss_growth_bytes": None,
+                "peak_traced_bytes": None,
+                "calls": 0,
+                "count": 0,
+            }
+        return stats
+
+    @contextmanager
+    def phase(self, name: str, count: int = 0):
+        """Measure the body as phase ``name``; ``count`` items are attributed to it."""
+        if not self.enabled:
+            yield
+            return
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+        rss_before = max_rss_bytes()
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            stats = self._stats(name)
+            stats["wall_s"] += time.perf_counter() - wall
+            stats["cpu_s"] += time.process_time() - cpu
+            rss_after = max_rss_bytes()
+            stats["process_max_rss_bytes"] = rss_after
+            if rss_after is not None:
+                stats["max_rss_growth_bytes"] = (stats["max_rss_growth_bytes"] or 0) + rss_after - rss_before
+            if self.trace_memory:
+                peak = tracemalloc.get_traced_memory()[1] - baseline
+                stats["peak_traced_bytes"] = max(stats["peak_traced_bytes"] or 0, peak)
+            stats["calls"] += 1
+            stats["count"] += count
+
+    def add(self, name: str, wall: float = 0.0, cpu: float = 0.0, count: int = 0) -> None:
+        """Fold externally measured time into phase ``name``."""
+        if not self.enabled:
+            return
+        stats = self._stats(name)
+        stats["wall_s"] += wall
+        stats["cpu_s"] += cpu
+        stats["calls"] += 1
+        stats["count"] += count
+
+    def count(self, name: str, value: int = 1) -> None:
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def detail(self, section: str, key: str, values: Dict) -> None:
+        """Record per-item metrics such as the render time of each table."""
+        if self.enabled:
+            self.details.setdefault(section, {})[key] = values
+
+    def report(self) -> Dict:
+        total = {
+            "wall_s": time.perf_counter() - self._started_wall,
+            "cpu_s": time.process_time() - self._started_cpu,
+            "process_max_rss_bytes": max_rss_bytes(),
+            "peak_traced_bytes": tracemalloc.get_traced_memory()[1] if self.trace_memory else None,
+        }
+        phases = {
+            name: {key: round(value, 6) if isinstance(value, float) else value for key, value in stats.items()}
+            for name, stats in self.phases.items()
+        }
+        return {
+            "version": REPORT_VERSION,
+            "tool": self.tool,
+            "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "pid": os.getpid(),
+            "total": {key: round(value, 6) if isinstance(value, float) else value for key, value in total.items()},
+            "phases": phases,
+            "counters": dict(sorted(self.counters.items())),
+            "details": self.details,
+        }
+
+    def write(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.report(), indent=2) + "\n", encoding="utf-8")
+
+
+@contextmanager
+def maybe_cprofile(path: Optional[Path]):
+    """Run the body under :mod:`cProfile` and dump ``pstats`` to ``path`` (when given)."""
+    if path is None:
+        yield
+        return
+    profile = cProfile.Profile()
+    profile.enable()
+    try:
+        yield
+    finally:
+        profile.disable()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        profile.dump_stats(str(path))
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""Compare the schemas of two MySQL dump snapshots.
+
+Both dumps are parsed into the generator's schema IR (through the
+parsed-schema cache, so a snapshot that was seen before costs almost
+nothing) and compared by hash: every table is reduced to a SHA-256 of its
+structure, so unchanged tables are skipped after a single comparison, and
+only within altered tables are columns hashed and diffed field by field.
+Table options such as ``AUTO_INCREMENT=`` counters are not part of the
+hash, so a fresh export of an unchanged schema reports no changes.
+
+The report lists added, dropped and altered tables, with column, type,
+nullability, primary-key, index and foreign-key changes, as JSON and
+optionally markdown.  Its ``regenerate`` list names the tables whose
+entity classes can change (altered and added tables, plus tables whose
+foreign keys point at a table whose key changed), and
+``generate_missing_models.py --schema-diff`` re-renders just those.
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import sys
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, List
+
+from sql_dump import Column, TableSchema, load_schema, load_schema_cached, table_hash
+
+ROOT = Path(__file__).resolve().parents[1]
+SQL_PATH = ROOT / "YASGMP.sql"
+DIFF_PATH = ROOT / "reports" / "schema-diff.json"
+REPORT_VERSION = 1
+
+COLUMN_FIELDS = ("sql_type", "nullable", "clr_type", "max_length", "precision", "definition")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("old", type=Path, help="Previous dump snapshot.")
+    parser.add_argument("new", type=Path, nargs="?", default=SQL_PATH, help="New dump snapshot (default: YASGMP.sql).")
+    parser.add_argument("--output", type=Path, default=DIFF_PATH, help="Where to write the JSON report.")
+    parser.add_argument("--markdown", type=Path, metavar="PATH", help="Also write a markdown summary to PATH.")
+    parser.add_argument(
+        "--table-list",
+        type=Path,
+        metavar="PATH",
+        help="Also write the tables to regenerate, one per line.",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Parse the dumps without the parsed-schema cache.")
+    parser.add_argument("--fail-on-change", action="store_true", help="Exit with 1 when the schemas differ.")
+    return parser.parse_args()
+
+
+# Hashing the reprs of the frozen IR (as sql_dump.table_hash does) avoids
+# dataclasses.asdict(), which deep-copies every field and dominated the run time.
+def column_hash(column: Column) -> str:
+    return hashlib.sha256(repr(column).encode("utf-8")).hexdigest()
+
+
+def column_hashes(table: TableSchema) -> Dict[str, str]:
+    return {column.name: column_hash(column) for column in table.columns}
+
+
+def diff_named(old_items, new_items) -> Dict[str, List]:
+    """Added, dropped and altered entries of two sequences of named dataclasses."""
+    old_map = {item.name: asdict(item) for item in old_items}
+    new_map = {item.name: asdict(item) for item in new_items}
+    result = {
+        "added": [new_map[name] for name in new_map if name not in old_map],
+        "dropped": [old_map[name] for name in old_map if name not in new_map],
+        "altered": [
+            {"name": name, "old": old_map[name], "new": new_map[name]}
+            for name in new_map
+            if name in old_map and old_map[name] != new_map[name]
+        ],
+    }
+    return {key: value for key, value in result.items() if value}
+
+
+def diff_columns(old: TableSchema, new: TableSchema, old_hashes: Dict[str, str], new_hashes: Dict[str, str]) -> Dict:
+    """Added, dropped and altered columns; only columns whose hashes differ are compared."""
+    old_columns = {column.name: column for column in old.columns}
+    new_columns = {column.name: column for column in new.columns}
+    altered = []
+    for name, column in new_columns.items():
+        previous = old_columns.get(name)
+        if previous is None or old_hashes[name] == new_hashes[name]:
+            continue
+        changes = {
+            field: [getattr(previous, field), getattr(column, field)]
+            for field in COLUMN_FIELDS
+            if getattr(previous, field) != getattr(column, field)
+        }
+        altered.append({"column": name, "changes": changes})
+    result = {
+        "added": [{"column": name, "sql_type": column.sql_type, "nullable": column.nullable}
+                  for name, column in new_columns.items() if name not in old_columns],
+        "dropped": [name for name in old_columns if name not in new_columns],
+        "altered": altered,
+    }
+    return {key: value for key, value in result.items() if value}
+
+
+def diff_table(old: TableSchema, new: TableSchema) -> Dict:
+    old_hashes, new_hashes = column_hashes(old), column_hashes(new)
+    entry: Dict = {"table": new.name}
+    columns = diff_columns(old, new, old_hashes, new_hashes)
+    if columns:
+        entry["columns"] = columns
+    old_order = [name for name in (column.name for column in old.columns) if name in new_hashes]
+    new_order = [name for name in (column.name for column in new.columns) if name in old_hashes]
+    if old_order != new_order:
+        entry["column_order_changed"] = True
+    if old.primary_key != new.primary_key:
+        entry["primary_key"] = [list(old.primary_key), list(new.primary_key)]
+    for key, old_items, new_items in (
+        ("indexes", old.indexes, new.indexes),
+        ("foreign_keys", old.foreign_keys, new.foreign_keys),
+    ):
+        changes = diff_named(old_items, new_items)
+        if changes:
+            entry[key] = changes
+    return entry
+
+
+def regenerate_tables(
+    old_schema: Dict[str, TableSchema], new_schema: Dict[str, TableSchema], changed: List[str]
+) -> List[str]:
+    """Tables whose generated entity classes can differ between the snapshots.
+
+    Besides the added and altered tables themselves, a dependent table's
+    navigation properties are rendered from its principal's primary key, so
+    tables referencing a principal that appeared, disappeared or changed its
+    key are included as well.
+    """
+    key_changed = {
+        name
+        for name in set(old_schema) | set(new_schema)
+        if name not in old_schema
+        or name not in new_schema
+        or old_schema[name].primary_key != new_schema[name].primary_key
+    }
+    selected = set(changed)
+    for name, table in new_schema.items():
+        if any(fk.ref_table in key_changed for fk in table.foreign_keys):
+            selected.add(name)
+    return sorted(selected)
+
+
+def compare_schemas(old_schema: Dict[str, TableSchema], new_schema: Dict[str, TableSchema]) -> Dict:
+    """Build the diff report for two parsed schemas."""
+    added = sorted(name for name in new_schema if name not in old_schema)
+    dropped = sorted(name for name in old_schema if name not in new_schema)
+    altered = []
+    unchanged = 0
+    for name in sorted(new_schema):
+        if name not in old_schema:
+            continue
+        hashes = [table_hash(old_schema[name]), table_hash(new_schema[name])]
+        if hashes[0] == hashes[1]:
+            unchanged += 1
+            continue
+        entry = diff_table(old_schema[name], new_schema[name])
+        entry["hashes"] = hashes
+        altered.append(entry)
+    return {
+        "version": REPORT_VERSION,
+        "summary": {
+            "old_tables": len(old_schema),
+            "new_tables": len(new_schema),
+            "added": len(added),
+            "dropped": len(dropped),
+            "altered": len(altered),
+            "unchanged": unchanged,
+        },
+        "added_tables": added,
+        "dropped_tables": dropped,
+        "altered_tables": altered,
+        "regenerate": regenerate_tables(old_schema, new_schema, added + [entry["table"] for entry in altered]),
+    }
+
+
+def _format_value(value) -> str:
+    if isinstance(value, (list, tuple)):
+        return "(" + ", ".join(str(item) for item in value) + ")"
+    return "NULL" if value is None else str(value)
+
+
+def _describe(item: Dict) -> str:
+    """One-line rendering of an index or foreign key from :func:`diff_named`."""
+    if "kind" in item:
+        return f"{item['kind']} {_format_value(item['columns'])}"
+    text = f"{_format_value(item['columns'])} → {item['ref_table']} {_format_value(item['ref_columns'])}"
+    for action in ("on_delete", "on_update"):
+        if item[action]:
+            text += f" {action.replace('_', ' ').upper()} {item[action]}"
+    return text
+
+
+def _named_lines(kind: str, changes: Dict) -> List[str]:
+    lines = []
+    for item in changes.get("added", ()):
+        lines.append(f"- {kind} `{item['name']}` added: {_describe(item)}")
+    for item in changes.get("dropped", ()):
+        lines.append(f"- {kind} `{item['name']}` dropped")
+    for item in changes.get("altered", ()):
+        lines.append(f"- {kind} `{item['name']}` changed: {_describe(item['old'])} ⇒ {_describe(item['new'])}")
+    return lines
+
+
+def render_markdown(report: Dict, old_path: Path, new_path: Path) -> str:
+    summary = report["summary"]
+    lines = [
+        "# Schema diff",
+        "",
+        f"`{old_path.name}` ({summary['old_tables']} tables) → `{new_path.name}` ({summary['new_tables']} tables)",
+        "",
+        "| Added | Dropped | Altered | Unchanged |",
+        "| --- | --- | --- | --- |",
+        f"| {summary['added']} | {summary['dropped']} | {summary['altered']} | {summary['unchanged']} |",
+        "",
+    ]
+    for title, names in (("Added tables", report["added_tables"]), ("Dropped tables", report["dropped_tables"])):
+        if names:
+            lines.extend([f"## {title}", ""])
+            lines.extend(f"- `{name}`" for name in names)
+            lines.append("")
+    for entry in report["altered_tables"]:
+        lines.extend([f"## `{entry['table']}`", ""])
+        columns = entry.get("columns", {})
+        for column in columns.get("added", ()):
+            nullable = "NULL" if column["nullable"] else "NOT NULL"
+            lines.append(f"- column `{column['column']}` added: {column['sql_type']} {nullable}")
+        for name in columns.get("dropped", ()):
+            lines.append(f"- column `{name}` dropped")
+        for column in columns.get("altered", ()):
+            changes = column["changes"]
+            shown = {field: values for field, values in changes.items() if field != "definition"} or {
+                "definition": changes["definition"]
+            }
+            details = "; ".join(
+                f"{field} {_format_value(old)} → {_format_value(new)}" for field, (old, new) in shown.items()
+            )
+            lines.append(f"- column `{column['column']}` altered: {details}")
+        if entry.get("column_order_changed"):
+            lines.append("- column order changed")
+        if "primary_key" in entry:
+            old, new = entry["primary_key"]
+            lines.append(f"- primary key {_format_value(old)} → {_format_value(new)}")
+        lines.extend(_named_lines("index", entry.get("indexes", {})))
+        lines.extend(_named_lines("foreign key", entry.get("foreign_keys", {})))
+        lines.append("")
+    return "\n".join(lines)
+
+
+def load(path: Path, no_cache: bool) -> Dict[str, TableSchema]:
+    return load_schema(path) if no_cache else load_schema_cached(path)
+
+
+def main() -> None:
+    args = parse_args()
+    try:
+        old_schema = load(args.old, args.no_cache)
+        new_schema = load(args.new, args.no_cache)
+    except OSError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        sys.exit(1)
+    report = compare_schemas(old_schema, new_schema)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    if args.markdown:
+        args.markdown.parent.mkdir(parents=True, exist_ok=True)
+        args.markdown.write_text(render_markdown(report, args.old, args.new), encoding="utf-8")
+    if args.table_list:
+        args.table_list.parent.mkdir(parents=True, exist_ok=True)
+        args.table_list.write_text("".join(f"{name}\n" for name in report["regenerate"]), encoding="utf-8")
+
+    summary = report["summary"]
+    print(
+        f"{summary['added']} added, {summary['dropped']} dropped, {summary['altered']} altered, "
+        f"{summary['unchanged']} unchanged tables; {len(report['regenerate'])} to regenerate -> {args.output}",
+        file=sys.stdout,
+    )
+    if args.fail_on_change and (summary["added"] or summary["dropped"] or summary["altered"]):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
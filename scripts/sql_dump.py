@@ -0,0 +1,865 @@
+#!/usr/bin/env python3
+"""Streaming reader for MySQL dumps such as ``YASGMP.sql``.
+
+The dump is consumed in fixed-size chunks and split into statements with a
+quote-aware scanner, so memory use stays flat regardless of dump size.
+Only ``CREATE TABLE`` statements are buffered and parsed; every other
+statement (``INSERT`` payloads, ``SET`` directives, locks, ...) is skipped
+without being materialized.  Parsed tables are returned as a small
+structured IR (:class:`TableSchema` / :class:`Column`) that the model
+generator and related tooling share.  :func:`iter_dump` additionally
+decodes ``INSERT`` rows in place for tools that need the data itself.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from dataclasses import asdict, dataclass
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+CHUNK_SIZE = 1 << 20
+CACHE_VERSION = 1
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parents[1] / ".cache" / "sql_dump"
+
+# Unquoted text and complete quoted strings; stops at ``;`` or at a quote
+# whose closing delimiter is not in the buffer yet.
+_BALANCED_RUN = re.compile(
+    rb"[^;'\"`]*"
+    rb"(?:(?:'[^'\\]*(?:\\.[^'\\]*)*'"
+    rb"|\"[^\"\\]*(?:\\.[^\"\\]*)*\""
+    rb"|`[^`]*`)"
+    rb"[^;'\"`]*)*",
+    re.S,
+)
+_QUOTE_SPECIALS = {
+    ord("'"): re.compile(rb"[\\']"),
+    ord('"'): re.compile(rb'[\\"]'),
+    ord("`"): re.compile(rb"`"),
+}
+_SEMICOLON = ord(";")
+_BACKSLASH = ord("\\")
+
+_CREATE_TABLE_PREFIX = re.compile(rb"CREATE\s+TABLE\b", re.I)
+_INSERT_PREFIX = re.compile(rb"(?:INSERT|REPLACE)\b", re.I)
+_INSERT_HEADER = re.compile(
+    rb"(?:INSERT|REPLACE)\s+(?:(?:LOW_PRIORITY|DELAYED|HIGH_PRIORITY|IGNORE)\s+)*(?:INTO\s+)?"
+    rb"(?:`(?P<quoted>(?:[^`]|``)+)`|(?P<bare>\w+))\s*"
+    rb"(?:\((?P<columns>[^)]*)\)\s*)?VALUES?\s*",
+    re.I,
+)
+_MAX_INSERT_HEADER = 1 << 16
+# One parenthesized row (with its leading separator); strings may contain
+# parentheses and escaped quotes.
+_ROW_TUPLE = re.compile(rb"\s*,?\s*\(([^'()]*(?:'[^'\\]*(?:\\.[^'\\]*)*'[^'()]*)*)\)", re.S)
+_ROW_VALUE = re.compile(
+    rb"\s*(?:"
+    rb"(?:_(\w+)\s*)?(')([^'\\]*(?:(?:\\.|'')[^'\\]*)*)'"  # [_charset] 'string'
+    rb"|([xXbB])'([0-9A-Fa-f]*)'"  # X'hex' / b'bits'
+    rb"|([^,']+?)"  # NULL, numbers, 0xhex, bare words
+    rb")\s*(?:,|$)",
+    re.S,
+)
+_STRING_ESCAPE = re.compile(rb"\\(.)|''", re.S)
+_ESCAPES = {
+    b"0": b"\0",
+    b"b": b"\b",
+    b"n": b"\n",
+    b"r": b"\r",
+    b"t": b"\t",
+    b"Z": b"\x1a",
+    b"%": b"\\%",
+    b"_": b"\\_",
+}
+_CREATE_TABLE_HEADER = re.compile(
+    r"CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(?:`(?P<quoted>(?:[^`]|``)+)`|(?P<bare>\w+))\s*\(",
+    re.I,
+)
+_COLUMN_NAME = re.compile(r"`(?P<name>(?:[^`]|``)+)`\s*")
+_COLUMN_TYPE = re.compile(
+    r"(?P<base>\w+)"
+    r"(?P<args>\s*\((?:'(?:[^'\\]|\\.|'')*'|[^)'])*\))?"
+    r"(?P<modifiers>(?:\s+(?:unsigned|signed|zerofill)\b)*)",
+    re.I,
+)
+_PRIMARY_KEY = re.compile(r"PRIMARY\s+KEY\b[^(]*\((?P<columns>.*)\)", re.I | re.S)
+_INDEX = re.compile(
+    r"(?:(?P<kind>UNIQUE|FULLTEXT|SPATIAL)\s+(?:KEY|INDEX)?|KEY|INDEX)\s*"
+    r"(?:`(?P<name>(?:[^`]|``)+)`\s*)?(?:USING\s+\w+\s*)?\(",
+    re.I,
+)
+_FOREIGN_KEY = re.compile(
+    r"(?:CONSTRAINT\s+(?:`(?P<name>(?:[^`]|``)+)`\s*)?)?FOREIGN\s+KEY\s*(?:`(?:[^`]|``)+`\s*)?\(",
+    re.I,
+)
+_REFERENCES = re.compile(r"\s*REFERENCES\s+(?:`(?P<quoted>(?:[^`]|``)+)`|(?P<bare>\w+))\s*\(", re.I)
+_REFERENTIAL_ACTION = re.compile(
+    r"ON\s+(?P<event>DELETE|UPDATE)\s+(?P<action>RESTRICT|CASCADE|SET\s+NULL|SET\s+DEFAULT|NO\s+ACTION)",
+    re.I,
+)
+_NOT_NULL = re.compile(r"\bNOT\s+NULL\b", re.I)
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.|\"\")*\"", re.S)
+
+
+def normalize_type(sql_type: str):
+    t = sql_type.lower()
+    precision = None
+    max_length = None
+    clr_type = 'string'
+    if '(' in t:
+        base, rest = t.split('(', 1)
+        rest = rest.split(')', 1)[0]
+        if ',' in rest:
+            try:
+                precision = tuple(int(x.strip()) for x in rest.split(','))
+            except ValueError:
+                precision = None
+        else:
+            try:
+                max_length = int(rest.strip())
+            except ValueError:
+                max_length = None
+        t = base
+    if t.strip().startswith('unsigned'):
+        t = t.strip().split(' ', 1)[1]
+    if 'tinyint(1' in sql_type.lower():
+        clr_type = 'bool'
+    elif 'bigint' in t:
+        clr_type = 'long'
+    elif t.startswith('int'):
+        clr_type = 'int'
+    elif t.startswith('smallint'):
+        clr_type = 'short'
+    elif t.startswith(('decimal', 'numeric')):
+        clr_type = 'decimal'
+    elif t.startswith('double'):
+        clr_type = 'double'
+    elif t.startswith('float'):
+        clr_type = 'double'
+    elif t.startswith(('datetime', 'timestamp', 'date')):
+        clr_type = 'DateTime'
+    elif t.startswith('time'):
+        clr_type = 'TimeSpan'
+    elif 'blob' in t or 'binary' in t:
+        clr_type = 'byte[]'
+    else:
+        clr_type = 'string'
+    return clr_type, max_length, precision
+
+
+@dataclass(frozen=True)
+class Column:
+    """A single column definition from a ``CREATE TABLE`` statement."""
+
+    name: str
+    sql_type: str
+    definition: str
+    nullable: bool
+    clr_type: str
+    max_length: Optional[int] = None
+    precision: Optional[Tuple[int, ...]] = None
+
+
+@dataclass(frozen=True)
+class Index:
+    """A secondary ``KEY`` / ``UNIQUE KEY`` / ``FULLTEXT`` / ``SPATIAL`` index."""
+
+    name: str
+    columns: Tuple[str, ...]
+    kind: str = "index"
+
+    @property
+    def unique(self) -> bool:
+        return self.kind == "unique"
+
+
+@dataclass(frozen=True)
+class ForeignKey:
+    """A ``FOREIGN KEY ... REFERENCES`` constraint."""
+
+    name: str
+    columns: Tuple[str, ...]
+    ref_table: str
+    ref_columns: Tuple[str, ...]
+    on_delete: Optional[str] = None
+    on_update: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class TableSchema:
+    """Structured view of a ``CREATE TABLE`` statement."""
+
+    name: str
+    columns: Tuple[Column, ...]
+    primary_key: Tuple[str, ...]
+    ddl: str
+    indexes: Tuple[Index, ...] = ()
+    foreign_keys: Tuple[ForeignKey, ...] = ()
+
+    def column(self, name: str) -> Optional[Column]:
+        for column in self.columns:
+            if column.name == name:
+                return column
+        return None
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "TableSchema":
+        columns = []
+        for column in data["columns"]:
+            column = dict(column)
+            if column.get("precision") is not None:
+                column["precision"] = tuple(column["precision"])
+            columns.append(Column(**column))
+        indexes = tuple(
+            Index(name=index["name"], columns=tuple(index["columns"]), kind=index["kind"])
+            for index in data.get("indexes", ())
+        )
+        foreign_keys = tuple(
+            ForeignKey(
+                name=fk["name"],
+                columns=tuple(fk["columns"]),
+                ref_table=fk["ref_table"],
+                ref_columns=tuple(fk["ref_columns"]),
+                on_delete=fk.get("on_delete"),
+                on_update=fk.get("on_update"),
+            )
+            for fk in data.get("foreign_keys", ())
+        )
+        return cls(
+            name=data["name"],
+            columns=tuple(columns),
+            primary_key=tuple(data["primary_key"]),
+            ddl=data["ddl"],
+            indexes=indexes,
+            foreign_keys=foreign_keys,
+        )
+
+
+class RowBatch(NamedTuple):
+    """A run of rows from one ``INSERT`` statement.
+
+    ``columns`` is ``None`` when the statement has no explicit column list,
+    in which case values follow the ``CREATE TABLE`` column order.
+    """
+
+    table: str
+    columns: Optional[Tuple[str, ...]]
+    rows: List[tuple]
+
+
+def _unescape(match: "re.Match[bytes]") -> bytes:
+    char = match.group(1)
+    if char is None:
+        return b"'"
+    return _ESCAPES.get(char, char)
+
+
+def decode_row(body: bytes) -> tuple:
+    """Convert the inside of one ``(...)`` row tuple into Python values.
+
+    Strings become ``str`` (``bytes`` for ``_binary`` and hex/``X''``
+    literals), integers ``int``, other numbers :class:`~decimal.Decimal`
+    (exactly as written, so ``DECIMAL`` values lose nothing) and ``NULL``
+    ``None``.
+    """
+    values = []
+    append = values.append
+    for charset, quote, raw, prefix, digits, other in _ROW_VALUE.findall(body):
+        if quote:
+            if b"\\" in raw:
+                # mysqldump mostly escapes quotes only; avoid the regex for those.
+                plain = raw.replace(b"\\'", b"'")
+                raw = _STRING_ESCAPE.sub(_unescape, raw) if b"\\" in plain or b"''" in raw else plain
+            elif b"''" in raw:
+                raw = raw.replace(b"''", b"'")
+            append(raw if charset == b"binary" else raw.decode("utf-8", errors="replace"))
+        elif prefix:
+            append(bytes.fromhex(digits.decode("ascii")) if prefix in b"xX" else int(digits or b"0", 2))
+        elif other == b"NULL":
+            append(None)
+        else:
+            try:
+                append(int(other))
+            except ValueError:
+                append(_decode_literal(other))
+    return tuple(values)
+
+
+def _decode_literal(literal: bytes):
+    try:
+        return Decimal(literal.decode("ascii"))
+    except (InvalidOperation, UnicodeDecodeError):
+        pass
+    if literal[:2] in (b"0x", b"0X"):
+        try:
+            return bytes.fromhex(literal[2:].decode("ascii"))
+        except ValueError:
+            pass
+    return literal.decode("utf-8", errors="replace")
+
+
+class DumpScanner:
+    """Chunked, quote-aware statement scanner over a binary dump stream."""
+
+    def __init__(self, handle: BinaryIO, chunk_size: int = CHUNK_SIZE) -> None:
+        self._handle = handle
+        self._chunk_size = chunk_size
+        self._buf = b""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, minimum: int = 1) -> bool:
+        """Ensure at least ``minimum`` unread bytes are buffered (unless at EOF)."""
+        while len(self._buf) - self._pos < minimum and not self._eof:
+            chunk = self._handle.read(self._chunk_size)
+            if not chunk:
+                self._eof = True
+                break
+            self._buf = self._buf[self._pos:] + chunk
+            self._pos = 0
+        return len(self._buf) - self._pos >= minimum
+
+    def _skip_separators(self) -> bool:
+        """Skip whitespace, comments and empty statements; return False at EOF."""
+        while True:
+            if not self._fill():
+                return False
+            buf, pos = self._buf, self._pos
+            while pos < len(buf) and buf[pos] in b" \t\r\n;":
+                pos += 1
+            self._pos = pos
+            if pos == len(buf):
+                continue
+            if not self._fill(2):
+                return True
+            head = self._buf[self._pos:self._pos + 2]
+            if head == b"--" or head[:1] == b"#":
+                self._skip_until(b"\n")
+            elif head == b"/*":
+                self._skip_until(b"*/")
+            else:
+                return True
+
+    def _skip_until(self, marker: bytes) -> None:
+        while True:
+            index = self._buf.find(marker, self._pos)
+            if index >= 0:
+                self._pos = index + len(marker)
+                return
+            # Keep a tail in case the marker straddles the chunk boundary.
+            self._pos = max(self._pos, len(self._buf) - len(marker) + 1)
+            if not self._fill(len(self._buf) - self._pos + 1):
+                self._pos = len(self._buf)
+                return
+
+    def _consume_statement(self, capture: Optional[List[bytes]]) -> None:
+        """Advance past the current statement's terminating ``;``.
+
+        When ``capture`` is a list the statement bytes are appended to it;
+        otherwise they are discarded chunk by chunk.
+        """
+        quote: Optional[int] = None
+        escaped = False
+        while True:
+            if not self._fill():
+                return
+            buf, pos = self._buf, self._pos
+            start = pos
+            if escaped:
+                pos += 1
+                escaped = False
+            while True:
+                if quote is None:
+                    pos = _BALANCED_RUN.match(buf, pos).end()
+                    if pos == len(buf):
+                        break
+                    char = buf[pos]
+                    pos += 1
+                    if char == _SEMICOLON:
+                        if capture is not None:
+                            capture.append(buf[start:pos - 1])
+                        self._pos = pos
+                        return
+                    # A string that continues past the buffered data.
+                    quote = char
+                else:
+                    match = _QUOTE_SPECIALS[quote].search(buf, pos)
+                    if match is None:
+                        pos = len(buf)
+                        break
+                    pos = match.end()
+                    if buf[pos - 1] == _BACKSLASH:
+                        if pos == len(buf):
+                            escaped = True
+                            break
+                        pos += 1
+                    else:
+                        quote = None
+                if pos >= len(buf):
+                    break
+            if capture is not None:
+                capture.append(buf[start:pos])
+            self._pos = pos
+
+    def statements(self, want=None) -> Iterator[Tuple[bool, Optional[bytes]]]:
+        """Yield ``(wanted, statement)`` for each statement in the stream.
+
+        ``want`` receives the first bytes of the statement and decides whether
+        it should be buffered; unwanted statements are yielded as ``None``
+        after being skipped.
+        """
+        while self._skip_separators():
+            self._fill(64)
+            head = self._buf[self._pos:self._pos + 64]
+            if want is not None and want(head):
+                parts: List[bytes] = []
+                self._consume_statement(parts)
+                yield True, b"".join(parts)
+            else:
+                self._consume_statement(None)
+                yield False, None
+
+    def _skip_whitespace(self) -> bool:
+        """Advance past whitespace; return ``False`` at end of input."""
+        while self._fill():
+            buf, pos = self._buf, self._pos
+            while pos < len(buf) and buf[pos] in b" \t\r\n":
+                pos += 1
+            self._pos = pos
+            if pos < len(buf):
+                return True
+        return False
+
+    def _insert_header(self) -> Optional["re.Match[bytes]"]:
+        """Match the ``INSERT ... VALUES`` header at the current position."""
+        size = 256
+        while True:
+            self._fill(size)
+            match = _INSERT_HEADER.match(self._buf, self._pos)
+            available = len(self._buf) - self._pos
+            if match or self._eof or available < size or size >= _MAX_INSERT_HEADER:
+                return match
+            size *= 4
+
+    def _insert_rows(self, table: str, columns: Optional[Tuple[str, ...]], batch_size: int) -> Iterator[RowBatch]:
+        """Parse row tuples up to the end of the current ``INSERT`` statement."""
+        rows: List[tuple] = []
+        match_row = _ROW_TUPLE.match
+        while True:
+            buf, pos = self._buf, self._pos
+            match = match_row(buf, pos)
+            while match is not None:
+                rows.append(decode_row(match.group(1)))
+                pos = match.end()
+                if len(rows) >= batch_size:
+                    self._pos = pos
+                    yield RowBatch(table, columns, rows)
+                    rows = []
+                match = match_row(buf, pos)
+            self._pos = pos
+            if not self._skip_whitespace():
+                break
+            char = self._buf[self._pos]
+            if char == 0x28 or char == 0x2C:  # "(" or ","
+                # The row straddles the chunk boundary; read more and retry.
+                if self._eof:
+                    raise ValueError(f"Unterminated row in INSERT for table {table!r}")
+                self._fill(len(self._buf) - self._pos + 1)
+            elif char == _SEMICOLON:
+                self._pos += 1
+                break
+            else:
+                # Trailing clauses such as ON DUPLICATE KEY UPDATE.
+                self._consume_statement(None)
+                break
+        if rows:
+            yield RowBatch(table, columns, rows)
+
+    def events(
+        self, tables: Optional[Iterable[str]] = None, batch_size: int = 1000, exclude: Optional[Iterable[str]] = None
+    ):
+        """Yield :class:`TableSchema` for each ``CREATE TABLE`` and :class:`RowBatch` for ``INSERT`` rows.
+
+        ``tables`` limits row extraction to the named tables and ``exclude``
+        drops tables from it; ``INSERT`` statements for the other tables are
+        skipped without being parsed.
+        """
+        wanted = set(tables) if tables is not None else None
+        excluded = set(exclude or ())
+        while self._skip_separators():
+            self._fill(64)
+            head = self._buf[self._pos:self._pos + 64]
+            if _CREATE_TABLE_PREFIX.match(head):
+                parts: List[bytes] = []
+                self._consume_statement(parts)
+                table = parse_create_table(b"".join(parts).decode("utf-8", errors="ignore"))
+                if table is not None:
+                    yield table
+                continue
+            if _INSERT_PREFIX.match(head):
+                header = self._insert_header()
+                if header is not None:
+                    name = header.group("quoted")
+                    name = (name.replace(b"``", b"`") if name is not None else header.group("bare")).decode(
+                        "utf-8", errors="ignore"
+                    )
+                    if (wanted is None or name in wanted) and name not in excluded:
+                        columns = header.group("columns")
+                        column_names = (
+                            split_key_columns(columns.decode("utf-8", errors="ignore")) if columns is not None else None
+                        )
+                        self._pos = header.end()
+                        yield from self._insert_rows(name, column_names, batch_size)
+                        continue
+            self._consume_statement(None)
+
+
+def _is_create_table(head: bytes) -> bool:
+    return _CREATE_TABLE_PREFIX.match(head) is not None
+
+
+def _unquote_identifier(name: str) -> str:
+    name = name.strip().strip("`")
+    return name.replace("``", "`")
+
+
+def _matching_paren(text: str, open_index: int) -> int:
+    depth = 0
+    index = open_index
+    length = len(text)
+    while index < length:
+        char = text[index]
+        if char in "'\"`":
+            index += 1
+            while index < length and text[index] != char:
+                if text[index] == "\\" and char != "`":
+                    index += 1
+                index += 1
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth == 0:
+                return index
+        index += 1
+    return -1
+
+
+def split_definitions(body: str) -> List[str]:
+    """Split a ``CREATE TABLE`` body on top-level commas."""
+    items: List[str] = []
+    depth = 0
+    start = 0
+    index = 0
+    length = len(body)
+    while index < length:
+        char = body[index]
+        if char in "'\"`":
+            index += 1
+            while index < length and body[index] != char:
+                if body[index] == "\\" and char != "`":
+                    index += 1
+                index += 1
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            items.append(body[start:index].strip())
+            start = index + 1
+        index += 1
+    tail = body[start:].strip()
+    if tail:
+        items.append(tail)
+    return items
+
+
+def split_key_columns(columns: str) -> Tuple[str, ...]:
+    """Return the column names from a key column list such as ``(`a`,`b`(10) DESC)``."""
+    names = []
+    for part in split_definitions(columns):
+        part = part.strip()
+        if not part:
+            continue
+        if part.startswith("`"):
+            match = _COLUMN_NAME.match(part)
+            names.append(_unquote_identifier(match.group("name")) if match else part.strip("` "))
+        else:
+            names.append(re.split(r"[\s(]", part, 1)[0])
+    return tuple(names)
+
+
+def _paren_group(text: str, open_index: int) -> Tuple[str, int]:
+    """Return the contents of the parenthesized group at ``open_index`` and the index after it."""
+    close_index = _matching_paren(text, open_index)
+    if close_index < 0:
+        return text[open_index + 1:], len(text)
+    return text[open_index + 1:close_index], close_index + 1
+
+
+def parse_index(item: str) -> Optional[Index]:
+    match = _INDEX.match(item)
+    if not match:
+        return None
+    columns, _ = _paren_group(item, match.end() - 1)
+    names = split_key_columns(columns)
+    name = match.group("name")
+    name = name.replace("``", "`") if name is not None else "_".join(names)
+    kind = (match.group("kind") or "index").lower()
+    return Index(name=name, columns=names, kind=kind)
+
+
+def parse_foreign_key(item: str) -> Optional[ForeignKey]:
+    match = _FOREIGN_KEY.match(item)
+    if not match:
+        return None
+    columns, end = _paren_group(item, match.end() - 1)
+    ref = _REFERENCES.match(item, end)
+    if not ref:
+        return None
+    ref_table = ref.group("quoted")
+    ref_table = ref_table.replace("``", "`") if ref_table is not None else ref.group("bare")
+    ref_columns, end = _paren_group(item, ref.end() - 1)
+    actions = {
+        action.group("event").lower(): re.sub(r"\s+", " ", action.group("action").upper())
+        for action in _REFERENTIAL_ACTION.finditer(item, end)
+    }
+    names = split_key_columns(columns)
+    name = match.group("name")
+    name = name.replace("``", "`") if name is not None else "fk_" + "_".join(names)
+    return ForeignKey(
+        name=name,
+        columns=names,
+        ref_table=ref_table,
+        ref_columns=split_key_columns(ref_columns),
+        on_delete=actions.get("delete"),
+        on_update=actions.get("update"),
+    )
+
+
+def parse_column(item: str) -> Optional[Column]:
+    match = _COLUMN_NAME.match(item)
+    if not match:
+        return None
+    name = _unquote_identifier(match.group("name"))
+    definition = item[match.end():].strip()
+    type_match = _COLUMN_TYPE.match(definition)
+    sql_type = type_match.group(0).strip() if type_match else definition.split(" ", 1)[0]
+    nullable = _NOT_NULL.search(_STRING_LITERAL.sub("''", definition)) is None
+    clr_type, max_length, precision = normalize_type(sql_type)
+    return Column(
+        name=name,
+        sql_type=sql_type,
+        definition=definition,
+        nullable=nullable,
+        clr_type=clr_type,
+        max_length=max_length,
+        precision=precision,
+    )
+
+
+def table_hash(table: TableSchema) -> str:
+    """SHA-256 of the table's parsed structure.
+
+    The raw DDL is left out, so table options such as ``AUTO_INCREMENT=``
+    counters do not count as changes.  The IR is made of frozen dataclasses
+    over str/int/bool/None/tuple fields, whose reprs are deterministic.
+    """
+    structure = (table.columns, table.primary_key, table.indexes, table.foreign_keys)
+    return hashlib.sha256(repr(structure).encode("utf-8")).hexdigest()
+
+
+def parse_create_table(statement: str) -> Optional[TableSchema]:
+    """Parse a single ``CREATE TABLE`` statement into a :class:`TableSchema`."""
+    header = _CREATE_TABLE_HEADER.search(statement)
+    if not header:
+        return None
+    name = header.group("quoted")
+    name = name.replace("``", "`") if name is not None else header.group("bare")
+    open_index = header.end() - 1
+    close_index = _matching_paren(statement, open_index)
+    if close_index < 0:
+        return None
+    body = statement[open_index + 1:close_index]
+
+    columns: List[Column] = []
+    primary_key: Tuple[str, ...] = ()
+    indexes: List[Index] = []
+    foreign_keys: List[ForeignKey] = []
+    for item in split_definitions(body):
+        if item.startswith("`"):
+            column = parse_column(item)
+            if column is not None:
+                columns.append(column)
+            continue
+        pk_match = _PRIMARY_KEY.match(item)
+        if pk_match:
+            primary_key = split_key_columns(_paren_group(item, pk_match.start("columns") - 1)[0])
+            continue
+        foreign_key = parse_foreign_key(item)
+        if foreign_key is not None:
+            foreign_keys.append(foreign_key)
+            continue
+        index = parse_index(item)
+        if index is not None:
+            indexes.append(index)
+    return TableSchema(
+        name=name,
+        columns=tuple(columns),
+        primary_key=primary_key,
+        ddl=statement.strip(),
+        indexes=tuple(indexes),
+        foreign_keys=tuple(foreign_keys),
+    )
+
+
+def iter_create_tables(source, chunk_size: int = CHUNK_SIZE) -> Iterator[TableSchema]:
+    """Stream :class:`TableSchema` objects for each ``CREATE TABLE`` in ``source``.
+
+    ``source`` may be a path or a binary file object.
+    """
+    if isinstance(source, (str, Path)):
+        with open(source, "rb") as handle:
+            yield from iter_create_tables(handle, chunk_size)
+        return
+    scanner = DumpScanner(source, chunk_size)
+    for wanted, statement in scanner.statements(_is_create_table):
+        if not wanted:
+            continue
+        table = parse_create_table(statement.decode("utf-8", errors="ignore"))
+        if table is not None:
+            yield table
+
+
+def iter_dump(
+    source,
+    tables: Optional[Iterable[str]] = None,
+    batch_size: int = 1000,
+    chunk_size: int = CHUNK_SIZE,
+    exclude: Optional[Iterable[str]] = None,
+) -> Iterator[Union[TableSchema, RowBatch]]:
+    """Stream schema and row data from ``source`` in dump order.
+
+    Yields a :class:`TableSchema` for every ``CREATE TABLE`` and
+    :class:`RowBatch` objects (at most ``batch_size`` rows each) for the
+    ``INSERT`` statements of ``tables`` (all tables when ``None``) that are
+    not in ``exclude``.  Rows are parsed straight from the chunk buffer, so
+    memory is bounded by the chunk size and the largest single row.
+    """
+    if isinstance(source, (str, Path)):
+        with open(source, "rb") as handle:
+            yield from iter_dump(handle, tables, batch_size, chunk_size, exclude)
+        return
+    yield from DumpScanner(source, chunk_size).events(tables, batch_size, exclude)
+
+
+def load_schema(source, chunk_size: int = CHUNK_SIZE) -> Dict[str, TableSchema]:
+    """Return a ``{table name: TableSchema}`` map for every table in ``source``."""
+    return {table.name: table for table in iter_create_tables(source, chunk_size)}
+
+
+class _HashingReader:
+    """File wrapper that hashes every byte handed to the scanner."""
+
+    def __init__(self, handle: BinaryIO) -> None:
+        self._handle = handle
+        self.digest = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._handle.read(size)
+        self.digest.update(chunk)
+        return chunk
+
+
+def _file_sha256(path: Path, chunk_size: int = CHUNK_SIZE) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _parser_fingerprint() -> str:
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+
+def default_cache_path(dump_path: Path) -> Path:
+    dump_path = Path(dump_path).resolve()
+    key = hashlib.sha1(str(dump_path).encode("utf-8")).hexdigest()[:12]
+    return DEFAULT_CACHE_DIR / f"{dump_path.name}-{key}.json"
+
+
+def _read_cache(cache_path: Path) -> Optional[Dict]:
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+        return None
+    if data.get("parser") != _parser_fingerprint() or not isinstance(data.get("tables"), list):
+        return None
+    return data
+
+
+def _write_cache(cache_path: Path, stat: os.stat_result, sha256: str, tables: List[Dict]) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "version": CACHE_VERSION,
+        "parser": _parser_fingerprint(),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": sha256,
+        "tables": tables,
+    }
+    tmp_path = cache_path.with_name(cache_path.name + f".{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp_path, cache_path)
+
+
+def _tables_from_cache(data: Dict) -> Optional[Dict[str, TableSchema]]:
+    try:
+        tables = [TableSchema.from_dict(entry) for entry in data["tables"]]
+    except (KeyError, TypeError, ValueError):
+        return None
+    return {table.name: table for table in tables}
+
+
+def load_schema_cached(
+    dump_path, cache_path: Optional[Path] = None, chunk_size: int = CHUNK_SIZE
+) -> Dict[str, TableSchema]:
+    """Like :func:`load_schema` but backed by an on-disk cache of the parsed IR.
+
+    The cache is keyed by the dump's size, mtime and SHA-256.  When size and
+    mtime match the cached values the IR is loaded without touching the dump;
+    when only the mtime moved the dump is re-hashed and the cache reused if
+    the content is unchanged.  Missing, stale or corrupt caches (including a
+    cache written by a different version of this module) are rebuilt.
+    """
+    dump_path = Path(dump_path)
+    cache_path = Path(cache_path) if cache_path else default_cache_path(dump_path)
+    stat = dump_path.stat()
+    cached = _read_cache(cache_path)
+
+    if cached is not None:
+        same_stat = cached.get("size") == stat.st_size and cached.get("mtime_ns") == stat.st_mtime_ns
+        if same_stat or (cached.get("size") == stat.st_size and cached.get("sha256") == _file_sha256(dump_path)):
+            tables = _tables_from_cache(cached)
+            if tables is not None:
+                if not same_stat:
+                    _write_cache(cache_path, stat, cached["sha256"], cached["tables"])
+                return tables
+
+    with open(dump_path, "rb") as handle:
+        reader = _HashingReader(handle)
+        tables = load_schema(reader, chunk_size)
+        # Hash whatever the scanner did not need to read (nothing, normally).
+        for chunk in iter(lambda: reader.read(chunk_size), b""):
+            pass
+    _write_cache(cache_path, stat, reader.digest.hexdigest(), [table.to_dict() for table in tables.values()])
+    return tables
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""Convert ``YASGMP.sql`` into a SQLite database for offline test runs.
+
+Each ``CREATE TABLE`` is translated into SQLite DDL (type affinities are
+derived from each column's MySQL type) and the
+``INSERT`` rows are streamed from the dump with :func:`sql_dump.iter_dump`
+straight into ``executemany`` batches.  The whole load runs in a single
+transaction with journaling and syncing disabled; secondary indexes are
+created after the data is in place.  The database is built under a
+temporary name and renamed into place, so a failed run never leaves a
+half-loaded file behind.
+
+Column defaults are carried over: literal defaults as SQLite literals and
+``NOW()``, ``CURDATE()`` and friends as ``CURRENT_TIMESTAMP``,
+``CURRENT_DATE`` or ``CURRENT_TIME``.  A column whose
+default is an expression SQLite cannot evaluate loses its ``NOT NULL``
+instead, so inserts that omit it still succeed.
+
+``DECIMAL`` columns get ``NUMERIC`` affinity, so they sort, compare and
+index as numbers; SQLite stores fractional values as binary floats (15
+significant digits), though.  Use ``extract_fixtures.py`` where exact
+decimal values matter.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import sqlite3
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from sql_dump import Column, RowBatch, TableSchema, decode_row, iter_dump
+
+ROOT = Path(__file__).resolve().parents[1]
+SQL_PATH = ROOT / "YASGMP.sql"
+OUTPUT_PATH = ROOT / ".cache" / "sqlite" / "YASGMP.sqlite"
+
+LOAD_PRAGMAS = (
+    "PRAGMA journal_mode = OFF",
+    "PRAGMA synchronous = OFF",
+    "PRAGMA locking_mode = EXCLUSIVE",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -262144",  # 256 MiB
+    "PRAGMA foreign_keys = OFF",
+)
+
+# Affinity per MySQL base type; every other type (text, temporal, enum,
+# json, ...) is stored as TEXT.
+AFFINITIES = {
+    **dict.fromkeys(
+        ("tinyint", "smallint", "mediumint", "int", "integer", "bigint", "serial", "year", "bit", "bool", "boolean"),
+        "INTEGER",
+    ),
+    **dict.fromkeys(("float", "double", "real"), "REAL"),
+    # NUMERIC keeps numeric ordering, range predicates and indexes on amounts;
+    # the price is that SQLite turns '0.10' into the REAL 0.1.  TEXT would keep
+    # the literal but compare lexicographically ('12.34' < '5').
+    **dict.fromkeys(("decimal", "numeric", "dec", "fixed"), "NUMERIC"),
+    **dict.fromkeys(("tinyblob", "blob", "mediumblob", "longblob", "binary", "varbinary"), "BLOB"),
+}
+_BASE_TYPE = re.compile(r"\w+")
+
+# Fractional numbers arrive as Decimal; bind their text and let the column
+# affinity convert it.
+sqlite3.register_adapter(Decimal, str)
+
+
+# String literals are matched (and skipped) so a COMMENT mentioning DEFAULT is ignored.
+_DEFAULT = re.compile(
+    r"'(?:[^'\\]|\\.|'')*'"
+    r"|\bDEFAULT\s+(?P<value>(?:_\w+\s*)?'(?:[^'\\]|\\.|'')*'|[bx]'[^']*'|[-+]?[\w.]+(?:\(\d*\))?|\((?:\w+\(\d*\)\))?)",
+    re.I | re.S,
+)
+_NUMBER = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:e[-+]?\d+)?", re.I)
+# MySQL's current date/time defaults and their SQLite keywords.
+_CURRENT_DEFAULTS = (
+    (
+        re.compile(r"(?:CURRENT_TIMESTAMP|LOCALTIMESTAMP|LOCALTIME)(?:\(\d*\))?|\(?NOW\(\d*\)\)?", re.I),
+        "CURRENT_TIMESTAMP",
+    ),
+    (re.compile(r"CURRENT_DATE(?:\(\))?|\(?CURDATE\(\)\)?", re.I), "CURRENT_DATE"),
+    (re.compile(r"CURRENT_TIME(?:\(\d*\))?|\(?CURTIME\(\d*\)\)?", re.I), "CURRENT_TIME"),
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sql", type=Path, default=SQL_PATH, help="MySQL dump to convert.")
+    parser.add_argument("--output", type=Path, default=OUTPUT_PATH, help="SQLite database to (re)create.")
+    parser.add_argument("--tables", nargs="+", metavar="TABLE", help="Only convert these tables.")
+    parser.add_argument("--schema-only", action="store_true", help="Create the tables and indexes without any rows.")
+    parser.add_argument(
+        "--batch-size", type=int, default=5000, help="Rows handed to each executemany call (default: 5000)."
+    )
+    return parser.parse_args()
+
+
+def quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def column_list(names) -> str:
+    return ", ".join(quote(name) for name in names)
+
+
+def sqlite_type(column: Column) -> str:
+    base = _BASE_TYPE.match(column.sql_type)
+    return AFFINITIES.get(base.group(0).lower(), "TEXT") if base else "TEXT"
+
+
+def sqlite_default(column: Column) -> Tuple[bool, Optional[str]]:
+    """Return ``(has default, SQLite DEFAULT expression or None)`` for ``column``.
+
+    ``None`` with a default means the MySQL default cannot be expressed.
+    """
+    for match in _DEFAULT.finditer(column.definition):
+        value = match.group("value")
+        if value is None:
+            continue
+        for pattern, keyword in _CURRENT_DEFAULTS:
+            if pattern.fullmatch(value):
+                return True, keyword
+        if "'" not in value and value.upper() != "NULL" and not _NUMBER.fullmatch(value):
+            # Expression defaults: (...), CURRENT_DATE, UUID(), ...
+            return True, None
+        decoded = decode_row(value.encode("utf-8"))
+        if len(decoded) != 1:
+            return True, None
+        literal = decoded[0]
+        if literal is None:
+            return False, None
+        if isinstance(literal, bytes):
+            return True, f"X'{literal.hex()}'"
+        if isinstance(literal, str):
+            return True, "'" + literal.replace("'", "''") + "'"
+        return True, str(literal)
+    return False, None
+
+
+def render_table_ddl(table: TableSchema) -> str:
+    """Translate a parsed MySQL table into a SQLite ``CREATE TABLE`` statement."""
+    rowid_key = None
+    if len(table.primary_key) == 1:
+        key_column = table.column(table.primary_key[0])
+        if key_column is not None and sqlite_type(key_column) == "INTEGER":
+            rowid_key = key_column.name
+
+    lines = []
+    for column in table.columns:
+        line = f"{quote(column.name)} {sqlite_type(column)}"
+        if column.name == rowid_key:
+            # INTEGER PRIMARY KEY aliases the rowid, which also gives AUTO_INCREMENT semantics.
+            line += " PRIMARY KEY"
+        else:
+            has_default, default = sqlite_default(column)
+            if not column.nullable and (default is not None or not has_default):
+                line += " NOT NULL"
+            if default is not None:
+                line += f" DEFAULT {default}"
+        lines.append(line)
+    if table.primary_key and rowid_key is None:
+        lines.append(f"PRIMARY KEY ({column_list(table.primary_key)})")
+    for fk in table.foreign_keys:
+        clause = f"FOREIGN KEY ({column_list(fk.columns)}) REFERENCES {quote(fk.ref_table)} ({column_list(fk.ref_columns)})"
+        if fk.on_delete:
+            clause += f" ON DELETE {fk.on_delete}"
+        if fk.on_update:
+            clause += f" ON UPDATE {fk.on_update}"
+        lines.append(clause)
+    body = ",\n  ".join(lines)
+    return f"CREATE TABLE {quote(table.name)} (\n  {body}\n)"
+
+
+def render_index_ddl(table: TableSchema) -> List[str]:
+    """``CREATE INDEX`` statements for the table's plain and unique keys.
+
+    FULLTEXT and SPATIAL keys have no SQLite equivalent and are skipped.
+    Index names are prefixed with the table because SQLite index names are
+    global to the database rather than per table.
+    """
+    statements = []
+    for index in table.indexes:
+        if index.kind not in ("index", "unique"):
+            continue
+        unique = "UNIQUE " if index.unique else ""
+        name = quote(f"{table.name}__{index.name}")
+        statements.append(f"CREATE {unique}INDEX {name} ON {quote(table.name)} ({column_list(index.columns)})")
+    return statements
+
+
+def insert_sql(table: TableSchema, columns: Optional[Tuple[str, ...]], width: int) -> str:
+    target = quote(table.name)
+    if columns is not None:
+        target += f" ({column_list(columns)})"
+    placeholders = ", ".join("?" * width)
+    return f"INSERT INTO {target} VALUES ({placeholders})"
+
+
+def convert(
+    sql_path: Path,
+    db_path: Path,
+    tables: Optional[List[str]] = None,
+    schema_only: bool = False,
+    batch_size: int = 5000,
+) -> Dict[str, int]:
+    """Build ``db_path`` from ``sql_path`` and return ``{table: rows loaded}``."""
+    wanted = set(tables) if tables else None
+    row_tables = () if schema_only else wanted
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = db_path.with_name(db_path.name + ".tmp")
+    if tmp_path.exists():
+        tmp_path.unlink()
+
+    schemas: Dict[str, TableSchema] = {}
+    counts: Dict[str, int] = {}
+    statements: Dict[Tuple[str, Optional[Tuple[str, ...]], int], str] = {}
+    connection = sqlite3.connect(tmp_path, isolation_level=None)
+    try:
+        for pragma in LOAD_PRAGMAS:
+            connection.execute(pragma)
+        connection.execute("BEGIN")
+        for event in iter_dump(sql_path, tables=row_tables, batch_size=batch_size):
+            if isinstance(event, RowBatch):
+                table = schemas.get(event.table)
+                if table is None:
+                    raise ValueError(f"INSERT for table {event.table!r} before its CREATE TABLE")
+                key = (event.table, event.columns, len(event.rows[0]))
+                sql = statements.get(key)
+                if sql is None:
+                    sql = statements[key] = insert_sql(table, event.columns, key[2])
+                connection.executemany(sql, event.rows)
+                counts[event.table] += len(event.rows)
+            elif wanted is None or event.name in wanted:
+                connection.execute(f"DROP TABLE IF EXISTS {quote(event.name)}")
+                connection.execute(render_table_ddl(event))
+                schemas[event.name] = event
+                counts[event.name] = 0
+        for table in schemas.values():
+            for statement in render_index_ddl(table):
+                connection.execute(statement)
+        connection.execute("COMMIT")
+    except BaseException:
+        connection.close()
+        tmp_path.unlink(missing_ok=True)
+        raise
+    connection.close()
+    os.replace(tmp_path, db_path)
+    return counts
+
+
+def main() -> None:
+    args = parse_args()
+    started = time.perf_counter()
+    counts = convert(args.sql, args.output, args.tables, args.schema_only, args.batch_size)
+    elapsed = time.perf_counter() - started
+    if args.tables:
+        missing = sorted(set(args.tables) - set(counts))
+        for name in missing:
+            print(f"Table {name} not found in {args.sql}", file=sys.stderr)
+    print(
+        f"Loaded {sum(counts.values())} rows into {len(counts)} tables -> {args.output} ({elapsed:.1f}s)",
+        file=sys.stdout,
+    )
+
+
+if __name__ == "__main__":
+    main()
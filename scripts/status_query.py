@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""Query tasks and execution history from ``docs/tasks.yaml``.
+
+The documents are loaded through ``update_status_docs`` (so the same
+normalization applies) into a SQLite index under ``.cache/status_docs/``.
+Each source file (``tasks.yaml`` and every ``docs/execution_log/*.yaml``
+archive) is re-indexed only when its content hash changes, so repeated
+queries skip YAML parsing entirely.
+
+Examples::
+
+    python scripts/status_query.py tasks --open --owner RaslanAmir
+    python scripts/status_query.py tasks --overdue
+    python scripts/status_query.py sessions --author "Luka Marin" --since 2025-07-01 --rows
+    python scripts/status_query.py report owners
+    python scripts/status_query.py sql "SELECT author, COUNT(*) FROM sessions GROUP BY author"
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import update_status_docs as status_docs
+
+ROOT = Path(__file__).resolve().parents[1]
+INDEX_PATH = ROOT / ".cache" / "status_docs" / "index.sqlite"
+INDEX_VERSION = 1
+TASKS_SOURCE = "tasks.yaml"
+FORMATS = ("table", "json", "csv")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (name TEXT PRIMARY KEY, sha256 TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS tasks (
+  id TEXT, title TEXT, owner TEXT, due TEXT, completed_on TEXT, category TEXT NOT NULL,
+  notes TEXT, position INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sessions (
+  session_id INTEGER PRIMARY KEY, source TEXT NOT NULL, date TEXT NOT NULL, author TEXT,
+  summary TEXT, run_id TEXT
+);
+CREATE TABLE IF NOT EXISTS rows (
+  session_id INTEGER NOT NULL REFERENCES sessions (session_id), timestamp TEXT, change TEXT, notes TEXT
+);
+CREATE INDEX IF NOT EXISTS tasks_owner ON tasks (owner);
+CREATE INDEX IF NOT EXISTS tasks_due ON tasks (due);
+CREATE INDEX IF NOT EXISTS tasks_category ON tasks (category);
+CREATE INDEX IF NOT EXISTS sessions_date ON sessions (date);
+CREATE INDEX IF NOT EXISTS sessions_author ON sessions (author);
+CREATE INDEX IF NOT EXISTS sessions_source ON sessions (source);
+CREATE INDEX IF NOT EXISTS rows_session ON rows (session_id);
+"""
+
+REPORTS = {
+    "owners": (
+        "Open tasks per owner",
+        "SELECT COALESCE(owner, 'Unassigned') AS owner, COUNT(*) AS open_tasks,"
+        " SUM(due IS NOT NULL AND due < :today) AS overdue, MIN(due) AS next_due"
+        " FROM tasks WHERE category != 'completed' GROUP BY 1 ORDER BY open_tasks DESC, owner",
+    ),
+    "categories": (
+        "Tasks per category",
+        "SELECT category, COUNT(*) AS tasks FROM tasks GROUP BY category ORDER BY MIN(position)",
+    ),
+    "authors": (
+        "Sessions per author",
+        "SELECT author, COUNT(*) AS sessions, MIN(date) AS first, MAX(date) AS last,"
+        " (SELECT COUNT(*) FROM rows r JOIN sessions s2 ON s2.session_id = r.session_id"
+        "   WHERE s2.author = s.author AND s2.date BETWEEN :since AND :until) AS changes"
+        " FROM sessions s WHERE date BETWEEN :since AND :until GROUP BY author ORDER BY sessions DESC, author",
+    ),
+    "months": (
+        "Sessions per month",
+        "SELECT substr(date, 1, 7) AS month, COUNT(*) AS sessions, COUNT(DISTINCT author) AS authors"
+        " FROM sessions WHERE date BETWEEN :since AND :until GROUP BY 1 ORDER BY 1 DESC",
+    ),
+}
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--index", type=Path, default=INDEX_PATH, help="SQLite index location.")
+    parser.add_argument("--format", choices=FORMATS, default="table", help="Output format.")
+    # Accepted after the subcommand as well; SUPPRESS keeps a value given
+    # before it from being reset to the default.
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--format", choices=FORMATS, default=argparse.SUPPRESS, help="Output format.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    tasks = commands.add_parser("tasks", parents=[common], help="List tasks.")
+    tasks.add_argument("--owner", help="Only tasks owned by OWNER.")
+    tasks.add_argument("--category", help="Only tasks in CATEGORY (backlog, in_progress, completed, ...).")
+    tasks.add_argument("--open", action="store_true", help="Exclude completed tasks.")
+    tasks.add_argument("--overdue", action="store_true", help="Open tasks whose due date has passed.")
+    tasks.add_argument("--due-before", help="Only tasks due before this date (YYYY-MM-DD).")
+    tasks.add_argument("--as-of", default=date.today().isoformat(), help="Reference date for --overdue.")
+    tasks.add_argument("--sort", choices=("due", "id", "owner", "category"), default="due", help="Sort order.")
+    tasks.add_argument("--limit", type=int, help="Return at most this many rows.")
+
+    sessions = commands.add_parser("sessions", parents=[common], help="List execution-log sessions (including archives).")
+    sessions.add_argument("--author", help="Only sessions by AUTHOR.")
+    sessions.add_argument("--since", help="Only sessions on or after this date (YYYY-MM-DD).")
+    sessions.add_argument("--until", help="Only sessions on or before this date (YYYY-MM-DD).")
+    sessions.add_argument("--last-days", type=int, help="Only sessions from the last N days.")
+    sessions.add_argument("--grep", help="Only sessions whose summary or rows contain TEXT.")
+    sessions.add_argument("--rows", action="store_true", help="List the individual table rows.")
+    sessions.add_argument("--limit", type=int, help="Return at most this many rows.")
+
+    report = commands.add_parser("report", parents=[common], help="Aggregate reports.")
+    report.add_argument(
+        "name",
+        choices=sorted(REPORTS),
+        help="; ".join(f"{name}: {title}" for name, (title, _) in sorted(REPORTS.items())),
+    )
+    report.add_argument("--since", default="0000-00-00", help="Only sessions on or after this date.")
+    report.add_argument("--until", default="9999-12-31", help="Only sessions on or before this date.")
+    report.add_argument("--as-of", default=date.today().isoformat(), help="Reference date for overdue counts.")
+
+    sql = commands.add_parser("sql", parents=[common], help="Run a read-only SQL query against the index.")
+    sql.add_argument("query", help="SELECT statement over the tasks, sessions and rows tables.")
+    return parser.parse_args(argv)
+
+
+def file_sha256(path: Path) -> Optional[str]:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def _text(value) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+def index_tasks_yaml(connection: sqlite3.Connection) -> None:
+    data = status_docs.ensure_structure(status_docs.load_tasks())
+    position = 0
+    for category, entries in data["tasks"].items():
+        for entry in entries:
+            if not isinstance(entry, dict):
+                raise ValueError(f"tasks.{category} must contain dictionaries")
+            connection.execute(
+                "INSERT INTO tasks VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    _text(entry.get("id")),
+                    _text(entry.get("title")),
+                    _text(entry.get("owner")),
+                    _text(entry.get("due")),
+                    _text(entry.get("completed_on")),
+                    category,
+                    _text(entry.get("notes")),
+                    position,
+                ),
+            )
+            position += 1
+    index_sessions(connection, TASKS_SOURCE, data["execution_log"])
+
+
+def index_sessions(connection: sqlite3.Connection, source: str, entries: List[Dict]) -> None:
+    for entry in status_docs.sort_execution_log(entries):
+        cursor = connection.execute(
+            "INSERT INTO sessions (source, date, author, summary, run_id) VALUES (?, ?, ?, ?, ?)",
+            (source, entry["date"], entry["author"], entry["summary"], entry.get("run_id")),
+        )
+        connection.executemany(
+            "INSERT INTO rows VALUES (?, ?, ?, ?)",
+            [(cursor.lastrowid, str(row["timestamp"]), row["change"], row["notes"]) for row in entry["entries"]],
+        )
+
+
+def drop_source(connection: sqlite3.Connection, source: str) -> None:
+    connection.execute(
+        "DELETE FROM rows WHERE session_id IN (SELECT session_id FROM sessions WHERE source = ?)", (source,)
+    )
+    connection.execute("DELETE FROM sessions WHERE source = ?", (source,))
+    if source == TASKS_SOURCE:
+        connection.execute("DELETE FROM tasks")
+    connection.execute("DELETE FROM sources WHERE name = ?", (source,))
+
+
+def open_index(path: Path) -> sqlite3.Connection:
+    """Open the index and bring it up to date with the documents on disk."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(path)
+    if connection.execute("PRAGMA user_version").fetchone()[0] != INDEX_VERSION:
+        connection.close()
+        path.unlink(missing_ok=True)
+        connection = sqlite3.connect(path)
+        connection.executescript(SCHEMA)
+        connection.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+    refresh_index(connection)
+    return connection
+
+
+def refresh_index(connection: sqlite3.Connection) -> List[str]:
+    """Re-index every source whose hash changed; return the refreshed names."""
+    sources = {TASKS_SOURCE: status_docs.TASKS_PATH}
+    for month in status_docs.archive_months():
+        sources[f"execution_log/{month}.yaml"] = status_docs.ARCHIVE_DIR / f"{month}.yaml"
+    indexed = dict(connection.execute("SELECT name, sha256 FROM sources"))
+
+    refreshed = []
+    with connection:
+        for name in sorted(set(indexed) - set(sources)):
+            drop_source(connection, name)
+            refreshed.append(name)
+        for name, path in sources.items():
+            digest = file_sha256(path)
+            if digest is not None and indexed.get(name) == digest:
+                continue
+            drop_source(connection, name)
+            if name == TASKS_SOURCE:
+                index_tasks_yaml(connection)
+            else:
+                index_sessions(connection, name, status_docs.load_archive(path.stem))
+            if digest is not None:
+                connection.execute("INSERT INTO sources VALUES (?, ?)", (name, digest))
+            refreshed.append(name)
+    return refreshed
+
+
+def query_tasks(connection: sqlite3.Connection, args: argparse.Namespace) -> sqlite3.Cursor:
+    clauses, params = [], []
+    if args.owner:
+        clauses.append("owner = ?")
+        params.append(args.owner)
+    if args.category:
+        clauses.append("category = ?")
+        params.append(args.category)
+    if args.open or args.overdue:
+        clauses.append("category != 'completed'")
+    if args.overdue:
+        clauses.append("due IS NOT NULL AND due < ?")
+        params.append(args.as_of)
+    if args.due_before:
+        clauses.append("due IS NOT NULL AND due < ?")
+        params.append(args.due_before)
+    order = {
+        "due": "due IS NULL, due, id",
+        "id": "id",
+        "owner": "owner IS NULL, owner, due IS NULL, due",
+        "category": "position",
+    }[args.sort]
+    sql = "SELECT id, title, owner, category, due, completed_on FROM tasks"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    sql += f" ORDER BY {order}"
+    if args.limit is not None:
+        sql += " LIMIT ?"
+        params.append(args.limit)
+    return connection.execute(sql, params)
+
+
+def query_sessions(connection: sqlite3.Connection, args: argparse.Namespace) -> sqlite3.Cursor:
+    clauses, params = [], []
+    if args.author:
+        clauses.append("s.author = ?")
+        params.append(args.author)
+    since = args.since
+    if args.last_days is not None:
+        since = max(since or "", (date.today() - timedelta(days=args.last_days)).isoformat())
+    if since:
+        clauses.append("s.date >= ?")
+        params.append(since)
+    if args.until:
+        clauses.append("s.date <= ?")
+        params.append(args.until)
+    if args.grep:
+        pattern = f"%{args.grep}%"
+        clauses.append(
+            "(s.summary LIKE ? OR EXISTS (SELECT 1 FROM rows g WHERE g.session_id = s.session_id"
+            " AND (g.change LIKE ? OR g.notes LIKE ?)))"
+        )
+        params.extend([pattern] * 3)
+    if args.rows:
+        sql = (
+            "SELECT s.date, s.author, r.timestamp, r.change, r.notes FROM sessions s"
+            " JOIN rows r ON r.session_id = s.session_id"
+        )
+        order = "s.date DESC, s.session_id, r.timestamp"
+    else:
+        sql = (
+            "SELECT s.date, s.author, s.summary, (SELECT COUNT(*) FROM rows c WHERE c.session_id = s.session_id)"
+            " AS changes, s.source FROM sessions s"
+        )
+        order = "s.date DESC, s.session_id"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    sql += f" ORDER BY {order}"
+    if args.limit is not None:
+        sql += " LIMIT ?"
+        params.append(args.limit)
+    return connection.execute(sql, params)
+
+
+def query_report(connection: sqlite3.Connection, args: argparse.Namespace) -> sqlite3.Cursor:
+    _, sql = REPORTS[args.name]
+    return connection.execute(sql, {"since": args.since, "until": args.until, "today": args.as_of})
+
+
+def query_sql(connection: sqlite3.Connection, args: argparse.Namespace) -> sqlite3.Cursor:
+    connection.execute("PRAGMA query_only = ON")
+    return connection.execute(args.query)
+
+
+def write_results(cursor: sqlite3.Cursor, output_format: str) -> int:
+    columns = [description[0] for description in cursor.description or ()]
+    rows = cursor.fetchall()
+    if output_format == "json":
+        json.dump([dict(zip(columns, row)) for row in rows], sys.stdout, indent=2, ensure_ascii=False)
+        sys.stdout.write("\n")
+    elif output_format == "csv":
+        writer = csv.writer(sys.stdout)
+        writer.writerow(columns)
+        writer.writerows(rows)
+    else:
+        cells = [["" if value is None else str(value) for value in row] for row in rows]
+        widths = [max([len(column)] + [len(row[index]) for row in cells]) for index, column in enumerate(columns)]
+        lines: List[Tuple[str, ...]] = [tuple(columns), tuple("-" * width for width in widths)]
+        lines.extend(tuple(row) for row in cells)
+        for line in lines:
+            print("  ".join(value.ljust(width) for value, width in zip(line, widths)).rstrip())
+    return len(rows)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = parse_args(argv)
+    connection = open_index(args.index)
+    try:
+        handler = {
+            "tasks": query_tasks,
+            "sessions": query_sessions,
+            "report": query_report,
+            "sql": query_sql,
+        }[args.command]
+        write_results(handler(connection, args), args.format)
+    except BrokenPipeError:
+        # The reader (``| head``) went away; silence the flush at exit.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
+    finally:
+        connection.close()
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except (ValueError, sqlite3.Error) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""Single entry point for the repository's Python tooling.
+
+``python scripts/tools.py <command> [options]`` runs one of the helper
+scripts in-process; everything after the command is handed to that
+script unchanged, so ``tools.py models --all-tables`` behaves exactly like
+``generate_missing_models.py --all-tables``.  Nothing beyond the standard
+library is imported until a command is chosen, so the heavy modules
+(``yaml``, the dump parser, ``sqlite3``) are only loaded by the commands
+that need them.
+
+``precommit`` is what ``.githooks/pre-commit`` runs.  It looks only at the
+files staged in the commit and runs just the checks those files can
+affect, against the staged content: files with unstaged changes are read
+from the index, so a partially staged file is checked as it will be
+committed.
+
+* staged ``*.py`` files are compiled;
+* status documents (or their generator) trigger the status-doc ``--check``,
+  which returns immediately while the stamp file is current (it reads the
+  working tree, so unstaged changes to those files are reported);
+* staged entity models are compared with the dump's columns (only the
+  staged classes and their ``partial`` siblings are scanned), and a staged
+  ``YASGMP.sql`` compares every model; models of tables the dump does not
+  define (views, for instance) only produce a warning.
+
+A typical commit is validated in well under a second.
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import os
+import runpy
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = ROOT / "scripts"
+
+# command -> (module, directory holding it, description)
+COMMANDS: Dict[str, Tuple[str, Path, str]] = {
+    "models": ("generate_missing_models", ROOT, "Generate entity classes from YASGMP.sql."),
+    "status": ("update_status_docs", SCRIPTS_DIR, "Regenerate or --check the status documents."),
+    "query": ("status_query", SCRIPTS_DIR, "Query tasks and execution sessions."),
+    "diff": ("schema_diff", SCRIPTS_DIR, "Diff the schemas of two dump snapshots."),
+    "db-diff": ("db_model_diff", SCRIPTS_DIR, "Compare the dump's columns with the C# models."),
+    "sqlite": ("sqldump_to_sqlite", SCRIPTS_DIR, "Load the dump into a SQLite database."),
+    "fixtures": ("extract_fixtures", SCRIPTS_DIR, "Extract per-table row fixtures from the dump."),
+    "stats": ("column_stats", SCRIPTS_DIR, "Profile per-column statistics of the dump's rows."),
+    "bench": ("bench_tooling", SCRIPTS_DIR, "Benchmark the tooling against its baseline."),
+}
+
+STATUS_INPUTS = (
+    "docs/tasks.yaml",
+    "docs/STATUS.md",
+    "docs/EXECUTION_LOG.md",
+    "scripts/update_status_docs.py",
+)
+ARCHIVE_PREFIX = "docs/execution_log/"
+MODELS_PREFIX = "YasGMP.AppCore/Models/"
+DUMP_PATH = "YASGMP.sql"
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    epilog = "commands:\n" + "\n".join(
+        f"  {name:<10} {description}" for name, (_, _, description) in COMMANDS.items()
+    )
+    epilog += "\n  precommit  Check the files staged for commit (see above)."
+    parser = argparse.ArgumentParser(
+        description=__doc__, epilog=epilog, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("command", choices=[*COMMANDS, "precommit"], metavar="command")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="Options passed through to the command.")
+    return parser.parse_args(argv)
+
+
+def run_command(command: str, argv: List[str]) -> int:
+    """Run ``command``'s script as ``__main__`` with ``argv`` and return its exit status.
+
+    ``alter_sys`` makes the script the real ``__main__`` while it runs, so
+    functions it hands to a process pool can be pickled by reference.
+    """
+    module, directory, _ = COMMANDS[command]
+    saved_argv, saved_path = sys.argv, list(sys.path)
+    sys.argv = [str(directory / f"{module}.py"), *argv]
+    sys.path.insert(0, str(directory))
+    try:
+        runpy.run_module(module, run_name="__main__", alter_sys=True)
+    except SystemExit as exc:
+        if exc.code is None or isinstance(exc.code, int):
+            return exc.code or 0
+        print(exc.code, file=sys.stderr)
+        return 1
+    finally:
+        sys.argv, sys.path[:] = saved_argv, saved_path
+    return 0
+
+
+def git(*args: str) -> bytes:
+    return subprocess.run(["git", *args], cwd=ROOT, check=True, capture_output=True).stdout
+
+
+def _names(output: bytes) -> List[str]:
+    return [name for name in output.decode("utf-8").split("\0") if name]
+
+
+def staged_files() -> List[str]:
+    """Paths (relative to the repository root) added, copied, modified or renamed in the index."""
+    return _names(git("diff", "--cached", "--name-only", "--diff-filter=ACMR", "-z"))
+
+
+class Snapshot:
+    """The repository content the checks see.
+
+    For a commit that is the index: paths whose working-tree copy differs
+    from the index are read with ``git show :<path>``, every other path
+    straight from disk (which keeps the parsed-schema cache usable).  With
+    ``--files`` the working tree is checked as it is.
+    """
+
+    def __init__(self, staged: bool) -> None:
+        self.staged = staged
+        self.unstaged: Set[str] = set(_names(git("diff", "--name-only", "-z"))) if staged else set()
+
+    def read_bytes(self, name: str) -> bytes:
+        if name in self.unstaged:
+            return git("show", f":{name}")
+        return (ROOT / name).read_bytes()
+
+    def list_files(self, prefix: str, suffix: str) -> List[str]:
+        if self.staged:
+            names = _names(git("ls-files", "-z", "--", prefix))
+        else:
+            names = [path.relative_to(ROOT).as_posix() for path in (ROOT / prefix).rglob("*")]
+        return sorted(name for name in names if name.endswith(suffix))
+
+
+def check_python(files: List[str], snapshot: Snapshot) -> List[str]:
+    errors = []
+    for name in files:
+        if not name.endswith(".py"):
+            continue
+        try:
+            compile(snapshot.read_bytes(name), str(ROOT / name), "exec")
+        except (OSError, subprocess.CalledProcessError, SyntaxError) as exc:
+            errors.append(f"{name}: {exc}")
+    return errors
+
+
+def check_status_docs(files: List[str], snapshot: Snapshot) -> List[str]:
+    if not any(name in STATUS_INPUTS or name.startswith(ARCHIVE_PREFIX) for name in files):
+        return []
+    errors = [
+        f"{name} has unstaged changes; the status check reads the working tree, stage or stash them"
+        for name in sorted(snapshot.unstaged)
+        if name in STATUS_INPUTS or name.startswith(ARCHIVE_PREFIX)
+    ]
+    if errors:
+        return errors
+    if run_command("status", ["--check"]) != 0:
+        return ["status documents are out of date; run python scripts/update_status_docs.py"]
+    return []
+
+
+def _partial_siblings(names: List[str], candidates: List[str]) -> List[str]:
+    """``Foo.cs`` plus ``Foo.*.cs`` among ``candidates`` for every ``Foo.cs`` / ``Foo.Schema.cs`` in ``names``."""
+    wanted = {(name.rpartition("/")[0], name.rpartition("/")[2].split(".", 1)[0]) for name in names}
+    selected = []
+    for candidate in candidates:
+        directory, _, filename = candidate.rpartition("/")
+        if (directory, filename.split(".", 1)[0]) in wanted:
+            selected.append(candidate)
+    return selected
+
+
+def check_models(files: List[str], snapshot: Snapshot) -> List[str]:
+    dump_staged = DUMP_PATH in files
+    staged_models = [name for name in files if name.startswith(MODELS_PREFIX) and name.endswith(".cs")]
+    if not dump_staged and not staged_models:
+        return []
+    import db_model_diff
+
+    models_dir = ROOT / MODELS_PREFIX
+    try:
+        models = snapshot.list_files(MODELS_PREFIX, ".cs")
+        names = models if dump_staged else _partial_siblings(staged_models, models)
+        if DUMP_PATH in snapshot.unstaged:
+            schema = db_model_diff.load_schema(io.BytesIO(snapshot.read_bytes(DUMP_PATH)))
+        else:
+            schema = db_model_diff.load_schema_cached(ROOT / DUMP_PATH)
+    except (OSError, ValueError, subprocess.CalledProcessError) as exc:
+        return [f"{DUMP_PATH}: {exc}"]
+
+    def read_text(path: Path) -> str:
+        return snapshot.read_bytes(path.relative_to(ROOT).as_posix()).decode("utf-8-sig", errors="ignore")
+
+    mappings = db_model_diff.scan_models(models_dir, [ROOT / name for name in names], read_text)
+    results = db_model_diff.compute_diff(schema, mappings, models_dir)
+    for entry in db_model_diff.models_without_table(schema, mappings, models_dir):
+        print(f"[pre-commit] warning: {entry['file']}: table {entry['table']} is not in {DUMP_PATH}", file=sys.stderr)
+    errors = []
+    for entry in results:
+        for issue in ("missing_in_model", "extra_in_model"):
+            if entry[issue]:
+                columns = ", ".join(entry[issue])
+                errors.append(f"{entry['file']} ({entry['table']}): {issue.replace('_', ' ')}: {columns}")
+    if errors and os.environ.get("ALLOW_DB_MISMATCH", "0") == "1":
+        for error in errors:
+            print(f"[pre-commit] warning: {error}", file=sys.stderr)
+        return []
+    if errors:
+        errors.append("set ALLOW_DB_MISMATCH=1 to bypass once (not recommended)")
+    return errors
+
+
+CHECKS: Tuple[Tuple[str, Callable[[List[str], Snapshot], List[str]]], ...] = (
+    ("python", check_python),
+    ("status docs", check_status_docs),
+    ("db/model sync", check_models),
+)
+
+
+def precommit(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(prog="tools.py precommit", description="Check the files staged for commit.")
+    parser.add_argument("--files", nargs="+", metavar="PATH", help="Check these repository paths instead of the index.")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    files: Optional[List[str]] = args.files
+    try:
+        snapshot = Snapshot(staged=files is None)
+        if files is None:
+            files = staged_files()
+    except (OSError, subprocess.CalledProcessError) as exc:
+        print(f"error: could not list staged files: {exc}", file=sys.stderr)
+        return 1
+    failed = False
+    for name, check in CHECKS:
+        errors = check(files, snapshot)
+        for error in errors:
+            print(f"[pre-commit] {name}: {error}", file=sys.stderr)
+        failed = failed or bool(errors)
+    elapsed = (time.perf_counter() - started) * 1000
+    print(f"[pre-commit] {len(files)} staged files checked in {elapsed:.0f} ms", file=sys.stderr)
+    return 1 if failed else 0
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    if args.command == "precommit":
+        sys.exit(precommit(args.args))
+    sys.exit(run_command(args.command, args.args))
+
+
+if __name__ == "__main__":
+    main()
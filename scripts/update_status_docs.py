@@ -5,17 +5,52 @@ This script normalizes ``docs/tasks.yaml`` and uses its metadata to
 regenerate ``docs/STATUS.md`` and ``docs/EXECUTION_LOG.md``.  The command
 is idempotent and supports a ``--check`` mode (for CI) as well as a
 ``--append-log`` workflow for adding new execution sessions.
+
+Every run records content hashes of the three documents (and of this
+script and the installed PyYAML) in the local, gitignored
+``docs/.status-docs.stamp.json``.  When the files on disk still
+match the stamp, nothing can have drifted and the script returns without
+parsing or rendering anything.  The same guarantee lets ``--append-log``
+splice the new session straight into ``tasks.yaml`` and
+``EXECUTION_LOG.md`` instead of re-rendering the whole history, and
+``--archive-after-days`` moves old sessions into per-month files under
+``docs/execution_log/`` so the hot documents stay small.
+``--import-sessions`` merges many sessions (``ACTIVITY_LOG.json`` runs or
+execution-log records in JSON/JSONL) in one load-sort-write pass.
+
+Writers are safe to run concurrently: every run that writes takes an
+advisory lock on ``docs/.status-docs.lock`` and replaces files with an
+atomic rename.  ``--append-log --journal`` does not even wait for that
+lock; it appends the session to ``docs/.execution-log.journal.jsonl`` and
+the next regular run merges the journal into the documents.
+
+``--profile`` writes wall/CPU time, memory and counts per phase (stamp
+check, read, parse, sort, serialize, render, write) as JSON, and
+``--cprofile`` dumps :mod:`cProfile` statistics for the whole run.
 """
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
+import os
+import re
 import sys
-from datetime import date, datetime
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Dict, Iterable, List, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 import yaml
 
+from profiling import Profiler, default_report_path, maybe_cprofile
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
 
 class IndentDumper(yaml.SafeDumper):
     def increase_indent(self, flow=False, indentless=False):
@@ -32,10 +67,29 @@ def represent_quoted_str(dumper: yaml.SafeDumper, data: QuotedString):
 
 yaml.add_representer(QuotedString, represent_quoted_str, Dumper=IndentDumper)
 
+# libyaml's loader builds the same objects several times faster.  Dumping
+# stays on the pure-Python IndentDumper: libyaml's emitter always writes
+# sequences nested in mappings without indentation (and wraps long scalars
+# at different columns), so it cannot reproduce the checked-in formatting.
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 ROOT = Path(__file__).resolve().parents[1]
 TASKS_PATH = ROOT / "docs" / "tasks.yaml"
 STATUS_PATH = ROOT / "docs" / "STATUS.md"
 EXECUTION_LOG_PATH = ROOT / "docs" / "EXECUTION_LOG.md"
+STAMP_PATH = ROOT / "docs" / ".status-docs.stamp.json"
+STAMP_VERSION = 1
+ARCHIVE_DIR = ROOT / "docs" / "execution_log"
+LOCK_PATH = ROOT / "docs" / ".status-docs.lock"
+JOURNAL_PATH = ROOT / "docs" / ".execution-log.journal.jsonl"
+
+# Session boundaries in the normalized documents; see append_log_in_place().
+_YAML_SESSION = re.compile(r"^  - date: '(\d{4}-\d{2}-\d{2})'$", re.M)
+_MD_SESSION = re.compile(r"^## (\d{4}-\d{2}-\d{2}) ", re.M)
+_FRONT_MATTER = re.compile(r"\A---\n(.*?)\n---\n", re.S)
+
+# Replaced by an enabled profiler under --profile.
+profiler = Profiler("update_status_docs", enabled=False)
 
 
 def parse_args() -> argparse.Namespace:
@@ -50,6 +104,60 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Append a new execution log entry using the --log-* arguments.",
     )
+    parser.add_argument(
+        "--no-stamp",
+        action="store_true",
+        help="Ignore the stamp file and always regenerate (or compare) every document.",
+    )
+    parser.add_argument(
+        "--archive-after-days",
+        type=int,
+        metavar="DAYS",
+        help=(
+            "Move sessions more than DAYS older than the newest session into per-month archives "
+            "under docs/execution_log/."
+        ),
+    )
+    parser.add_argument(
+        "--journal",
+        action="store_true",
+        help=(
+            "With --append-log, queue the session in docs/.execution-log.journal.jsonl instead of "
+            "rewriting the documents; the next regular run merges it."
+        ),
+    )
+    parser.add_argument(
+        "--import-sessions",
+        nargs="+",
+        type=Path,
+        metavar="PATH",
+        help=(
+            "Import sessions from JSON (a list, or an object with an execution_log list) or JSONL files; "
+            "'-' reads JSONL from stdin. ACTIVITY_LOG.json runs are converted to sessions."
+        ),
+    )
+    parser.add_argument(
+        "--import-author",
+        default="Activity Log",
+        help="Author recorded for imported ACTIVITY_LOG.json runs (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        nargs="?",
+        const=default_report_path("update_status_docs"),
+        metavar="PATH",
+        help=(
+            "Write per-phase wall/CPU time, peak memory and counts as JSON "
+            "(default: .cache/profile/update_status_docs.json)."
+        ),
+    )
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="With --profile, also trace per-phase peak Python allocations (slows the run down).",
+    )
+    parser.add_argument("--cprofile", type=Path, metavar="PATH", help="Also dump cProfile stats to PATH.")
     parser.add_argument("--log-date", help="Date for the new session (YYYY-MM-DD).")
     parser.add_argument("--log-author", help="Author of the execution session.")
     parser.add_argument("--log-summary", help="Short summary for the session.")
@@ -67,9 +175,12 @@ def parse_args() -> argparse.Namespace:
 def load_tasks() -> Dict:
     if not TASKS_PATH.exists():
         return {}
-    with TASKS_PATH.open("r", encoding="utf-8") as handle:
-        content = handle.read()
-    data = yaml.safe_load(content) if content.strip() else {}
+    with profiler.phase("read"):
+        with TASKS_PATH.open("r", encoding="utf-8") as handle:
+            content = handle.read()
+    profiler.count("tasks_yaml_bytes", len(content))
+    with profiler.phase("parse"):
+        data = yaml.load(content, Loader=SafeLoader) if content.strip() else {}
     return data or {}
 
 
@@ -116,7 +227,7 @@ def ensure_structure(data: Dict) -> Dict:
     return ordered
 
 
-def append_log_entry(data: Dict, args: argparse.Namespace) -> None:
+def build_log_entry(args: argparse.Namespace) -> Dict:
     if args.check:
         raise SystemExit("--append-log cannot be combined with --check")
     required = {"log_date": args.log_date, "log_author": args.log_author, "log_summary": args.log_summary}
@@ -147,13 +258,17 @@ def append_log_entry(data: Dict, args: argparse.Namespace) -> None:
             raise SystemExit(f"Invalid timestamp in --log-entry: {timestamp!r}") from exc
         rows.append({"timestamp": timestamp, "change": change, "notes": notes})
 
-    new_entry = {
+    return {
         "date": log_date.isoformat(),
         "author": args.log_author.strip(),
         "summary": args.log_summary.strip(),
         "entries": rows,
     }
 
+
+def append_log_entry(data: Dict, args: argparse.Namespace) -> None:
+    new_entry = build_log_entry(args)
+
     data.setdefault("execution_log", []).append(new_entry)
 
 
@@ -225,11 +340,165 @@ def sort_execution_log(entries: List[Dict]) -> List[Dict]:
             "summary": summary,
             "entries": normalized_rows,
         }
+        if entry.get("run_id"):
+            normalized_entry["run_id"] = str(entry["run_id"]).strip()
         normalized.append((date, normalized_entry))
     normalized.sort(key=lambda item: item[0], reverse=True)
     return [entry for _, entry in normalized]
 
 
+def iter_session_records(path: Path) -> Iterator[Tuple[str, object]]:
+    """Yield ``(location, record)`` for every record in a JSON or JSONL file."""
+    if str(path) == "-":
+        lines: Iterable[str] = sys.stdin
+        name = "<stdin>"
+    elif path.suffix.lower() == ".json":
+        with path.open("r", encoding="utf-8") as handle:
+            try:
+                data = json.load(handle)
+            except ValueError as exc:
+                raise ValueError(f"{path}: invalid JSON ({exc})") from exc
+        if isinstance(data, dict):
+            data = data.get("execution_log", data.get("sessions"))
+        if not isinstance(data, list):
+            raise ValueError(f"{path}: expected a list of sessions or an object with an execution_log list")
+        for index, record in enumerate(data):
+            yield f"{path}[{index}]", record
+        return
+    else:
+        lines = path.open("r", encoding="utf-8")
+        name = str(path)
+    try:
+        for number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as exc:
+                raise ValueError(f"{name}:{number}: invalid JSON ({exc})") from exc
+            yield f"{name}:{number}", record
+    finally:
+        if lines is not sys.stdin:
+            lines.close()
+
+
+def describe_action(action: Dict) -> Tuple[str, str]:
+    """``(change, notes)`` table cells for one ``ACTIVITY_LOG.json`` action."""
+    kind = str(action.get("type", "action"))
+    subject = next(
+        (str(action[key]) for key in ("path", "command", "id", "rule") if action.get(key)),
+        "",
+    )
+    notes = [str(action[key]) for key in ("summary", "notes", "details", "outcome", "status") if action.get(key)]
+    change = f"{kind}: {subject}" if subject else kind
+    return change, "; ".join(notes)
+
+
+def activity_run_to_session(run: Dict, author: str) -> Dict:
+    """Convert an ``ACTIVITY_LOG.json`` run into an execution-log session."""
+    try:
+        started = datetime.strptime(str(run["run_id"]), "%Y-%m-%dT%H:%M:%SZ")
+    except ValueError as exc:
+        raise ValueError(f"run_id must be an ISO timestamp such as 2025-10-06T09:08:55Z: {run['run_id']!r}") from exc
+    scope = run.get("scope") or {}
+    outcome = run.get("summary") or {}
+    parts = []
+    if scope.get("modules_touched"):
+        parts.append("Touched " + ", ".join(str(module) for module in scope["modules_touched"]))
+    if outcome.get("issues_found"):
+        count = outcome["issues_found"]
+        parts.append(f"{count} issue{'' if count == 1 else 's'} found")
+    if outcome.get("todos_created"):
+        count = outcome["todos_created"]
+        parts.append(f"{count} TODO{'' if count == 1 else 's'} created")
+    if outcome.get("blocking_risks"):
+        parts.append("blocked by " + ", ".join(str(risk) for risk in outcome["blocking_risks"]))
+    timestamp = started.strftime("%H:%M")
+    rows = []
+    for action in run.get("actions") or []:
+        if not isinstance(action, dict):
+            raise ValueError("actions must contain dictionaries")
+        change, notes = describe_action(action)
+        rows.append({"timestamp": timestamp, "change": change, "notes": notes})
+    return {
+        "date": started.date().isoformat(),
+        "author": author,
+        "summary": "; ".join(parts) or "Activity run",
+        "entries": rows,
+        "run_id": run["run_id"],
+    }
+
+
+def session_content(entry: Dict) -> str:
+    """Canonical text of a normalized session, for telling identical sessions apart."""
+    return json.dumps(entry, sort_keys=True)
+
+
+def import_sessions(data: Dict, paths: List[Path], author: str) -> Tuple[int, int, List[str]]:
+    """Validate and merge sessions from ``paths`` into ``data``.
+
+    Returns ``(imported, duplicates, conflicts)``.  A session is a duplicate,
+    and skipped, when an identical one is already in the log, in an archive
+    or earlier in the import.  A session whose ``run_id`` is known but whose
+    content differs is skipped as well and described in ``conflicts``; one
+    without a ``run_id`` that shares only its date and author with another
+    session is imported, and the coincidence is noted in ``conflicts``.  Any
+    invalid record aborts the whole import before anything is written.
+    """
+    existing = list(data["execution_log"])
+    for month in archive_months():
+        existing.extend(load_archive(month))
+    contents: Set[str] = set()
+    runs: Dict[str, str] = {}
+    days: Set[Tuple[str, str]] = set()
+
+    def remember(entry: Dict) -> None:
+        content = session_content(entry)
+        contents.add(content)
+        if entry.get("run_id"):
+            runs.setdefault(str(entry["run_id"]), content)
+        days.add((entry["date"], entry["author"]))
+
+    for entry in sort_execution_log([entry for entry in existing if isinstance(entry, dict)]):
+        remember(entry)
+
+    imported: List[Dict] = []
+    errors: List[str] = []
+    conflicts: List[str] = []
+    duplicates = 0
+    for path in paths:
+        for location, record in iter_session_records(path):
+            try:
+                if not isinstance(record, dict):
+                    raise ValueError("expected an object")
+                if "actions" in record and "run_id" in record:
+                    record = activity_run_to_session(record, author)
+                session = sort_execution_log([record])[0]
+            except ValueError as exc:
+                errors.append(f"{location}: {exc}")
+                continue
+            content = session_content(session)
+            if content in contents:
+                duplicates += 1
+                continue
+            run_id = session.get("run_id")
+            if run_id and run_id in runs:
+                conflicts.append(f"{location}: run {run_id} is already logged with different content; not imported")
+                continue
+            if not run_id and (session["date"], session["author"]) in days:
+                conflicts.append(
+                    f"{location}: another session by {session['author']} on {session['date']} exists; imported both"
+                )
+            remember(session)
+            imported.append(session)
+    if errors:
+        shown = "\n  ".join(errors[:20])
+        more = f"\n  ... and {len(errors) - 20} more" if len(errors) > 20 else ""
+        raise ValueError(f"{len(errors)} invalid sessions, nothing imported:\n  {shown}{more}")
+    data["execution_log"].extend(imported)
+    return len(imported), duplicates, conflicts
+
+
 def serialize_yaml(data: Dict) -> str:
     return (
         yaml.dump(
@@ -295,14 +564,7 @@ def escape_table_cell(value: str) -> str:
     return value.replace("|", r"\|")
 
 
-def render_execution_log_md(entries: List[Dict]) -> str:
-    front_matter: Dict[str, object] = {}
-    front_matter["sessions_tracked"] = len(entries)
-    if entries:
-        latest = entries[0]
-        front_matter["latest_date"] = latest["date"]
-        front_matter["latest_author"] = latest["author"]
-        front_matter["latest_summary"] = latest["summary"]
+def render_log_front_matter(front_matter: Dict) -> str:
     fm_body = yaml.dump(
         front_matter,
         Dumper=IndentDumper,
@@ -310,53 +572,381 @@ def render_execution_log_md(entries: List[Dict]) -> str:
         allow_unicode=True,
         default_flow_style=False,
     ).strip()
-    lines = ["---", fm_body, "---", "", "# Execution Log", ""]
+    return "\n".join(["---", fm_body, "---"])
 
-    for entry in entries:
-        heading = f"## {entry['date']} — {entry['summary']} ({entry['author']})".strip()
-        lines.extend([heading, "", "| Timestamp | Change | Notes |", "|-----------|--------|-------|"])
-        for row in entry["entries"]:
-            lines.append(
-                "| {timestamp} | {change} | {notes} |".format(
-                    timestamp=escape_table_cell(row["timestamp"]),
-                    change=escape_table_cell(row["change"]),
-                    notes=escape_table_cell(row["notes"]),
-                )
+
+def log_front_matter(sessions: int, latest: Optional[Dict], archives: List[str]) -> Dict:
+    front_matter: Dict[str, object] = {}
+    front_matter["sessions_tracked"] = sessions
+    if latest:
+        front_matter["latest_date"] = latest["date"]
+        front_matter["latest_author"] = latest["author"]
+        front_matter["latest_summary"] = latest["summary"]
+    if archives:
+        front_matter["archives"] = [f"execution_log/{month}.md" for month in archives]
+    return front_matter
+
+
+def render_log_section(entry: Dict) -> List[str]:
+    heading = f"## {entry['date']} — {entry['summary']} ({entry['author']})".strip()
+    lines = [heading, "", "| Timestamp | Change | Notes |", "|-----------|--------|-------|"]
+    for row in entry["entries"]:
+        lines.append(
+            "| {timestamp} | {change} | {notes} |".format(
+                timestamp=escape_table_cell(row["timestamp"]),
+                change=escape_table_cell(row["change"]),
+                notes=escape_table_cell(row["notes"]),
             )
-        lines.append("")
+        )
+    lines.append("")
+    return lines
+
+
+def render_execution_log_md(
+    entries: List[Dict], archives: Iterable[str] = (), title: str = "Execution Log"
+) -> str:
+    front_matter = log_front_matter(len(entries), entries[0] if entries else None, list(archives))
+    lines = [render_log_front_matter(front_matter), "", f"# {title}", ""]
+    for entry in entries:
+        lines.extend(render_log_section(entry))
     return "\n".join(lines).rstrip() + "\n"
 
 
+def archive_months() -> List[str]:
+    return sorted(path.stem for path in ARCHIVE_DIR.glob("*.yaml"))
+
+
+def load_archive(month: str) -> List[Dict]:
+    path = ARCHIVE_DIR / f"{month}.yaml"
+    if not path.exists():
+        return []
+    data = yaml.load(path.read_text(encoding="utf-8"), Loader=SafeLoader) or {}
+    entries = data.get("execution_log") or []
+    if not isinstance(entries, list):
+        raise ValueError(f"execution_log in {path.relative_to(ROOT)} must be a list")
+    return entries
+
+
+def split_archived_sessions(entries: List[Dict], days: int) -> Tuple[List[Dict], Dict[str, List[Dict]]]:
+    """Split a sorted log into hot sessions and ``{YYYY-MM: sessions}`` to archive.
+
+    The window is measured from the newest session rather than from today,
+    so the result only depends on the log itself.
+    """
+    if not entries:
+        return entries, {}
+    newest = datetime.strptime(entries[0]["date"], "%Y-%m-%d").date()
+    cutoff = (newest - timedelta(days=days)).isoformat()
+    hot: List[Dict] = []
+    archived: Dict[str, List[Dict]] = {}
+    for entry in entries:
+        if entry["date"] >= cutoff:
+            hot.append(entry)
+        else:
+            archived.setdefault(entry["date"][:7], []).append(entry)
+    return hot, archived
+
+
+def write_archives(archived: Dict[str, List[Dict]], check: bool, pending: List[Path]) -> None:
+    """Merge ``archived`` sessions into their month files and re-render every archive."""
+    months = sorted(set(archive_months()) | set(archived))
+    if months and not check:
+        ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
+    for month in months:
+        entries = sort_execution_log(load_archive(month) + archived.get(month, []))
+        if month in archived:
+            write_if_changed(ARCHIVE_DIR / f"{month}.yaml", serialize_yaml({"execution_log": entries}), check, pending)
+        markdown = render_execution_log_md(entries, title=f"Execution Log — {month}")
+        write_if_changed(ARCHIVE_DIR / f"{month}.md", markdown, check, pending)
+
+
+def write_atomic(path: Path, content: str) -> None:
+    """Replace ``path`` in one step so readers never see a partial file."""
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with tmp_path.open("w", encoding="utf-8") as handle:
+        handle.write(content)
+    os.replace(tmp_path, path)
+
+
 def write_if_changed(path: Path, content: str, check: bool, pending: List[Path]) -> None:
     current = path.read_text(encoding="utf-8") if path.exists() else ""
     if current == content:
+        profiler.count("files_unchanged")
         return
     if check:
+        profiler.count("files_out_of_date")
         pending.append(path)
     else:
-        path.write_text(content, encoding="utf-8")
+        profiler.count("files_written")
+        write_atomic(path, content)
 
 
-def main() -> None:
-    args = parse_args()
-    data = ensure_structure(load_tasks())
+def _lock_fd(fd: int, exclusive: bool = True) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+    else:
+        # msvcrt only has exclusive byte-range locks; LK_LOCK retries for ~10s.
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
 
-    if args.append_log:
-        append_log_entry(data, args)
 
-    data["tasks"] = sort_tasks(data["tasks"])
-    data["execution_log"] = sort_execution_log(data["execution_log"])
+def _unlock_fd(fd: int) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
 
-    pending: List[Path] = []
 
-    tasks_yaml = serialize_yaml(data)
-    write_if_changed(TASKS_PATH, tasks_yaml, args.check, pending)
+@contextmanager
+def status_lock():
+    """Hold the advisory lock that serializes writers of the status documents."""
+    LOCK_PATH.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(LOCK_PATH, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        with profiler.phase("lock_wait"):
+            _lock_fd(fd)
+        try:
+            yield
+        finally:
+            _unlock_fd(fd)
+    finally:
+        os.close(fd)
+
+
+def journal_append(entry: Dict) -> None:
+    """Queue ``entry`` for the next compaction without taking the writer lock.
+
+    The line is written with a single ``O_APPEND`` write under a shared lock
+    on the journal itself.  If a compaction claimed (renamed) the journal
+    between our ``open`` and the lock, the descriptor no longer points at
+    ``JOURNAL_PATH`` and the append is retried on a fresh journal.
+    """
+    line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+    while True:
+        fd = os.open(JOURNAL_PATH, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            _lock_fd(fd, exclusive=False)
+            try:
+                try:
+                    current = os.stat(JOURNAL_PATH)
+                except FileNotFoundError:
+                    continue
+                if os.path.samestat(current, os.fstat(fd)):
+                    os.write(fd, line)
+                    return
+            finally:
+                _unlock_fd(fd)
+        finally:
+            os.close(fd)
+
+
+def claim_journal() -> List[Path]:
+    """Move the journal aside for merging; call with the writer lock held.
+
+    Returns every claimed journal, including ones left behind by a run that
+    failed before finishing.  Taking an exclusive lock on each waits out
+    appends that were already in flight when it was renamed.
+    """
+    if JOURNAL_PATH.exists():
+        os.replace(JOURNAL_PATH, JOURNAL_PATH.with_name(f"{JOURNAL_PATH.name}.{os.getpid()}.claimed"))
+    claimed = sorted(JOURNAL_PATH.parent.glob(f"{JOURNAL_PATH.name}.*.claimed"))
+    for path in claimed:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            _lock_fd(fd)
+            _unlock_fd(fd)
+        finally:
+            os.close(fd)
+    return claimed
+
+
+def merge_journal(data: Dict, claimed: List[Path]) -> int:
+    """Add the claimed journal sessions to ``data``; return how many were new.
+
+    Sessions identical to one already in the log, or in the archive of their
+    month, are skipped, so re-running a compaction that died after writing
+    the documents is harmless even when sessions were archived meanwhile.
+    """
+    existing = {json.dumps(entry, sort_keys=True) for entry in sort_execution_log(data["execution_log"])}
+    loaded_months: Set[str] = set()
+    merged = 0
+    for path in claimed:
+        for location, record in iter_session_records(path):
+            try:
+                session = sort_execution_log([record])[0]
+            except (AttributeError, ValueError) as exc:
+                raise ValueError(f"{location}: {exc}") from exc
+            month = session["date"][:7]
+            if month not in loaded_months:
+                loaded_months.add(month)
+                existing.update(
+                    json.dumps(entry, sort_keys=True) for entry in sort_execution_log(load_archive(month))
+                )
+            key = json.dumps(session, sort_keys=True)
+            if key in existing:
+                continue
+            existing.add(key)
+            data["execution_log"].append(session)
+            merged += 1
+    return merged
+
+
+def file_digest(path: Path) -> Optional[str]:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def compute_stamp() -> Dict:
+    """Hashes of the documents and of everything that shapes their rendering."""
+    generator = hashlib.sha256(Path(__file__).read_bytes())
+    generator.update(yaml.__version__.encode("utf-8"))
+    return {
+        "version": STAMP_VERSION,
+        "generator": generator.hexdigest(),
+        "files": {
+            "tasks": file_digest(TASKS_PATH),
+            "status": file_digest(STATUS_PATH),
+            "execution_log": file_digest(EXECUTION_LOG_PATH),
+        },
+        "archives": {path.name: file_digest(path) for path in sorted(ARCHIVE_DIR.glob("*.*"))},
+    }
 
-    status_md = render_status_md(data["metadata"], data["tasks"])
-    write_if_changed(STATUS_PATH, status_md, args.check, pending)
 
-    execution_log_md = render_execution_log_md(data["execution_log"])
-    write_if_changed(EXECUTION_LOG_PATH, execution_log_md, args.check, pending)
+def stamp_is_current() -> bool:
+    try:
+        recorded = json.loads(STAMP_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False
+    return recorded == compute_stamp()
+
+
+def render_stamp() -> str:
+    return json.dumps(compute_stamp(), indent=2) + "\n"
+
+
+def append_log_in_place(entry: Dict, archive_after_days: Optional[int]) -> bool:
+    """Splice one new session into ``tasks.yaml`` and ``EXECUTION_LOG.md``.
+
+    Only valid while the stamp proves both files are exactly what a full
+    run renders: sessions are then sorted newest first, each starts with a
+    ``  - date: '...'`` line in the YAML and a ``## <date>`` heading in the
+    markdown, and the YAML ends with the execution log.  Returns ``False``
+    (leaving everything untouched) whenever that cannot be relied on, or
+    when the new session would push older ones out of the archive window.
+    """
+    if not stamp_is_current():
+        return False
+    tasks_text = TASKS_PATH.read_text(encoding="utf-8")
+    log_text = EXECUTION_LOG_PATH.read_text(encoding="utf-8")
+    log_start = tasks_text.find("\nexecution_log:\n")
+    front = _FRONT_MATTER.match(log_text)
+    if log_start < 0 or front is None:
+        return False
+    yaml_sessions = list(_YAML_SESSION.finditer(tasks_text, log_start))
+    md_sessions = list(_MD_SESSION.finditer(log_text))
+    if len(yaml_sessions) != len(md_sessions):
+        return False
+
+    entry = sort_execution_log([entry])[0]
+    dates = [match.group(1) for match in yaml_sessions]
+    if archive_after_days is not None and dates:
+        newest = max(dates[0], entry["date"])
+        oldest = min(dates[-1], entry["date"])
+        if split_archived_sessions([{"date": newest}, {"date": oldest}], archive_after_days)[1]:
+            return False
+    # A stable sort places the new session after existing ones of the same date.
+    position = next((index for index, value in enumerate(dates) if value < entry["date"]), len(dates))
+
+    entry_yaml = serialize_yaml({"execution_log": [entry]}).split("\n", 1)[1]
+    offset = yaml_sessions[position].start() if position < len(dates) else len(tasks_text)
+    tasks_text = tasks_text[:offset] + entry_yaml + tasks_text[offset:]
+
+    previous = yaml.load(front.group(1), Loader=SafeLoader) or {}
+    if position == 0:
+        latest = entry
+    else:
+        latest = {key: previous[f"latest_{key}"] for key in ("date", "author", "summary")}
+    archives = [Path(link).stem for link in previous.get("archives") or []]
+    front_matter = log_front_matter(len(dates) + 1, latest, archives)
+    section = "\n".join(render_log_section(entry))
+    if position < len(dates):
+        offset = md_sessions[position].start()
+        body = log_text[front.end():offset] + section + "\n" + log_text[offset:]
+    else:
+        body = log_text[front.end():] + "\n" + section.rstrip("\n") + "\n"
+    log_text = render_log_front_matter(front_matter) + "\n" + body
+
+    write_atomic(TASKS_PATH, tasks_text)
+    write_atomic(EXECUTION_LOG_PATH, log_text)
+    write_atomic(STAMP_PATH, render_stamp())
+    return True
+
+
+def update_documents(args: argparse.Namespace, journal: List[Path]) -> None:
+    if args.append_log and not args.import_sessions and not journal and not args.no_stamp:
+        entry = build_log_entry(args)
+        with profiler.phase("append_in_place"):
+            appended = append_log_in_place(entry, args.archive_after_days)
+        if appended:
+            print(f"Appended execution session for {entry['date']} by {entry['author']}.", file=sys.stdout)
+            return
+    elif (
+        args.archive_after_days is None
+        and not args.import_sessions
+        and not journal
+        and not args.no_stamp
+    ):
+        with profiler.phase("stamp"):
+            current = stamp_is_current()
+        if current:
+            profiler.count("stamp_hits")
+            return
+
+    data = ensure_structure(load_tasks())
+
+    if args.append_log:
+        append_log_entry(data, args)
+    if args.import_sessions:
+        with profiler.phase("import"):
+            imported, duplicates, conflicts = import_sessions(data, args.import_sessions, args.import_author)
+        for conflict in conflicts:
+            print(f"warning: {conflict}", file=sys.stderr)
+    if journal:
+        with profiler.phase("journal", count=len(journal)):
+            queued = merge_journal(data, journal)
+
+    with profiler.phase("sort"):
+        data["tasks"] = sort_tasks(data["tasks"])
+        data["execution_log"] = sort_execution_log(data["execution_log"])
+    profiler.count("tasks", sum(len(entries) for entries in data["tasks"].values()))
+
+    pending: List[Path] = []
+    archived: Dict[str, List[Dict]] = {}
+    with profiler.phase("archives"):
+        if args.archive_after_days is not None and not args.check:
+            data["execution_log"], archived = split_archived_sessions(data["execution_log"], args.archive_after_days)
+        write_archives(archived, args.check, pending)
+    profiler.count("sessions", len(data["execution_log"]))
+    profiler.count("sessions_archived", sum(len(entries) for entries in archived.values()))
+
+    with profiler.phase("serialize_yaml"):
+        tasks_yaml = serialize_yaml(data)
+    with profiler.phase("write"):
+        write_if_changed(TASKS_PATH, tasks_yaml, args.check, pending)
+
+    with profiler.phase("render_status"):
+        status_md = render_status_md(data["metadata"], data["tasks"])
+    with profiler.phase("write"):
+        write_if_changed(STATUS_PATH, status_md, args.check, pending)
+
+    with profiler.phase("render_execution_log"):
+        months = sorted(set(archive_months()) | set(archived))
+        execution_log_md = render_execution_log_md(data["execution_log"], months)
+    with profiler.phase("write"):
+        write_if_changed(EXECUTION_LOG_PATH, execution_log_md, args.check, pending)
 
     if args.check:
         if pending:
@@ -365,6 +955,21 @@ def main() -> None:
             sys.exit(1)
         return
 
+    with profiler.phase("stamp"):
+        stamp = render_stamp()
+    with profiler.phase("write"):
+        write_if_changed(STAMP_PATH, stamp, False, pending)
+    for path in journal:
+        path.unlink()
+
+    if journal:
+        print(f"Merged {queued} journaled execution sessions.", file=sys.stdout)
+    if args.import_sessions:
+        print(
+            f"Imported {imported} execution sessions ({duplicates} duplicates skipped, "
+            f"{len(conflicts)} conflicts reported).",
+            file=sys.stdout,
+        )
     if args.append_log:
         last = data["execution_log"][0]
         print(
@@ -373,6 +978,37 @@ def main() -> None:
         )
 
 
+def run(args: argparse.Namespace) -> None:
+    if args.import_sessions and args.check:
+        raise SystemExit("--import-sessions cannot be combined with --check")
+    if args.journal:
+        if not args.append_log:
+            raise SystemExit("--journal requires --append-log")
+        entry = build_log_entry(args)
+        journal_append(entry)
+        print(f"Queued execution session for {entry['date']} by {entry['author']} in the journal.", file=sys.stdout)
+        return
+    if args.check:
+        update_documents(args, [])
+        return
+    with status_lock():
+        update_documents(args, claim_journal())
+
+
+def main() -> None:
+    global profiler
+    args = parse_args()
+    if args.profile:
+        profiler = Profiler("update_status_docs", trace_memory=args.profile_memory)
+    try:
+        with maybe_cprofile(args.cprofile):
+            run(args)
+    finally:
+        if args.profile:
+            profiler.write(args.profile)
+            print(f"Profile written to {args.profile}", file=sys.stdout)
+
+
 if __name__ == "__main__":
     try:
         main()
@@ -0,0 +1,12 @@
+"""Make the tooling importable the way the scripts import each other."""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+for path in (ROOT / "scripts", ROOT):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
@@ -0,0 +1,42 @@
+-- MySQL dump 10.13  Distrib 8.0.36, for Linux (x86_64)
+--
+-- Host: localhost    Database: yasgmp
+/*!40101 SET NAMES utf8mb4 */;
+
+DROP TABLE IF EXISTS `users`;
+CREATE TABLE `users` (
+  `id` int NOT NULL AUTO_INCREMENT,
+  `username` varchar(100) NOT NULL,
+  `full_name` varchar(255) DEFAULT NULL COMMENT 'NOT NULL in the old schema',
+  `balance` decimal(12,2) NOT NULL DEFAULT '0.00',
+  `avatar` blob,
+  `created_at` datetime DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (`id`),
+  UNIQUE KEY `ux_users_username` (`username`),
+  KEY `ix_users_name_created` (`full_name`(50),`created_at`)
+) ENGINE=InnoDB AUTO_INCREMENT=4 DEFAULT CHARSET=utf8mb4;
+
+LOCK TABLES `users` WRITE;
+INSERT INTO `users` VALUES (1,'admin','Ann O\'Neil',10.50,_binary 'a\0b',NULL),(2,'op;1','Semi; colon (paren)',-0.25,0xCAFE,'2024-01-02 03:04:05');
+INSERT INTO `users` (`id`, `username`, `full_name`, `balance`, `avatar`, `created_at`) VALUES (3,'tab','a\tb\nc\\d\Ze',1e3,X'00ff',NULL);
+UNLOCK TABLES;
+
+DROP TABLE IF EXISTS `work_orders`;
+CREATE TABLE `work_orders` (
+  `id` bigint unsigned NOT NULL,
+  `user_id` int DEFAULT NULL,
+  `title` text NOT NULL,
+  PRIMARY KEY (`id`),
+  KEY `fk_work_orders_user` (`user_id`),
+  CONSTRAINT `fk_work_orders_user` FOREIGN KEY (`user_id`) REFERENCES `users` (`id`) ON DELETE SET NULL ON UPDATE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+LOCK TABLES `work_orders` WRITE;
+INSERT INTO `work_orders` VALUES (10,1,'Replace filter'),(11,NULL,'It''s done');
+UNLOCK TABLES;
+
+DROP TABLE IF EXISTS `empty_table`;
+CREATE TABLE `empty_table` (
+  `code` char(3) NOT NULL,
+  PRIMARY KEY (`code`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
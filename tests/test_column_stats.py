@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import pytest
+
+from column_stats import HyperLogLog
+
+
+@pytest.mark.parametrize("distinct", [0, 1, 50, 1_000, 20_000])
+def test_hyperloglog_estimate_is_close(distinct):
+    sketch = HyperLogLog()
+    values = [f"value-{index}" for index in range(distinct)]
+    # Repeats must not be counted twice.
+    sketch.update(values)
+    sketch.update(values[: distinct // 2])
+    # 1.04 / sqrt(m) is one standard error; allow four of them.
+    tolerance = 4 * 1.04 / len(sketch.registers) ** 0.5
+    assert abs(sketch.estimate() - distinct) <= max(1, distinct * tolerance)
+
+
+def test_hyperloglog_hashes_bytes_and_text_alike():
+    by_text, by_bytes = HyperLogLog(), HyperLogLog()
+    by_text.update(["a", "b"])
+    by_bytes.update([b"a", b"b"])
+    assert by_text.registers == by_bytes.registers
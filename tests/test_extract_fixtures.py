@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import json
+
+from conftest import FIXTURES
+from extract_fixtures import extract
+
+DUMP = FIXTURES / "dump.sql"
+
+
+def test_every_selected_table_gets_a_fixture(tmp_path):
+    counts = extract(DUMP, tmp_path, ["csv", "jsonl"], exclude=["users"])
+    assert counts == {"work_orders": 2, "empty_table": 0}
+    assert (tmp_path / "empty_table.csv").read_text(encoding="utf-8").splitlines() == ["code"]
+    assert (tmp_path / "empty_table.jsonl").read_text(encoding="utf-8") == ""
+    assert not (tmp_path / "users.csv").exists()
+
+
+def test_limit_and_exact_decimals(tmp_path):
+    counts = extract(DUMP, tmp_path, ["jsonl"], tables=["users"], limit=2)
+    assert counts == {"users": 2}
+    rows = [json.loads(line) for line in (tmp_path / "users.jsonl").read_text(encoding="utf-8").splitlines()]
+    assert [row["balance"] for row in rows] == ["10.50", "-0.25"]
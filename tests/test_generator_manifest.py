@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import os
+
+from generate_missing_models import is_up_to_date
+
+
+def entry_for(path, schema_hash="abc"):
+    stat = path.stat()
+    return {"schema": schema_hash, "files": {path.name: {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}}}
+
+
+def test_manifest_entry_matches_untouched_output(tmp_path):
+    output = tmp_path / "User.cs"
+    output.write_text("class User {}", encoding="utf-8")
+    assert is_up_to_date(entry_for(output), "abc", tmp_path)
+
+
+def test_manifest_entry_is_stale_when_schema_or_files_change(tmp_path):
+    output = tmp_path / "User.cs"
+    output.write_text("class User {}", encoding="utf-8")
+    entry = entry_for(output)
+
+    assert not is_up_to_date(entry, "def", tmp_path)
+    assert not is_up_to_date(None, "abc", tmp_path)
+    assert not is_up_to_date({"schema": "abc", "files": {}}, "abc", tmp_path)
+
+    stat = output.stat()
+    os.utime(output, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert not is_up_to_date(entry, "abc", tmp_path)
+
+    output.unlink()
+    assert not is_up_to_date(entry, "abc", tmp_path)
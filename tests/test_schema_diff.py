@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import io
+
+from conftest import FIXTURES
+from schema_diff import compare_schemas, regenerate_tables
+from sql_dump import load_schema
+
+OLD_DUMP = (FIXTURES / "dump.sql").read_text(encoding="utf-8")
+
+
+def schema_of(text: str):
+    return load_schema(io.BytesIO(text.encode("utf-8")))
+
+
+def test_identical_snapshots_have_nothing_to_regenerate():
+    old = schema_of(OLD_DUMP)
+    # A fresh export only moves the AUTO_INCREMENT counter.
+    new = schema_of(OLD_DUMP.replace("AUTO_INCREMENT=4", "AUTO_INCREMENT=4000"))
+    report = compare_schemas(old, new)
+    assert report["summary"]["unchanged"] == 3
+    assert report["altered_tables"] == []
+    assert report["regenerate"] == []
+
+
+def test_column_change_regenerates_only_that_table():
+    old = schema_of(OLD_DUMP)
+    new = schema_of(OLD_DUMP.replace("`title` text NOT NULL", "`title` varchar(200) DEFAULT NULL"))
+    report = compare_schemas(old, new)
+    assert [entry["table"] for entry in report["altered_tables"]] == ["work_orders"]
+    changes = report["altered_tables"][0]["columns"]["altered"][0]
+    assert changes["column"] == "title"
+    assert changes["changes"]["nullable"] == [False, True]
+    assert report["regenerate"] == ["work_orders"]
+
+
+def test_principal_key_change_regenerates_dependents():
+    old = schema_of(OLD_DUMP)
+    new = schema_of(OLD_DUMP.replace("PRIMARY KEY (`id`),\n  UNIQUE KEY", "PRIMARY KEY (`id`,`username`),\n  UNIQUE KEY"))
+    report = compare_schemas(old, new)
+    assert report["altered_tables"][0]["primary_key"] == [["id"], ["id", "username"]]
+    # work_orders is unchanged itself but navigates to users by its key.
+    assert report["regenerate"] == ["users", "work_orders"]
+
+
+def test_added_and_dropped_tables():
+    old = schema_of(OLD_DUMP)
+    start = OLD_DUMP.index("DROP TABLE IF EXISTS `users`;")
+    end = OLD_DUMP.index("DROP TABLE IF EXISTS `work_orders`;")
+    without_users = OLD_DUMP[:start] + OLD_DUMP[end:]
+    extra = "CREATE TABLE `sites` (\n  `id` int NOT NULL,\n  PRIMARY KEY (`id`)\n) ENGINE=InnoDB;\n"
+
+    report = compare_schemas(old, schema_of(without_users + extra))
+    assert report["added_tables"] == ["sites"]
+    assert report["dropped_tables"] == ["users"]
+    # The dropped principal still changes the dependent's navigation properties.
+    assert report["regenerate"] == ["sites", "work_orders"]
+
+    report = compare_schemas(schema_of(without_users), old)
+    assert report["added_tables"] == ["users"]
+    assert report["regenerate"] == ["users", "work_orders"]
+
+
+def test_index_and_foreign_key_changes_are_reported():
+    old = schema_of(OLD_DUMP)
+    new = schema_of(OLD_DUMP.replace("ON DELETE SET NULL", "ON DELETE CASCADE"))
+    entry = compare_schemas(old, new)["altered_tables"][0]
+    altered = entry["foreign_keys"]["altered"][0]
+    assert altered["name"] == "fk_work_orders_user"
+    assert (altered["old"]["on_delete"], altered["new"]["on_delete"]) == ("SET NULL", "CASCADE")
+    assert "columns" not in entry
+
+
+def test_regenerate_tables_keeps_explicit_changes():
+    schema = schema_of(OLD_DUMP)
+    assert regenerate_tables(schema, schema, ["empty_table"]) == ["empty_table"]
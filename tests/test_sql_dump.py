@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import io
+from decimal import Decimal
+
+import pytest
+
+from conftest import FIXTURES
+from sql_dump import (
+    ForeignKey,
+    Index,
+    RowBatch,
+    TableSchema,
+    decode_row,
+    iter_create_tables,
+    iter_dump,
+    load_schema,
+    parse_create_table,
+    table_hash,
+)
+
+DUMP = FIXTURES / "dump.sql"
+
+
+def rows_by_table(events):
+    rows = {}
+    for event in events:
+        if isinstance(event, RowBatch):
+            rows.setdefault(event.table, []).extend(event.rows)
+    return rows
+
+
+def test_create_table_columns_keys_and_constraints():
+    schema = load_schema(DUMP)
+    assert list(schema) == ["users", "work_orders", "empty_table"]
+
+    users = schema["users"]
+    assert users.primary_key == ("id",)
+    assert [column.name for column in users.columns] == [
+        "id", "username", "full_name", "balance", "avatar", "created_at",
+    ]
+    assert users.column("username").nullable is False
+    assert users.column("username").max_length == 100
+    # "NOT NULL" inside the COMMENT literal must not count.
+    assert users.column("full_name").nullable is True
+    assert users.column("balance").clr_type == "decimal"
+    assert users.column("balance").precision == (12, 2)
+    assert users.indexes == (
+        Index(name="ux_users_username", columns=("username",), kind="unique"),
+        Index(name="ix_users_name_created", columns=("full_name", "created_at"), kind="index"),
+    )
+    assert users.indexes[0].unique
+
+    work_orders = schema["work_orders"]
+    assert work_orders.foreign_keys == (
+        ForeignKey(
+            name="fk_work_orders_user",
+            columns=("user_id",),
+            ref_table="users",
+            ref_columns=("id",),
+            on_delete="SET NULL",
+            on_update="CASCADE",
+        ),
+    )
+    assert schema["empty_table"].primary_key == ("code",)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 20])
+def test_chunk_boundaries_do_not_change_the_result(chunk_size):
+    assert list(iter_create_tables(DUMP, chunk_size=chunk_size)) == list(iter_create_tables(DUMP))
+    assert rows_by_table(iter_dump(DUMP, chunk_size=chunk_size)) == rows_by_table(iter_dump(DUMP))
+
+
+def test_iter_dump_rows_and_column_lists():
+    events = list(iter_dump(DUMP, batch_size=1))
+    batches = [event for event in events if isinstance(event, RowBatch)]
+    assert all(len(batch.rows) == 1 for batch in batches)
+    assert batches[0].columns is None
+    assert batches[2].columns == ("id", "username", "full_name", "balance", "avatar", "created_at")
+
+    rows = rows_by_table(events)
+    assert rows["users"][1] == (2, "op;1", "Semi; colon (paren)", Decimal("-0.25"), b"\xca\xfe", "2024-01-02 03:04:05")
+    assert rows["work_orders"] == [(10, 1, "Replace filter"), (11, None, "It's done")]
+    assert "empty_table" not in rows
+
+
+def test_iter_dump_table_filters():
+    assert set(rows_by_table(iter_dump(DUMP, tables=["work_orders"]))) == {"work_orders"}
+    assert set(rows_by_table(iter_dump(DUMP, exclude=["users"]))) == {"work_orders"}
+    # Schemas are reported for every table regardless of the row filter.
+    schemas = [event.name for event in iter_dump(DUMP, tables=[]) if isinstance(event, TableSchema)]
+    assert schemas == ["users", "work_orders", "empty_table"]
+
+
+def test_iter_dump_accepts_file_objects():
+    assert rows_by_table(iter_dump(io.BytesIO(DUMP.read_bytes()))) == rows_by_table(iter_dump(DUMP))
+
+
+@pytest.mark.parametrize(
+    "body, expected",
+    [
+        (rb"1,-2,NULL", (1, -2, None)),
+        (rb"'it\'s','it''s','a\\b'", ("it's", "it's", "a\\b")),
+        (rb"'\0\b\n\r\t\Z\"\%\_'", ("\0\b\n\r\t\x1a\"\\%\\_",)),
+        (rb"'comma, paren) and ; inside'", ("comma, paren) and ; inside",)),
+        ("'grüß'".encode("utf-8"), ("grüß",)),
+        (rb"_binary 'a\0b',_binary'\''", (b"a\0b", b"'")),
+        (rb"0xCAFE,X'00ff',x'',b'101'", (b"\xca\xfe", b"\x00\xff", b"", 5)),
+        (rb"0.10,-12.50,1e3,3.14159265358979323846", (
+            Decimal("0.10"), Decimal("-12.50"), Decimal("1e3"), Decimal("3.14159265358979323846"),
+        )),
+    ],
+)
+def test_decode_row(body, expected):
+    values = decode_row(body)
+    assert values == expected
+    assert [type(value) for value in values] == [type(value) for value in expected]
+
+
+def test_decode_row_keeps_decimal_scale():
+    assert str(decode_row(b"0.10")[0]) == "0.10"
+
+
+def test_table_hash_ignores_table_options():
+    ddl = "CREATE TABLE `t` (\n  `id` int NOT NULL,\n  PRIMARY KEY (`id`)\n) ENGINE=InnoDB AUTO_INCREMENT={};"
+    first, second = parse_create_table(ddl.format(1)), parse_create_table(ddl.format(99))
+    assert first.ddl != second.ddl
+    assert table_hash(first) == table_hash(second)
+    changed = parse_create_table(ddl.format(1).replace("`id` int", "`id` bigint"))
+    assert table_hash(changed) != table_hash(first)
+
+
+def test_schema_round_trips_through_dict():
+    for table in load_schema(DUMP).values():
+        assert TableSchema.from_dict(table.to_dict()) == table
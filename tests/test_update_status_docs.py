@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import json
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+from conftest import ROOT
+
+SEED = """\
+metadata:
+  project_overview: Test tree for the status tooling.
+  current_focus: []
+  blockers: []
+  next_steps: []
+tasks:
+  backlog:
+    - id: T-2
+      title: Second task
+  in_progress: []
+  completed:
+    - id: T-1
+      title: First task
+      completed_on: '2025-01-04'
+execution_log:
+  - date: '2025-03-10'
+    author: Alice
+    summary: 'Calibration: follow-up'
+    entries:
+      - timestamp: '09:00'
+        change: Reviewed the audit trail
+        notes: Found a | in the notes
+  - date: '2025-02-01'
+    author: Bob
+    summary: Work orders
+    entries:
+      - timestamp: '14:30'
+        change: Added the picker
+        notes: ''
+      - timestamp: '08:15'
+        change: Started
+        notes: First pass
+  - date: '2025-01-05'
+    author: Alice
+    summary: Kick-off
+    entries:
+      - timestamp: '10:00'
+        change: Created the repo
+        notes: ''
+"""
+
+DOCUMENTS = ("docs/tasks.yaml", "docs/STATUS.md", "docs/EXECUTION_LOG.md")
+
+
+def make_tree(base: Path) -> Path:
+    """A scratch checkout holding just the status tooling and seeded documents."""
+    (base / "scripts").mkdir(parents=True)
+    for name in ("update_status_docs.py", "profiling.py"):
+        shutil.copy2(ROOT / "scripts" / name, base / "scripts" / name)
+    (base / "docs").mkdir()
+    (base / "docs" / "tasks.yaml").write_text(SEED, encoding="utf-8")
+    return base
+
+
+def command(tree: Path, *args: str):
+    return [sys.executable, str(tree / "scripts" / "update_status_docs.py"), *args]
+
+
+def run(tree: Path, *args: str) -> subprocess.CompletedProcess:
+    result = subprocess.run(command(tree, *args), capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    return result
+
+
+def append_args(date: str, author: str, summary: str):
+    return [
+        "--append-log",
+        "--log-date", date,
+        "--log-author", author,
+        "--log-summary", summary,
+        "--log-entry", "11:00|Spliced row|notes",
+        "--log-entry", "07:45|Earlier row|",
+    ]
+
+
+def read_documents(tree: Path):
+    return {name: (tree / name).read_bytes() for name in DOCUMENTS}
+
+
+@pytest.mark.parametrize(
+    "log_date",
+    ["2025-04-01", "2025-03-10", "2025-02-15", "2025-02-01", "2024-12-31"],
+    ids=["newest", "same-as-newest", "middle", "same-as-middle", "oldest"],
+)
+def test_in_place_append_matches_full_regeneration(tmp_path, log_date):
+    spliced = make_tree(tmp_path / "spliced")
+    run(spliced)  # full render; records the stamp
+    profile = tmp_path / "profile.json"
+    run(spliced, *append_args(log_date, "Carol", "Spliced session"), "--profile", str(profile))
+    phases = json.loads(profile.read_text(encoding="utf-8"))["phases"]
+    assert "append_in_place" in phases
+    assert "serialize_yaml" not in phases, "the append fell back to a full regeneration"
+
+    rendered = make_tree(tmp_path / "rendered")
+    run(rendered, "--no-stamp", *append_args(log_date, "Carol", "Spliced session"))
+
+    assert read_documents(spliced) == read_documents(rendered)
+    run(spliced, "--check", "--no-stamp")
+
+
+def test_in_place_append_falls_back_after_manual_edit(tmp_path):
+    tree = make_tree(tmp_path / "tree")
+    run(tree)
+    tasks = tree / "docs" / "tasks.yaml"
+    tasks.write_text(tasks.read_text(encoding="utf-8").replace("Kick-off", "Kick off"), encoding="utf-8")
+    profile = tmp_path / "profile.json"
+    run(tree, *append_args("2025-04-01", "Carol", "After an edit"), "--profile", str(profile))
+    assert "serialize_yaml" in json.loads(profile.read_text(encoding="utf-8"))["phases"]
+    run(tree, "--check", "--no-stamp")
+
+
+def test_concurrent_journal_appends_survive_compaction(tmp_path):
+    tree = make_tree(tmp_path / "tree")
+    run(tree)
+    summaries = [f"Journaled session {index}" for index in range(24)]
+    processes = []
+    for index, summary in enumerate(summaries):
+        date = f"2025-05-{index % 28 + 1:02d}"
+        processes.append(subprocess.Popen(
+            command(tree, *append_args(date, "Dana", summary), "--journal"),
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        ))
+        if index % 6 == 3:
+            # Compactions race with the appends that are still in flight.
+            processes.append(subprocess.Popen(command(tree), stdout=subprocess.PIPE, stderr=subprocess.PIPE))
+    for process in processes:
+        _, stderr = process.communicate(timeout=120)
+        assert process.returncode == 0, stderr.decode("utf-8", errors="replace")
+    run(tree)
+
+    data = yaml.safe_load((tree / "docs" / "tasks.yaml").read_text(encoding="utf-8"))
+    journaled = [entry["summary"] for entry in data["execution_log"] if entry["author"] == "Dana"]
+    assert sorted(journaled) == sorted(summaries)
+    assert len(data["execution_log"]) == 3 + len(summaries)
+    assert not list((tree / "docs").glob(".execution-log.journal.jsonl*"))
+    run(tree, "--check", "--no-stamp")
+
+
+def test_merge_is_idempotent_for_a_reclaimed_journal(tmp_path):
+    tree = make_tree(tmp_path / "tree")
+    run(tree, *append_args("2025-04-01", "Erin", "Queued once"), "--journal")
+    journal = tree / "docs" / ".execution-log.journal.jsonl"
+    leftover = journal.read_bytes()
+    run(tree)
+    # A compaction that died after writing the documents leaves its claim behind.
+    (journal.parent / f"{journal.name}.999.claimed").write_bytes(leftover)
+    result = run(tree)
+    assert "Merged 0 journaled execution sessions." in result.stdout
+    data = yaml.safe_load((tree / "docs" / "tasks.yaml").read_text(encoding="utf-8"))
+    assert [entry["summary"] for entry in data["execution_log"]].count("Queued once") == 1